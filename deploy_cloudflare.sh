@@ -34,6 +34,14 @@ fi
 
 echo -e "${GREEN}✅ Build successful!${NC}"
 
+# 3b. Publish the content-addressed governance catalog (dist/governance)
+echo -e "${YELLOW}📚 Publishing governance catalog...${NC}"
+python3 governance/scripts/bundle.py publish dist/governance
+if [ $? -ne 0 ]; then
+    echo -e "${RED}❌ Governance bundle is stale.${NC} Run 'python3 governance/scripts/generate_ssot.py' first."
+    exit 1
+fi
+
 # 4. Check for Wrangler authentication
 echo -e "${YELLOW}☁️  Checking Cloudflare authentication...${NC}"
 if ! npx wrangler whoami &> /dev/null; then
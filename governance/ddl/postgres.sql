@@ -0,0 +1,171 @@
+-- @generated by governance/scripts/generate_ddl.py
+-- DO NOT EDIT MANUALLY. Run 'python3 governance/scripts/generate_ddl.py' to update.
+
+CREATE TYPE actor_type AS ENUM ('HUMAN', 'AGENT', 'SYSTEM', 'TOOL');
+CREATE TYPE channel AS ENUM ('whatsapp', 'web', 'ios', 'android', 'api');
+CREATE TYPE role AS ENUM ('user', 'assistant', 'system', 'tool');
+CREATE TYPE message_type AS ENUM ('text', 'image', 'audio', 'tool_call', 'tool_result', 'event');
+CREATE TYPE model_provider AS ENUM ('openai', 'anthropic', 'google', 'local');
+CREATE TYPE tool_status AS ENUM ('proposed', 'allowed', 'executed', 'failed', 'rejected');
+CREATE TYPE policy_decision AS ENUM ('allow', 'deny', 'degrade');
+CREATE TYPE risk_level AS ENUM ('low', 'med', 'high');
+CREATE TYPE is_hallucination AS ENUM ('true', 'false', 'unknown');
+CREATE TYPE conversation_message_status AS ENUM ('ok', 'error', 'timeout', 'dropped');
+CREATE TYPE conversation_status AS ENUM ('open', 'closed', 'archived');
+CREATE TYPE outbox_event_status AS ENUM ('pending', 'processing', 'done', 'failed');
+
+CREATE TABLE audit_checkpoint (
+    checkpoint_seq INTEGER NOT NULL,  -- Checkpoint number (0-based)
+    first_seq INTEGER NOT NULL,  -- First audit seq covered
+    last_seq INTEGER NOT NULL,  -- Last audit seq covered
+    merkle_root TEXT NOT NULL,  -- Merkle root over the segment's entry hashes
+    chain_head TEXT NOT NULL,  -- hash_chain_curr at last_seq
+    checkpoint_hash TEXT NOT NULL,  -- Hash of previous checkpoint_hash, merkle_root, chain_head and last_seq
+    created_at TIMESTAMPTZ NOT NULL,  -- Created
+    PRIMARY KEY (checkpoint_seq)
+);
+CREATE INDEX audit_checkpoint_last_seq ON audit_checkpoint (last_seq);
+
+CREATE TABLE audit_log (
+    audit_id TEXT NOT NULL,  -- PK (ULID)
+    seq INTEGER NOT NULL,  -- Position in the hash chain (0-based)
+    tenant_id TEXT NOT NULL,  -- Tenant boundary
+    trace_id TEXT,  -- Trace correlation
+    actor_type actor_type NOT NULL,  -- Actor type
+    actor_id TEXT,  -- Actor id
+    decision_type TEXT NOT NULL,  -- Decision/action type
+    decision_outcome TEXT NOT NULL,  -- Outcome
+    inputs_hash TEXT,  -- Hash of inputs
+    outputs_hash TEXT,  -- Hash of outputs
+    hash_chain_prev TEXT,  -- Previous hash chain value
+    hash_chain_curr TEXT NOT NULL,  -- Current hash chain value
+    created_at TIMESTAMPTZ NOT NULL,  -- Created
+    PRIMARY KEY (audit_id, created_at)
+) PARTITION BY RANGE (created_at);
+CREATE TABLE audit_log_2026_01 PARTITION OF audit_log FOR VALUES FROM ('2026-01-01') TO ('2026-02-01');
+CREATE TABLE audit_log_2026_02 PARTITION OF audit_log FOR VALUES FROM ('2026-02-01') TO ('2026-03-01');
+CREATE TABLE audit_log_2026_03 PARTITION OF audit_log FOR VALUES FROM ('2026-03-01') TO ('2026-04-01');
+CREATE TABLE audit_log_2026_04 PARTITION OF audit_log FOR VALUES FROM ('2026-04-01') TO ('2026-05-01');
+CREATE TABLE audit_log_2026_05 PARTITION OF audit_log FOR VALUES FROM ('2026-05-01') TO ('2026-06-01');
+CREATE TABLE audit_log_2026_06 PARTITION OF audit_log FOR VALUES FROM ('2026-06-01') TO ('2026-07-01');
+CREATE TABLE audit_log_2026_07 PARTITION OF audit_log FOR VALUES FROM ('2026-07-01') TO ('2026-08-01');
+CREATE TABLE audit_log_2026_08 PARTITION OF audit_log FOR VALUES FROM ('2026-08-01') TO ('2026-09-01');
+CREATE TABLE audit_log_2026_09 PARTITION OF audit_log FOR VALUES FROM ('2026-09-01') TO ('2026-10-01');
+CREATE TABLE audit_log_2026_10 PARTITION OF audit_log FOR VALUES FROM ('2026-10-01') TO ('2026-11-01');
+CREATE TABLE audit_log_2026_11 PARTITION OF audit_log FOR VALUES FROM ('2026-11-01') TO ('2026-12-01');
+CREATE TABLE audit_log_2026_12 PARTITION OF audit_log FOR VALUES FROM ('2026-12-01') TO ('2027-01-01');
+CREATE TABLE audit_log_default PARTITION OF audit_log DEFAULT;
+CREATE INDEX audit_log_seq ON audit_log (seq);
+CREATE INDEX audit_log_tenant_time ON audit_log (tenant_id, created_at);
+CREATE INDEX audit_log_tenant_decision_time ON audit_log (tenant_id, decision_type, created_at);
+CREATE INDEX audit_log_trace_id ON audit_log (trace_id);
+
+CREATE TABLE conversation_message (
+    message_id TEXT NOT NULL,  -- PK (ULID/UUID)
+    conversation_id TEXT NOT NULL,  -- Conversation thread FK
+    tenant_id TEXT NOT NULL,  -- Tenant boundary FK
+    user_id TEXT,  -- End-user identifier
+    actor_type actor_type NOT NULL,  -- Who produced the message
+    actor_id TEXT,  -- Agent/tool/system identifier
+    channel channel NOT NULL,  -- Channel source
+    role role NOT NULL,  -- Chat role
+    message_type message_type NOT NULL,  -- Message kind
+    content_text TEXT,  -- Text content (post-redaction)
+    content_structured JSONB,  -- Structured payload (tool args/result, metadata)
+    language TEXT,  -- Detected language (iso)
+    locale TEXT,  -- Locale (BCP-47)
+    token_count INTEGER,  -- Total tokens
+    input_tokens INTEGER,  -- Input tokens
+    output_tokens INTEGER,  -- Output tokens
+    cost_usd NUMERIC(12, 6),  -- Estimated cost
+    model_provider model_provider,  -- Model provider
+    model_name TEXT,  -- Model identifier
+    tool_name TEXT,  -- Tool invoked (allowlisted)
+    tool_call_id TEXT,  -- Tool call correlation id
+    tool_status tool_status,  -- Tool lifecycle status
+    policy_decision policy_decision,  -- Policy gate decision
+    policy_reason TEXT,  -- Reason code
+    risk_level risk_level,  -- Risk classification
+    is_pii BOOLEAN,  -- PII detected
+    redaction_applied BOOLEAN,  -- Redaction performed
+    is_hallucination is_hallucination,  -- Hallucination label (eval)
+    confidence_score DOUBLE PRECISION,  -- Confidence score (0-1)
+    citation_count INTEGER,  -- Citations count
+    citation_ids TEXT,  -- Cited doc ids (pipe-separated)
+    retrieval_used BOOLEAN,  -- RAG used
+    retrieval_query TEXT,  -- Normalized query
+    retrieval_doc_ids TEXT,  -- Retrieved doc ids (pipe-separated)
+    fsm_state_before TEXT,  -- FSM state before
+    fsm_state_after TEXT,  -- FSM state after
+    trace_id TEXT,  -- Distributed trace id
+    parent_message_id TEXT,  -- Parent message id
+    idempotency_key TEXT,  -- Idempotency key
+    created_at TIMESTAMPTZ NOT NULL,  -- Persist time
+    received_at TIMESTAMPTZ,  -- Ingress time
+    processed_at TIMESTAMPTZ,  -- Processing completion time
+    latency_ms INTEGER,  -- End-to-end latency ms
+    status conversation_message_status NOT NULL,  -- Final status
+    error_code TEXT,  -- Normalized error code
+    error_message TEXT,  -- Sanitized error message
+    PRIMARY KEY (message_id, created_at)
+) PARTITION BY RANGE (created_at);
+CREATE TABLE conversation_message_2026_01 PARTITION OF conversation_message FOR VALUES FROM ('2026-01-01') TO ('2026-02-01');
+CREATE TABLE conversation_message_2026_02 PARTITION OF conversation_message FOR VALUES FROM ('2026-02-01') TO ('2026-03-01');
+CREATE TABLE conversation_message_2026_03 PARTITION OF conversation_message FOR VALUES FROM ('2026-03-01') TO ('2026-04-01');
+CREATE TABLE conversation_message_2026_04 PARTITION OF conversation_message FOR VALUES FROM ('2026-04-01') TO ('2026-05-01');
+CREATE TABLE conversation_message_2026_05 PARTITION OF conversation_message FOR VALUES FROM ('2026-05-01') TO ('2026-06-01');
+CREATE TABLE conversation_message_2026_06 PARTITION OF conversation_message FOR VALUES FROM ('2026-06-01') TO ('2026-07-01');
+CREATE TABLE conversation_message_2026_07 PARTITION OF conversation_message FOR VALUES FROM ('2026-07-01') TO ('2026-08-01');
+CREATE TABLE conversation_message_2026_08 PARTITION OF conversation_message FOR VALUES FROM ('2026-08-01') TO ('2026-09-01');
+CREATE TABLE conversation_message_2026_09 PARTITION OF conversation_message FOR VALUES FROM ('2026-09-01') TO ('2026-10-01');
+CREATE TABLE conversation_message_2026_10 PARTITION OF conversation_message FOR VALUES FROM ('2026-10-01') TO ('2026-11-01');
+CREATE TABLE conversation_message_2026_11 PARTITION OF conversation_message FOR VALUES FROM ('2026-11-01') TO ('2026-12-01');
+CREATE TABLE conversation_message_2026_12 PARTITION OF conversation_message FOR VALUES FROM ('2026-12-01') TO ('2027-01-01');
+CREATE TABLE conversation_message_default PARTITION OF conversation_message DEFAULT;
+CREATE INDEX conversation_message_tenant_conversation_time ON conversation_message (tenant_id, conversation_id, created_at);
+CREATE INDEX conversation_message_tenant_user_time ON conversation_message (tenant_id, user_id, created_at);
+CREATE INDEX conversation_message_tenant_idempotency ON conversation_message (tenant_id, idempotency_key);
+CREATE INDEX conversation_message_tool_call_id ON conversation_message (tool_call_id);
+CREATE INDEX conversation_message_trace_id ON conversation_message (trace_id);
+
+CREATE TABLE conversation (
+    conversation_id TEXT NOT NULL,  -- PK
+    tenant_id TEXT NOT NULL,  -- Tenant boundary
+    user_id TEXT,  -- End-user
+    channel channel NOT NULL,  -- Primary channel
+    status conversation_status NOT NULL,  -- Conversation status
+    current_fsm_state TEXT,  -- Current FSM state
+    created_at TIMESTAMPTZ NOT NULL,  -- Created
+    updated_at TIMESTAMPTZ NOT NULL,  -- Updated
+    last_message_at TIMESTAMPTZ,  -- Last activity
+    PRIMARY KEY (conversation_id)
+);
+CREATE INDEX conversation_tenant_activity ON conversation (tenant_id, last_message_at);
+CREATE INDEX conversation_tenant_status_activity ON conversation (tenant_id, status, last_message_at);
+CREATE INDEX conversation_tenant_user ON conversation (tenant_id, user_id);
+
+CREATE TABLE outbox_event (
+    outbox_id TEXT NOT NULL,  -- PK (ULID)
+    tenant_id TEXT NOT NULL,  -- Tenant boundary
+    trace_id TEXT,  -- Trace correlation
+    action_type TEXT NOT NULL,  -- Side-effect action type
+    payload JSONB NOT NULL,  -- Action payload
+    idempotency_key TEXT NOT NULL,  -- Idempotency key
+    status outbox_event_status NOT NULL,  -- Outbox status
+    attempt INTEGER NOT NULL,  -- Attempt count
+    next_run_at TIMESTAMPTZ,  -- Next scheduled run
+    created_at TIMESTAMPTZ NOT NULL,  -- Created
+    updated_at TIMESTAMPTZ NOT NULL,  -- Updated
+    PRIMARY KEY (outbox_id, tenant_id)
+) PARTITION BY HASH (tenant_id);
+CREATE TABLE outbox_event_p0 PARTITION OF outbox_event FOR VALUES WITH (MODULUS 8, REMAINDER 0);
+CREATE TABLE outbox_event_p1 PARTITION OF outbox_event FOR VALUES WITH (MODULUS 8, REMAINDER 1);
+CREATE TABLE outbox_event_p2 PARTITION OF outbox_event FOR VALUES WITH (MODULUS 8, REMAINDER 2);
+CREATE TABLE outbox_event_p3 PARTITION OF outbox_event FOR VALUES WITH (MODULUS 8, REMAINDER 3);
+CREATE TABLE outbox_event_p4 PARTITION OF outbox_event FOR VALUES WITH (MODULUS 8, REMAINDER 4);
+CREATE TABLE outbox_event_p5 PARTITION OF outbox_event FOR VALUES WITH (MODULUS 8, REMAINDER 5);
+CREATE TABLE outbox_event_p6 PARTITION OF outbox_event FOR VALUES WITH (MODULUS 8, REMAINDER 6);
+CREATE TABLE outbox_event_p7 PARTITION OF outbox_event FOR VALUES WITH (MODULUS 8, REMAINDER 7);
+CREATE UNIQUE INDEX outbox_event_tenant_idempotency ON outbox_event (tenant_id, idempotency_key);
+CREATE INDEX outbox_event_trace_id ON outbox_event (trace_id);
+CREATE INDEX outbox_event_due ON outbox_event (status, next_run_at);
@@ -0,0 +1,127 @@
+-- @generated by governance/scripts/generate_ddl.py
+-- DO NOT EDIT MANUALLY. Run 'python3 governance/scripts/generate_ddl.py' to update.
+
+CREATE TABLE audit_checkpoint (
+    checkpoint_seq INTEGER NOT NULL,  -- Checkpoint number (0-based)
+    first_seq INTEGER NOT NULL,  -- First audit seq covered
+    last_seq INTEGER NOT NULL,  -- Last audit seq covered
+    merkle_root TEXT NOT NULL,  -- Merkle root over the segment's entry hashes
+    chain_head TEXT NOT NULL,  -- hash_chain_curr at last_seq
+    checkpoint_hash TEXT NOT NULL,  -- Hash of previous checkpoint_hash, merkle_root, chain_head and last_seq
+    created_at TEXT NOT NULL,  -- Created
+    PRIMARY KEY (checkpoint_seq)
+);
+CREATE INDEX audit_checkpoint_last_seq ON audit_checkpoint (last_seq);
+
+CREATE TABLE audit_log (
+    audit_id TEXT NOT NULL,  -- PK (ULID)
+    seq INTEGER NOT NULL,  -- Position in the hash chain (0-based)
+    tenant_id TEXT NOT NULL,  -- Tenant boundary
+    trace_id TEXT,  -- Trace correlation
+    actor_type TEXT CHECK (actor_type IN ('HUMAN', 'AGENT', 'SYSTEM', 'TOOL')) NOT NULL,  -- Actor type
+    actor_id TEXT,  -- Actor id
+    decision_type TEXT NOT NULL,  -- Decision/action type
+    decision_outcome TEXT NOT NULL,  -- Outcome
+    inputs_hash TEXT,  -- Hash of inputs
+    outputs_hash TEXT,  -- Hash of outputs
+    hash_chain_prev TEXT,  -- Previous hash chain value
+    hash_chain_curr TEXT NOT NULL,  -- Current hash chain value
+    created_at TEXT NOT NULL,  -- Created
+    PRIMARY KEY (audit_id, created_at)
+);
+-- PostgreSQL partitions by RANGE (created_at); SQLite has no partitioning.
+CREATE INDEX audit_log_seq ON audit_log (seq);
+CREATE INDEX audit_log_tenant_time ON audit_log (tenant_id, created_at);
+CREATE INDEX audit_log_tenant_decision_time ON audit_log (tenant_id, decision_type, created_at);
+CREATE INDEX audit_log_trace_id ON audit_log (trace_id);
+
+CREATE TABLE conversation_message (
+    message_id TEXT NOT NULL,  -- PK (ULID/UUID)
+    conversation_id TEXT NOT NULL,  -- Conversation thread FK
+    tenant_id TEXT NOT NULL,  -- Tenant boundary FK
+    user_id TEXT,  -- End-user identifier
+    actor_type TEXT CHECK (actor_type IN ('HUMAN', 'AGENT', 'SYSTEM', 'TOOL')) NOT NULL,  -- Who produced the message
+    actor_id TEXT,  -- Agent/tool/system identifier
+    channel TEXT CHECK (channel IN ('whatsapp', 'web', 'ios', 'android', 'api')) NOT NULL,  -- Channel source
+    role TEXT CHECK (role IN ('user', 'assistant', 'system', 'tool')) NOT NULL,  -- Chat role
+    message_type TEXT CHECK (message_type IN ('text', 'image', 'audio', 'tool_call', 'tool_result', 'event')) NOT NULL,  -- Message kind
+    content_text TEXT,  -- Text content (post-redaction)
+    content_structured TEXT,  -- Structured payload (tool args/result, metadata)
+    language TEXT,  -- Detected language (iso)
+    locale TEXT,  -- Locale (BCP-47)
+    token_count INTEGER,  -- Total tokens
+    input_tokens INTEGER,  -- Input tokens
+    output_tokens INTEGER,  -- Output tokens
+    cost_usd NUMERIC,  -- Estimated cost
+    model_provider TEXT CHECK (model_provider IN ('openai', 'anthropic', 'google', 'local')),  -- Model provider
+    model_name TEXT,  -- Model identifier
+    tool_name TEXT,  -- Tool invoked (allowlisted)
+    tool_call_id TEXT,  -- Tool call correlation id
+    tool_status TEXT CHECK (tool_status IN ('proposed', 'allowed', 'executed', 'failed', 'rejected')),  -- Tool lifecycle status
+    policy_decision TEXT CHECK (policy_decision IN ('allow', 'deny', 'degrade')),  -- Policy gate decision
+    policy_reason TEXT,  -- Reason code
+    risk_level TEXT CHECK (risk_level IN ('low', 'med', 'high')),  -- Risk classification
+    is_pii INTEGER,  -- PII detected
+    redaction_applied INTEGER,  -- Redaction performed
+    is_hallucination TEXT CHECK (is_hallucination IN ('true', 'false', 'unknown')),  -- Hallucination label (eval)
+    confidence_score REAL,  -- Confidence score (0-1)
+    citation_count INTEGER,  -- Citations count
+    citation_ids TEXT,  -- Cited doc ids (pipe-separated)
+    retrieval_used INTEGER,  -- RAG used
+    retrieval_query TEXT,  -- Normalized query
+    retrieval_doc_ids TEXT,  -- Retrieved doc ids (pipe-separated)
+    fsm_state_before TEXT,  -- FSM state before
+    fsm_state_after TEXT,  -- FSM state after
+    trace_id TEXT,  -- Distributed trace id
+    parent_message_id TEXT,  -- Parent message id
+    idempotency_key TEXT,  -- Idempotency key
+    created_at TEXT NOT NULL,  -- Persist time
+    received_at TEXT,  -- Ingress time
+    processed_at TEXT,  -- Processing completion time
+    latency_ms INTEGER,  -- End-to-end latency ms
+    status TEXT CHECK (status IN ('ok', 'error', 'timeout', 'dropped')) NOT NULL,  -- Final status
+    error_code TEXT,  -- Normalized error code
+    error_message TEXT,  -- Sanitized error message
+    PRIMARY KEY (message_id, created_at)
+);
+-- PostgreSQL partitions by RANGE (created_at); SQLite has no partitioning.
+CREATE INDEX conversation_message_tenant_conversation_time ON conversation_message (tenant_id, conversation_id, created_at);
+CREATE INDEX conversation_message_tenant_user_time ON conversation_message (tenant_id, user_id, created_at);
+CREATE INDEX conversation_message_tenant_idempotency ON conversation_message (tenant_id, idempotency_key);
+CREATE INDEX conversation_message_tool_call_id ON conversation_message (tool_call_id);
+CREATE INDEX conversation_message_trace_id ON conversation_message (trace_id);
+
+CREATE TABLE conversation (
+    conversation_id TEXT NOT NULL,  -- PK
+    tenant_id TEXT NOT NULL,  -- Tenant boundary
+    user_id TEXT,  -- End-user
+    channel TEXT CHECK (channel IN ('whatsapp', 'web', 'ios', 'android', 'api')) NOT NULL,  -- Primary channel
+    status TEXT CHECK (status IN ('open', 'closed', 'archived')) NOT NULL,  -- Conversation status
+    current_fsm_state TEXT,  -- Current FSM state
+    created_at TEXT NOT NULL,  -- Created
+    updated_at TEXT NOT NULL,  -- Updated
+    last_message_at TEXT,  -- Last activity
+    PRIMARY KEY (conversation_id)
+);
+CREATE INDEX conversation_tenant_activity ON conversation (tenant_id, last_message_at);
+CREATE INDEX conversation_tenant_status_activity ON conversation (tenant_id, status, last_message_at);
+CREATE INDEX conversation_tenant_user ON conversation (tenant_id, user_id);
+
+CREATE TABLE outbox_event (
+    outbox_id TEXT NOT NULL,  -- PK (ULID)
+    tenant_id TEXT NOT NULL,  -- Tenant boundary
+    trace_id TEXT,  -- Trace correlation
+    action_type TEXT NOT NULL,  -- Side-effect action type
+    payload TEXT NOT NULL,  -- Action payload
+    idempotency_key TEXT NOT NULL,  -- Idempotency key
+    status TEXT CHECK (status IN ('pending', 'processing', 'done', 'failed')) NOT NULL,  -- Outbox status
+    attempt INTEGER NOT NULL,  -- Attempt count
+    next_run_at TEXT,  -- Next scheduled run
+    created_at TEXT NOT NULL,  -- Created
+    updated_at TEXT NOT NULL,  -- Updated
+    PRIMARY KEY (outbox_id, tenant_id)
+);
+-- PostgreSQL partitions by HASH (tenant_id); SQLite has no partitioning.
+CREATE UNIQUE INDEX outbox_event_tenant_idempotency ON outbox_event (tenant_id, idempotency_key);
+CREATE INDEX outbox_event_trace_id ON outbox_event (trace_id);
+CREATE INDEX outbox_event_due ON outbox_event (status, next_run_at);
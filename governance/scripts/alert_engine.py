@@ -0,0 +1,251 @@
+"""Batched evaluation of AlertTemplateCatalog rules over metric series.
+
+Each template is parsed once into a Rule: the signal, severity token, window
+token and condition token(s) come from the name and required_tokens, the areas
+it applies to from allowed_roots, and the comparison from THRESHOLDS (the
+catalog carries no numbers). A series is (signal, area, labels); a rule applies
+to every series of its signal whose area is in its allowed roots.
+
+Samples arrive once per scrape (observe), and tick(now) closes the scrape. A
+rule fires while the mean of the series over the last window/scrape samples
+crosses its threshold; scrapes with no sample are left out of the mean. Ticks
+return the ALERT_FIRED/ALERT_RESOLVED transitions and emit them as
+OTEL-LOG-OBS-ALERT_FIRED / OTEL-LOG-OBS-ALERT_RESOLVED.
+
+With NumPy, VectorAlertEngine keeps a (series x scrapes) ring plus running
+window sums. Each tick does one array pass per distinct window and one gather
+over every (series, rule) pair, with no Python loop over series or rules.
+Without NumPy, AlertEngine falls back to LoopAlertEngine, which computes the
+same results one pair at a time.
+
+Templates carrying SLO tokens (BURN_FAST, BURN_SLOW, EB_EXHAUSTED) need error
+budgets and multi-window burn rates rather than a threshold; slo_burn.py
+evaluates those, and compile_rules() returns them as delegated.
+
+    rules, delegated = compile_rules(load_catalog())
+    engine = AlertEngine(rules, scrape_seconds=60)
+    engine.observe("LATENCY_P99", "CORE", 840.0, labels=("tenant-1",))
+    for change in engine.tick(now): ...   # AlertState(firing=True/False) transitions only
+"""
+import math
+from collections import namedtuple
+
+from slo_burn import log_event, window_seconds
+
+try:
+    import numpy as np
+except ImportError:  # optional: LoopAlertEngine is used instead
+    np = None
+
+# alert_name -> (comparison, threshold in the signal's SignalCatalog unit).
+THRESHOLDS = {
+    "SRE-ALERT-LATENCY_P99-HIGH-W5M": (">", 1000.0),
+    "SRE-ALERT-ERROR_RATE-CRITICAL-W5M": (">", 0.05),
+    "SRE-ALERT-QUEUE_DEPTH-DEPTH_HIGH-W15M": (">", 1000.0),
+    "SRE-ALERT-DLQ_COUNT-DLQ_CRITICAL-W15M": (">", 100.0),
+    "SRE-ALERT-RETRY_RATE-RETRY_STORM-CRITICAL-W5M": (">", 0.2),
+    "SRE-ALERT-WEBHOOK_SIGNATURE_FAIL-SIGNATURE_FAIL_SPIKE-HIGH-W5M": (">", 0.01),
+    "SRE-ALERT-AUTHZ_DENY_RATE-AUTHZ_DENY_SPIKE-HIGH-W5M": (">", 0.1),
+    "SRE-ALERT-TOKENS_PER_CONV-TOKEN_SPIKE-HIGH-W15M": (">", 20000.0),
+    "SRE-ALERT-COST_PER_TENANT-COST_SPIKE-HIGH-W15M": (">", 50.0),
+    "SRE-ALERT-CITATION_COVERAGE-CITATION_DROP-HIGH-W15M": ("<", 0.8),
+    "SRE-ALERT-RETRIEVAL_EMPTY-RETRIEVAL_EMPTY_SPIKE-HIGH-W15M": (">", 0.2),
+}
+
+Rule = namedtuple("Rule", ["alert", "signal", "severity", "condition", "window", "roots", "op", "threshold"])
+AlertState = namedtuple("AlertState", ["alert", "signal", "area", "labels", "firing", "value", "at"])
+
+
+def compile_rules(catalog, thresholds=None):
+    """Parse every AlertTemplateCatalog row; returns (rules, delegated alert names)."""
+    thresholds = {**THRESHOLDS, **(thresholds or {})}
+    categories = {row['token']: row['token_category'] for row in catalog.records("ThresholdTokenCatalog.csv")}
+    rules, delegated = [], []
+    for row in catalog.records("AlertTemplateCatalog.csv"):
+        name = row['alert_name']
+        tokens = row['required_tokens'].split("|")
+        unknown = [token for token in tokens if token not in categories]
+        if unknown:
+            raise ValueError(f"{name}: unknown threshold tokens {unknown}")
+        if any(categories[token] == "SLO" for token in tokens):
+            delegated.append(name)
+            continue
+        windows = [token for token in tokens if categories[token] == "WINDOW"]
+        severities = [token for token in tokens if categories[token] == "SEVERITY"]
+        if len(windows) != 1 or len(severities) > 1:
+            raise ValueError(f"{name}: needs one WINDOW and at most one SEVERITY token, got {tokens}")
+        if name not in thresholds:
+            raise ValueError(f"{name}: no threshold configured")
+        op, threshold = thresholds[name]
+        if op not in ("<", ">"):
+            raise ValueError(f"{name}: comparison must be '<' or '>', got {op!r}")
+        condition = tuple(token for token in tokens if token not in windows and token not in severities)
+        # DEPTH_HIGH / DLQ_CRITICAL carry their severity in the condition token.
+        severity = severities[0] if severities else next(
+            (part for token in condition for part in token.split("_")[-1:] if categories.get(part) == "SEVERITY"), None)
+        rules.append(Rule(name, row['signal'], severity, condition, windows[0],
+                          frozenset(row['allowed_roots'].split("|")), op, float(threshold)))
+    return rules, delegated
+
+
+class _Engine:
+    def __init__(self, rules, scrape_seconds=60, emit=None):
+        self.rules = list(rules)
+        self.scrape_seconds = scrape_seconds
+        self.emit = emit or (lambda name, value, **attributes: None)
+        self.series = {}  # (signal, area, labels) -> series index
+        self.keys = []
+        self.slots = {}  # window token -> samples per window
+        for rule in self.rules:
+            slots = window_seconds(rule.window) // scrape_seconds
+            if slots < 1:
+                raise ValueError(f"{rule.alert}: window {rule.window} is shorter than one scrape")
+            self.slots[rule.window] = slots
+        self.windows = sorted(self.slots, key=self.slots.get)
+        self.depth = max(self.slots.values(), default=1)
+        self.by_signal = {}
+        for r, rule in enumerate(self.rules):
+            self.by_signal.setdefault(rule.signal, []).append(r)
+
+    def series_index(self, signal, area, labels):
+        key = (signal, area, tuple(labels))
+        i = self.series.get(key)
+        if i is None:
+            i = self.series[key] = len(self.keys)
+            self.keys.append(key)
+            self._add_series(i, [r for r in self.by_signal.get(signal, ()) if area in self.rules[r].roots])
+        return i
+
+    def observe(self, signal, area, value, labels=()):
+        """Record the sample of one series for the current scrape (last write wins)."""
+        self._set(self.series_index(signal, area, labels), value)
+
+    def _report(self, transitions, now):
+        changes = []
+        for r, i, firing, value in transitions:
+            signal, area, labels = self.keys[i]
+            change = AlertState(self.rules[r].alert, signal, area, labels, firing, value, now)
+            changes.append(change)
+            self.emit(log_event("ALERT_FIRED" if firing else "ALERT_RESOLVED"), 1, alert=change.alert,
+                      signal=signal, area=area, labels=labels, mean=value)
+        return changes
+
+
+class LoopAlertEngine(_Engine):
+    """Reference evaluator: per-series sample lists, rules checked one (series, rule) pair at a time."""
+
+    def __init__(self, rules, scrape_seconds=60, emit=None):
+        super().__init__(rules, scrape_seconds, emit)
+        self.history = []  # per series: list of the last `depth` samples (None = missing), oldest first
+        self.pending = []
+        self.pairs = []  # [rule, series, firing]
+
+    def _add_series(self, i, rules):
+        self.history.append([None] * self.depth)
+        self.pending.append(None)
+        self.pairs.extend([r, i, False] for r in rules)
+
+    def _set(self, i, value):
+        self.pending[i] = float(value)
+
+    def tick(self, now):
+        """Close the current scrape and evaluate every rule; returns the transitions."""
+        for i, history in enumerate(self.history):
+            history.pop(0)
+            history.append(self.pending[i])
+            self.pending[i] = None
+        transitions = []
+        for pair in self.pairs:
+            r, i, was = pair
+            rule = self.rules[r]
+            samples = [v for v in self.history[i][-self.slots[rule.window]:] if v is not None]
+            value = sum(samples) / len(samples) if samples else math.nan
+            firing = bool(samples) and (value > rule.threshold if rule.op == ">" else value < rule.threshold)
+            if firing != was:
+                pair[2] = firing
+                transitions.append((r, i, firing, value))
+        return self._report(transitions, now)
+
+    def firing(self):
+        return [(self.rules[r].alert, self.keys[i]) for r, i, on in self.pairs if on]
+
+
+class VectorAlertEngine(_Engine):
+    """NumPy evaluator: ring of samples plus running sums/counts per window, one gather per tick."""
+
+    def __init__(self, rules, scrape_seconds=60, emit=None, capacity=1024):
+        if np is None:
+            raise ImportError("VectorAlertEngine requires numpy")
+        super().__init__(rules, scrape_seconds, emit)
+        self.capacity = capacity
+        self.ring = np.full((capacity, self.depth), np.nan)
+        self.pending = np.full(capacity, np.nan)
+        self.sums = np.zeros((len(self.windows), capacity))
+        self.counts = np.zeros((len(self.windows), capacity))
+        self.position = 0  # ring column the next scrape is written to
+        self.window_index = {window: w for w, window in enumerate(self.windows)}
+        self.new_pairs = []
+        self.pair_rule = np.zeros(0, dtype=np.int64)
+        self.pair_series = np.zeros(0, dtype=np.int64)
+        self.pair_window = np.zeros(0, dtype=np.int64)
+        self.pair_threshold = np.zeros(0)
+        self.pair_above = np.zeros(0, dtype=bool)
+        self.state = np.zeros(0, dtype=bool)
+
+    def _add_series(self, i, rules):
+        if i == self.capacity:
+            grow = self.capacity
+            self.ring = np.vstack([self.ring, np.full((grow, self.depth), np.nan)])
+            self.pending = np.concatenate([self.pending, np.full(grow, np.nan)])
+            self.sums = np.hstack([self.sums, np.zeros((len(self.windows), grow))])
+            self.counts = np.hstack([self.counts, np.zeros((len(self.windows), grow))])
+            self.capacity += grow
+        self.new_pairs.extend((r, i) for r in rules)
+
+    def _set(self, i, value):
+        self.pending[i] = value
+
+    def _flush_pairs(self):
+        rules = [r for r, _ in self.new_pairs]
+        self.pair_rule = np.concatenate([self.pair_rule, np.array(rules, dtype=np.int64)])
+        self.pair_series = np.concatenate([self.pair_series, np.array([i for _, i in self.new_pairs], dtype=np.int64)])
+        self.pair_window = np.concatenate([self.pair_window, np.array(
+            [self.window_index[self.rules[r].window] for r in rules], dtype=np.int64)])
+        self.pair_threshold = np.concatenate([self.pair_threshold, np.array(
+            [self.rules[r].threshold for r in rules], dtype=float)])
+        self.pair_above = np.concatenate([self.pair_above, np.array([self.rules[r].op == ">" for r in rules], dtype=bool)])
+        self.state = np.concatenate([self.state, np.zeros(len(rules), dtype=bool)])
+        self.new_pairs = []
+
+    def tick(self, now):
+        """Close the current scrape and evaluate every rule; returns the transitions."""
+        if self.new_pairs:
+            self._flush_pairs()
+        n = len(self.keys)
+        sample = self.pending[:n]
+        valid = ~np.isnan(sample)
+        for w, window in enumerate(self.windows):
+            leaving = self.ring[:n, (self.position - self.slots[window]) % self.depth]
+            kept = ~np.isnan(leaving)
+            self.sums[w, :n] += np.where(valid, sample, 0.0) - np.where(kept, leaving, 0.0)
+            self.counts[w, :n] += valid.astype(float) - kept
+            self.sums[w, :n][self.counts[w, :n] == 0] = 0.0  # drop float residue once a window empties
+        self.ring[:n, self.position] = sample
+        self.position = (self.position + 1) % self.depth
+        self.pending[:n] = np.nan
+
+        counts = self.counts[self.pair_window, self.pair_series]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            values = self.sums[self.pair_window, self.pair_series] / counts
+        firing = (counts > 0) & np.where(self.pair_above, values > self.pair_threshold, values < self.pair_threshold)
+        changed = np.flatnonzero(firing != self.state)
+        self.state = firing
+        return self._report(zip(self.pair_rule[changed].tolist(), self.pair_series[changed].tolist(),
+                                firing[changed].tolist(), values[changed].tolist()), now)
+
+    def firing(self):
+        on = np.flatnonzero(self.state)
+        return [(self.rules[r].alert, self.keys[i]) for r, i in zip(self.pair_rule[on], self.pair_series[on])]
+
+
+AlertEngine = VectorAlertEngine if np is not None else LoopAlertEngine
@@ -0,0 +1,375 @@
+"""Tamper-evident audit log: group-committed hash chain with Merkle checkpoints.
+
+Every audit_log row gets a `seq` and is chained:
+
+    entry_hash      = sha256(canonical JSON of the row without the chain columns)
+    hash_chain_curr = sha256(hash_chain_prev || entry_hash)        (prev of seq 0 = 32 zero bytes)
+
+`AuditWriter` takes `append(...)` calls from any thread and group-commits them:
+a single committer thread drains up to `batch_size` entries (or whatever arrived
+within `max_delay`), chains them and writes them in one transaction, so the cost
+of a commit is shared by the whole batch.
+
+Every `checkpoint_every` entries the writer closes a segment and stores an
+audit_checkpoint row: the RFC 6962 Merkle root over the segment's entry hashes,
+the chain head at its last entry, and a checkpoint_hash that chains the
+checkpoints themselves. With those:
+
+  - `prove(seq)` returns an inclusion proof of log2(segment) sibling hashes, and
+    `verify_inclusion` checks it against the checkpoint root without the log;
+  - `verify_range(first, last)` re-hashes only the segments overlapping the range,
+    starting from the previous checkpoint's chain head, instead of all history,
+    and fails if any entry in the range is missing;
+  - `verify_checkpoints()` walks the (small) checkpoint chain.
+
+Telemetry uses catalog names: OTEL-LOG-CORE-AUDIT_WRITE_OK / AUDIT_WRITE_FAIL per
+batch, AUDIT_CHAIN_ADVANCED per checkpoint and AUDIT_CHAIN_FAIL on a failed
+verification. Tables come from the generated SQLite DDL (generate_ddl.py).
+"""
+import hashlib
+import json
+import queue
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import Future
+
+from catalog import load_catalog
+from generate_ddl import load_specs, sqlite_ddl
+from outbox_dispatcher import new_ulid, timestamp
+
+AREA = "CORE"
+GENESIS = bytes(32)
+CHECKPOINT_EVERY = 1024
+
+# Columns hashed into entry_hash, in this order.
+ENTRY_COLUMNS = ("audit_id", "seq", "tenant_id", "trace_id", "actor_type", "actor_id", "decision_type",
+                 "decision_outcome", "inputs_hash", "outputs_hash", "created_at")
+
+Checkpoint = namedtuple("Checkpoint", ["checkpoint_seq", "first_seq", "last_seq", "merkle_root", "chain_head",
+                                       "checkpoint_hash", "created_at"])
+Proof = namedtuple("Proof", ["seq", "checkpoint_seq", "index", "size", "path", "merkle_root"])
+
+
+class AuditChainError(Exception):
+    pass
+
+
+def log_event(descriptor):
+    return f"OTEL-LOG-{AREA}-{descriptor}"
+
+
+# --- Hashing ---
+def entry_hash(entry):
+    """sha256 over the canonical JSON of `entry` (a dict with ENTRY_COLUMNS)."""
+    payload = json.dumps([entry[column] for column in ENTRY_COLUMNS], separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).digest()
+
+
+def chain(prev, digest):
+    return hashlib.sha256(prev + digest).digest()
+
+
+def leaf_hash(digest):
+    return hashlib.sha256(b"\x00" + digest).digest()
+
+
+def node_hash(left, right):
+    return hashlib.sha256(b"\x01" + left + right).digest()
+
+
+def checkpoint_hash(prev, merkle_root, chain_head, last_seq):
+    return hashlib.sha256(prev + merkle_root + chain_head + last_seq.to_bytes(8, "big")).digest()
+
+
+def _split(n):
+    """Largest power of two smaller than n (RFC 6962 tree split)."""
+    k = 1
+    while k << 1 < n:
+        k <<= 1
+    return k
+
+
+def merkle_root(leaves):
+    """RFC 6962 Merkle tree hash over leaf hashes."""
+    if not leaves:
+        return hashlib.sha256(b"").digest()
+    level = list(leaves)
+    # Bottom-up over complete subtrees gives the same root as the recursive split.
+    while len(level) > 1:
+        paired = [node_hash(level[i], level[i + 1]) for i in range(0, len(level) - 1, 2)]
+        if len(level) % 2:
+            paired.append(level[-1])
+        level = paired
+    return level[0]
+
+
+def audit_path(leaves, index):
+    """Sibling hashes from leaf `index` up to the root (RFC 6962 PATH)."""
+    path = []
+    lo, hi = 0, len(leaves)
+    subtrees = []
+    while hi - lo > 1:
+        k = _split(hi - lo)
+        if index < lo + k:
+            subtrees.append((lo + k, hi))
+            hi = lo + k
+        else:
+            subtrees.append((lo, lo + k))
+            lo = lo + k
+    for start, end in reversed(subtrees):
+        path.append(merkle_root(leaves[start:end]))
+    return path
+
+
+def verify_inclusion(leaf, index, size, path, root):
+    """RFC 9162 inclusion verification: O(len(path)) hashes."""
+    if index >= size:
+        return False
+    fn, sn, r = index, size - 1, leaf
+    for sibling in path:
+        if sn == 0:
+            return False
+        if fn & 1 or fn == sn:
+            r = node_hash(sibling, r)
+            while not fn & 1 and fn != 0:
+                fn >>= 1
+                sn >>= 1
+        else:
+            r = node_hash(r, sibling)
+        fn >>= 1
+        sn >>= 1
+    return sn == 0 and r == root
+
+
+# --- Storage ---
+def create_schema(conn):
+    specs = [spec for spec in load_specs(load_catalog()) if spec.name in ("audit_log", "audit_checkpoint")]
+    conn.executescript("\n".join(sqlite_ddl(specs)).replace("CREATE TABLE", "CREATE TABLE IF NOT EXISTS")
+                       .replace("CREATE INDEX", "CREATE INDEX IF NOT EXISTS")
+                       .replace("CREATE UNIQUE INDEX", "CREATE UNIQUE INDEX IF NOT EXISTS"))
+
+
+_ROW_COLUMNS = ENTRY_COLUMNS + ("hash_chain_prev", "hash_chain_curr")
+
+
+def read_entries(conn, first_seq, last_seq):
+    rows = conn.execute(
+        f"SELECT {', '.join(_ROW_COLUMNS)} FROM audit_log WHERE seq BETWEEN ? AND ? ORDER BY seq",
+        (first_seq, last_seq),
+    )
+    return [dict(zip(_ROW_COLUMNS, row)) for row in rows]
+
+
+def read_checkpoints(conn, first=0, last=None):
+    rows = conn.execute(
+        "SELECT checkpoint_seq, first_seq, last_seq, merkle_root, chain_head, checkpoint_hash, created_at "
+        "FROM audit_checkpoint WHERE checkpoint_seq >= ? AND (? IS NULL OR checkpoint_seq <= ?) ORDER BY checkpoint_seq",
+        (first, last, last),
+    )
+    return [Checkpoint(*row) for row in rows]
+
+
+class AuditWriter:
+    def __init__(self, conn, batch_size=512, max_delay=0.005, checkpoint_every=CHECKPOINT_EVERY,
+                 emit=None, clock=time.time):
+        self.conn = conn
+        self.batch_size = batch_size
+        self.max_delay = max_delay
+        self.checkpoint_every = checkpoint_every
+        self.emit = emit or (lambda name, value, **attributes: None)
+        self.clock = clock
+        self._queue = queue.Queue()
+        self._resume()
+        self._thread = threading.Thread(target=self._run, name="audit-writer", daemon=True)
+        self._thread.start()
+
+    def _resume(self):
+        """Pick the chain up where the table ends (open segment leaves re-read from the log)."""
+        last = self.conn.execute(
+            "SELECT seq, hash_chain_curr FROM audit_log ORDER BY seq DESC LIMIT 1").fetchone()
+        checkpoint = self.conn.execute(
+            "SELECT checkpoint_seq, last_seq, checkpoint_hash FROM audit_checkpoint "
+            "ORDER BY checkpoint_seq DESC LIMIT 1").fetchone()
+        self.next_seq = last[0] + 1 if last else 0
+        self.head = bytes.fromhex(last[1]) if last else GENESIS
+        self.next_checkpoint = checkpoint[0] + 1 if checkpoint else 0
+        self.checkpoint_head = bytes.fromhex(checkpoint[2]) if checkpoint else GENESIS
+        segment_start = checkpoint[1] + 1 if checkpoint else 0
+        self.leaves = [leaf_hash(entry_hash(entry)) for entry in read_entries(self.conn, segment_start, self.next_seq)]
+
+    def append(self, tenant_id, actor_type, decision_type, decision_outcome, actor_id=None, trace_id=None,
+               inputs_hash=None, outputs_hash=None):
+        """Queue one entry; the returned Future resolves to its seq once committed."""
+        future = Future()
+        now = self.clock()
+        self._queue.put(({
+            "audit_id": new_ulid(now), "tenant_id": tenant_id, "trace_id": trace_id, "actor_type": actor_type,
+            "actor_id": actor_id, "decision_type": decision_type, "decision_outcome": decision_outcome,
+            "inputs_hash": inputs_hash, "outputs_hash": outputs_hash, "created_at": timestamp(now),
+        }, future))
+        return future
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            batch = [item]
+            deadline = time.monotonic() + self.max_delay
+            while len(batch) < self.batch_size:
+                try:
+                    item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+                if item is None:
+                    self._commit(batch)
+                    return
+                batch.append(item)
+            self._commit(batch)
+
+    def _commit(self, batch):
+        markers = [future for entry, future in batch if entry is None]
+        batch = [(entry, future) for entry, future in batch if entry is not None]
+        if batch:
+            self._write(batch)
+        for marker in markers:
+            marker.set_result(None)
+
+    def _write(self, batch):
+        seq, head, leaves = self.next_seq, self.head, list(self.leaves)
+        next_checkpoint, checkpoint_head = self.next_checkpoint, self.checkpoint_head
+        rows, checkpoints = [], []
+        for entry, _ in batch:
+            entry["seq"] = seq
+            digest = entry_hash(entry)
+            prev, head = head, chain(head, digest)
+            rows.append(tuple(entry[column] for column in ENTRY_COLUMNS) +
+                        (prev.hex() if seq else None, head.hex()))
+            leaves.append(leaf_hash(digest))
+            if len(leaves) == self.checkpoint_every:
+                root = merkle_root(leaves)
+                checkpoint_head = checkpoint_hash(checkpoint_head, root, head, seq)
+                checkpoints.append((next_checkpoint, seq - len(leaves) + 1, seq, root.hex(), head.hex(),
+                                    checkpoint_head.hex(), timestamp(self.clock())))
+                next_checkpoint += 1
+                leaves = []
+            seq += 1
+        try:
+            with self.conn:
+                self.conn.executemany(
+                    f"INSERT INTO audit_log ({', '.join(_ROW_COLUMNS)}) VALUES ({', '.join('?' * len(_ROW_COLUMNS))})",
+                    rows)
+                self.conn.executemany("INSERT INTO audit_checkpoint VALUES (?, ?, ?, ?, ?, ?, ?)", checkpoints)
+        except Exception as e:
+            self.emit(log_event("AUDIT_WRITE_FAIL"), len(batch), error=type(e).__name__)
+            for _, future in batch:
+                future.set_exception(e)
+            return
+        self.next_seq, self.head, self.leaves = seq, head, leaves
+        self.next_checkpoint, self.checkpoint_head = next_checkpoint, checkpoint_head
+        self.emit(log_event("AUDIT_WRITE_OK"), len(batch))
+        for checkpoint in checkpoints:
+            self.emit(log_event("AUDIT_CHAIN_ADVANCED"), checkpoint[2], checkpoint_seq=checkpoint[0])
+        for entry, future in batch:
+            future.set_result(entry["seq"])
+
+    def flush(self):
+        """Block until everything appended so far is committed."""
+        marker = Future()
+        self._queue.put((None, marker))
+        marker.result()
+
+    def close(self):
+        self._queue.put(None)
+        self._thread.join()
+
+
+# --- Verification ---
+class AuditVerifier:
+    def __init__(self, conn, emit=None):
+        self.conn = conn
+        self.emit = emit or (lambda name, value, **attributes: None)
+
+    def _fail(self, message, **attributes):
+        self.emit(log_event("AUDIT_CHAIN_FAIL"), 1, **attributes)
+        raise AuditChainError(message)
+
+    def checkpoint_for(self, seq):
+        row = self.conn.execute(
+            "SELECT checkpoint_seq, first_seq, last_seq, merkle_root, chain_head, checkpoint_hash, created_at "
+            "FROM audit_checkpoint WHERE last_seq >= ? ORDER BY last_seq LIMIT 1", (seq,)).fetchone()
+        return Checkpoint(*row) if row and row[1] <= seq else None
+
+    def prove(self, seq):
+        """Inclusion proof of entry `seq` against its checkpoint's Merkle root."""
+        checkpoint = self.checkpoint_for(seq)
+        if checkpoint is None:
+            raise AuditChainError(f"seq {seq} is not covered by a checkpoint yet")
+        leaves = [leaf_hash(entry_hash(entry))
+                  for entry in read_entries(self.conn, checkpoint.first_seq, checkpoint.last_seq)]
+        index = seq - checkpoint.first_seq
+        return Proof(seq, checkpoint.checkpoint_seq, index, len(leaves),
+                     [sibling.hex() for sibling in audit_path(leaves, index)], checkpoint.merkle_root)
+
+    @staticmethod
+    def verify_proof(entry, proof):
+        """Check one entry (as returned by read_entries) against a proof; no database access."""
+        return entry["seq"] == proof.seq and verify_inclusion(
+            leaf_hash(entry_hash(entry)), proof.index, proof.size,
+            [bytes.fromhex(sibling) for sibling in proof.path], bytes.fromhex(proof.merkle_root))
+
+    def verify_checkpoints(self):
+        """Walk the checkpoint chain; returns the number of checkpoints."""
+        prev = GENESIS
+        checkpoints = read_checkpoints(self.conn)
+        for checkpoint in checkpoints:
+            expected = checkpoint_hash(prev, bytes.fromhex(checkpoint.merkle_root),
+                                       bytes.fromhex(checkpoint.chain_head), checkpoint.last_seq)
+            if expected.hex() != checkpoint.checkpoint_hash:
+                self._fail(f"checkpoint {checkpoint.checkpoint_seq} hash mismatch", checkpoint_seq=checkpoint.checkpoint_seq)
+            prev = expected
+        return len(checkpoints)
+
+    def verify_range(self, first_seq, last_seq):
+        """Re-hash the segments overlapping [first_seq, last_seq]; returns the entries checked.
+
+        Every seq up to last_seq must be stored: a range that runs past the end of the
+        log fails like a deleted tail entry would.
+        """
+        start = self.checkpoint_for(first_seq)
+        if start is None:
+            # Open segment: start from the last checkpoint's head (or genesis).
+            row = self.conn.execute(
+                "SELECT last_seq, chain_head FROM audit_checkpoint ORDER BY checkpoint_seq DESC LIMIT 1").fetchone()
+            seq, head = (row[0] + 1, bytes.fromhex(row[1])) if row else (0, GENESIS)
+        else:
+            seq = start.first_seq
+            head = GENESIS if seq == 0 else bytes.fromhex(self.checkpoint_for(seq - 1).chain_head)
+        checked = 0
+        while seq <= last_seq:
+            checkpoint = self.checkpoint_for(seq)
+            end = checkpoint.last_seq if checkpoint else last_seq
+            entries = read_entries(self.conn, seq, end)
+            if checkpoint and len(entries) != checkpoint.last_seq - checkpoint.first_seq + 1:
+                self._fail(f"segment {checkpoint.checkpoint_seq} is missing entries", checkpoint_seq=checkpoint.checkpoint_seq)
+            leaves = []
+            for entry in entries:
+                if entry["seq"] != seq:
+                    self._fail(f"gap in the chain at seq {seq}", seq=seq)
+                digest = entry_hash(entry)
+                expected_prev = None if seq == 0 else head.hex()
+                head = chain(head, digest)
+                if entry["hash_chain_prev"] != expected_prev or entry["hash_chain_curr"] != head.hex():
+                    self._fail(f"hash chain broken at seq {seq}", seq=seq)
+                leaves.append(leaf_hash(digest))
+                seq += 1
+                checked += 1
+            if checkpoint:
+                if merkle_root(leaves).hex() != checkpoint.merkle_root or head.hex() != checkpoint.chain_head:
+                    self._fail(f"segment {checkpoint.checkpoint_seq} does not match its checkpoint",
+                               checkpoint_seq=checkpoint.checkpoint_seq)
+            elif seq <= last_seq:
+                # Open segment: no checkpoint to count against, but the range asked for more
+                self._fail(f"entries {seq}..{last_seq} are missing", seq=seq)
+        return checked
@@ -0,0 +1,100 @@
+"""Audit chain throughput and verification cost (see audit_chain.py).
+
+Writes: --producers threads each append entries and wait for their commit (as a
+request handler would), once with one transaction per entry (batch_size=1) and
+once with group commit, on a WAL database with synchronous=FULL.
+
+Verification on --entries rows: a full replay of the chain, re-hashing one
+checkpoint segment, and building plus checking one inclusion proof.
+
+Usage (from the repo root):
+    python3 governance/scripts/bench_audit.py [--entries 100000] [--producers 32] [--writes 4000]
+"""
+import argparse
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from audit_chain import CHECKPOINT_EVERY, AuditVerifier, AuditWriter, create_schema, read_entries
+
+
+def open_db(path):
+    conn = sqlite3.connect(path, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute("PRAGMA synchronous = FULL")
+    create_schema(conn)
+    return conn
+
+
+def write_rate(path, producers, writes, batch_size):
+    conn = open_db(path)
+    writer = AuditWriter(conn, batch_size=batch_size, max_delay=0.002)
+    per_producer = writes // producers
+
+    def produce(p):
+        for i in range(per_producer):
+            writer.append(f"tenant-{p:03d}", "AGENT", "TOOL_CALL", "ALLOW", trace_id=f"trace-{p}-{i}").result()
+
+    threads = [threading.Thread(target=produce, args=(p,)) for p in range(producers)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    writer.close()
+    conn.close()
+    return per_producer * producers / elapsed
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, (time.perf_counter() - start) * 1000
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the audit hash chain.")
+    parser.add_argument("--entries", type=int, default=100_000, help="log size for the verification timings")
+    parser.add_argument("--producers", type=int, default=32, help="concurrent appenders for the write timings")
+    parser.add_argument("--writes", type=int, default=4000, help="entries written per write timing")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        single = write_rate(Path(tmp) / "single.sqlite", args.producers, args.writes, batch_size=1)
+        grouped = write_rate(Path(tmp) / "grouped.sqlite", args.producers, args.writes, batch_size=512)
+        print(f"writes ({args.producers} producers, synchronous=FULL):")
+        print(f"  one commit per entry  {single:10,.0f} entries/s")
+        print(f"  group commit          {grouped:10,.0f} entries/s  ({grouped / single:.1f}x)")
+
+        conn = open_db(Path(tmp) / "verify.sqlite")
+        writer = AuditWriter(conn, batch_size=4096)
+        for i in range(args.entries):
+            writer.append(f"tenant-{i % 50:03d}", "SYSTEM", "POLICY_EVAL", "ALLOW")
+        writer.flush()
+        writer.close()
+
+        verifier = AuditVerifier(conn)
+        checked, full = timed(verifier.verify_range, 0, args.entries - 1)
+        seq = args.entries // 2
+        segment, one = timed(verifier.verify_range, seq, seq)
+        checkpoints, chain = timed(verifier.verify_checkpoints)
+        proof, build = timed(verifier.prove, seq)
+        entry = read_entries(conn, seq, seq)[0]
+        ok, check = timed(AuditVerifier.verify_proof, entry, proof)
+        conn.close()
+
+    print(f"verification ({args.entries:,} entries, {CHECKPOINT_EVERY}-entry segments):")
+    print(f"  full replay           {full:10.1f} ms  ({checked:,} entries)")
+    print(f"  one segment           {one:10.1f} ms  ({segment:,} entries)")
+    print(f"  checkpoint chain      {chain:10.1f} ms  ({checkpoints} checkpoints)")
+    print(f"  inclusion proof       {build:10.1f} ms to build, {check * 1000:.0f} us to verify, "
+          f"{len(proof.path)} hashes ({len(proof.path) * 32} bytes)  valid={ok}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
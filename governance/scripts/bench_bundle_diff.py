@@ -0,0 +1,141 @@
+"""Correctness, throughput and memory of bundle_diff.py on synthetic bundles.
+
+Two in-memory bundles are built around a DescriptorCatalog of --rows rows, the
+new one with known edits:
+
+    removed      --edits descriptors dropped                    (breaking)
+    added        --edits descriptors appended
+    narrowed     --edits descriptors' allowed_types LOG|DOC -> LOG (breaking)
+    noted        --edits descriptors' notes changed             (not breaking)
+    flipped      one RootPrefixFamilyMatrix cell ALLOW -> DENY  (breaking)
+    dropped      one NamingTestSuite case removed               (not breaking)
+
+The bundles are diffed twice: in one pass with the default budget, and in
+key-hash partitions with --memory-mb. Both must report exactly the edits
+above. Each is timed, then traced separately for its tracemalloc peak, which
+shows the partitioned run's memory bound.
+
+Exits 1 if either run misreports an edit.
+
+Usage (from the repo root):
+    python3 governance/scripts/bench_bundle_diff.py [--rows 200000] [--edits 500] [--memory-mb 4]
+"""
+import argparse
+import csv
+import io
+import sys
+import time
+import tracemalloc
+import zipfile
+from collections import Counter
+
+from bundle_diff import DEFAULT_MEMORY_MB, diff_bundles
+
+AREAS = ("API", "BILLING", "CORE", "EVENT", "IAM", "INGRESS", "LLM", "OBS", "RAG", "TENANT")
+
+
+def table(columns, rows):
+    out = io.StringIO()
+    writer = csv.writer(out, lineterminator="\n")
+    writer.writerow(columns)
+    writer.writerows(rows)
+    return out.getvalue().encode("utf-8")
+
+
+def bundle(members):
+    data = io.BytesIO()
+    with zipfile.ZipFile(data, "w", zipfile.ZIP_DEFLATED) as z:
+        for name, payload in members.items():
+            z.writestr(name, payload)
+    data.seek(0)
+    return zipfile.ZipFile(data)
+
+
+def descriptor(i):
+    return [f"D{i:07d}_OK", AREAS[i % len(AREAS)], f"D{i // 100:05d}", "LOG|DOC", ""]
+
+
+def synthetic_bundles(rows, edits):
+    """(old, new, expected {(table, kind): count}, expected breaking count)."""
+    columns = ["descriptor", "area", "family", "allowed_types", "notes"]
+    old = [descriptor(i) for i in range(rows)]
+    new = [list(row) for row in old[edits:]]
+    new += [descriptor(rows + i) for i in range(edits)]
+    for row in new[:edits]:
+        row[3] = "LOG"
+    for row in new[edits:2 * edits]:
+        row[4] = "reviewed"
+
+    matrix_columns = ["root", "prefix_family", "decision", "condition"]
+    matrix = [[root, family, "ALLOW", ""] for root in AREAS for family in ("OTEL", "SRE", "API")]
+    flipped = [list(row) for row in matrix]
+    flipped[0][2] = "DENY"
+
+    suite_columns = ["example_name", "expected", "rule_ids"]
+    suite = [[f"OTEL-LOG-CORE-CASE_{i}", "ALLOW", ""] for i in range(10)]
+
+    before = {"DescriptorCatalog.csv": table(columns, old),
+              "RootPrefixFamilyMatrix.csv": table(matrix_columns, matrix),
+              "NamingTestSuite.csv": table(suite_columns, suite)}
+    after = {"DescriptorCatalog.csv": table(columns, new),
+             "RootPrefixFamilyMatrix.csv": table(matrix_columns, flipped),
+             "NamingTestSuite.csv": table(suite_columns, suite[1:])}
+    expected = Counter({("DescriptorCatalog.csv", "removed"): edits,
+                        ("DescriptorCatalog.csv", "added"): edits,
+                        ("DescriptorCatalog.csv", "modified"): 2 * edits,
+                        ("RootPrefixFamilyMatrix.csv", "modified"): 1,
+                        ("NamingTestSuite.csv", "removed"): 1})
+    return bundle(before), bundle(after), expected, 2 * edits + 1
+
+
+def run(old, new, memory_mb):
+    start = time.perf_counter()
+    changes = list(diff_bundles(old, new, memory_mb))
+    return changes, time.perf_counter() - start
+
+
+def peak_mb(old, new, memory_mb):
+    """tracemalloc peak of a diff that keeps no changes (tracing slows it several times, so it is not timed)."""
+    tracemalloc.start()
+    for _ in diff_bundles(old, new, memory_mb):
+        pass
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak / 2**20
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the streaming bundle diff.")
+    parser.add_argument("--rows", type=int, default=200_000, help="DescriptorCatalog rows")
+    parser.add_argument("--edits", type=int, default=500, help="rows removed, added, narrowed and re-noted")
+    parser.add_argument("--memory-mb", type=int, default=4, help="budget of the partitioned run")
+    args = parser.parse_args(argv)
+
+    old, new, expected, expected_breaking = synthetic_bundles(args.rows, args.edits)
+    size = old.getinfo("DescriptorCatalog.csv").file_size
+    print(f"DescriptorCatalog: {args.rows:,} rows, {size / 2**20:.1f} MiB uncompressed")
+
+    ok = True
+    results = {}
+    for label, memory_mb in (("single", DEFAULT_MEMORY_MB), ("partitioned", args.memory_mb)):
+        changes, seconds = run(old, new, memory_mb)
+        counts = Counter((change.table, change.kind) for change in changes)
+        breaking = sum(bool(change.breaking) for change in changes)
+        correct = counts == expected and breaking == expected_breaking
+        ok &= correct
+        results[label] = sorted((c.table, c.kind, c.key) for c in changes)
+        print(f"{label:12} {memory_mb:4} MiB {seconds:7.2f}s {args.rows / seconds:9,.0f} rows/s  "
+              f"peak {peak_mb(old, new, memory_mb):6.1f} MiB  "
+              f"{len(changes):,} changes, {breaking:,} breaking  {'ok' if correct else 'WRONG'}")
+        if not correct:
+            for item in sorted(expected.keys() | counts.keys()):
+                if expected[item] != counts[item]:
+                    print(f"  {item[0]} {item[1]}: expected {expected[item]:,}, got {counts[item]:,}")
+    if results["single"] != results["partitioned"]:
+        print("single and partitioned runs disagree")
+        ok = False
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
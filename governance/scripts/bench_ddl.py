@@ -0,0 +1,242 @@
+"""Insert/query throughput of the generated schema indexes on a local SQLite stand-in.
+
+Loads governance/ddl/sqlite.sql (see generate_ddl.py) into three file-backed
+databases that differ only in their secondary indexes:
+
+    pk-only      primary keys only
+    per-column   one single-column index per column named in any index_hint
+                 (how the hints read before they carried composite positions)
+    tuned        the composite/unique indexes generated from index_hint
+
+fills each with the same synthetic rows (seeded, tenant/conversation skew) in
+batched transactions and times the access paths the application uses: thread
+pages, idempotency checks, trace lookups, the conversation inbox, due outbox
+rows and audit ranges. The tuned plan is printed so each query can be matched
+to the index it uses.
+
+Usage (from the repo root):
+    python3 governance/scripts/bench_ddl.py [--rows 50000] [--repeat 100] [--json results.json]
+"""
+import argparse
+import json
+import random
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from catalog import load_catalog
+from generate_ddl import ddl_dir, load_specs, sqlite_ddl
+
+TENANTS = 50
+BATCH = 1000
+# Page cache large enough for the tables, so inserts measure index upkeep rather than host I/O.
+CACHE_KIB = 256 * 1024
+START = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+# Rows per table relative to --rows (messages).
+TABLE_SHARE = {"conversation_message": 1.0, "conversation": 0.05, "outbox_event": 0.25, "audit_log": 0.5}
+
+# (label, table, SQL, parameter factory)
+QUERIES = [
+    ("message thread page", "conversation_message",
+     "SELECT message_id, created_at FROM conversation_message WHERE tenant_id = ? AND conversation_id = ? "
+     "ORDER BY created_at DESC LIMIT 50",
+     lambda s: (s.tenant_of(c := s.conversation()), c)),
+    ("message idempotency", "conversation_message",
+     "SELECT message_id FROM conversation_message WHERE tenant_id = ? AND idempotency_key = ?",
+     lambda s: s.pick("conversation_message", ("tenant_id", "idempotency_key"))),
+    ("message by trace", "conversation_message",
+     "SELECT message_id FROM conversation_message WHERE trace_id = ?",
+     lambda s: s.pick("conversation_message", ("trace_id",))),
+    ("conversation inbox", "conversation",
+     "SELECT conversation_id FROM conversation WHERE tenant_id = ? AND status = 'open' "
+     "ORDER BY last_message_at DESC LIMIT 50",
+     lambda s: (s.tenant(),)),
+    ("outbox due", "outbox_event",
+     "SELECT outbox_id FROM outbox_event WHERE status = 'pending' AND next_run_at <= ? "
+     "ORDER BY next_run_at LIMIT 100",
+     lambda s: (s.timestamp(s.rng.random()),)),
+    ("audit range", "audit_log",
+     "SELECT audit_id FROM audit_log WHERE tenant_id = ? AND created_at BETWEEN ? AND ? ORDER BY created_at",
+     lambda s: (s.tenant(), *sorted((s.timestamp(s.rng.random()), s.timestamp(s.rng.random()))))),
+    ("audit by decision", "audit_log",
+     "SELECT audit_id FROM audit_log WHERE tenant_id = ? AND decision_type = ? ORDER BY created_at DESC LIMIT 50",
+     lambda s: (s.tenant(), s.rng.choice(DECISION_TYPES))),
+]
+
+DECISION_TYPES = [f"DECISION_{i:02d}" for i in range(20)]
+
+
+class Synthetic:
+    """Seeded rows for every schema table, shared by all index variants."""
+
+    def __init__(self, specs, rows, seed=7):
+        self.rng = random.Random(seed)
+        self.specs = {spec.name: spec for spec in specs}
+        self.counts = {name: max(1, int(rows * share)) for name, share in TABLE_SHARE.items() if name in self.specs}
+        self.conversations = self.counts.get("conversation", 1)
+        self.span = timedelta(days=90)
+        self.rows = {name: [self._row(self.specs[name], i) for i in range(count)]
+                     for name, count in self.counts.items()}
+
+    def tenant(self):
+        # Skewed: a few large tenants, a long tail.
+        return f"tenant-{min(int(self.rng.paretovariate(1.2)) - 1, TENANTS - 1):03d}"
+
+    def conversation(self):
+        return f"conv-{self.rng.randrange(self.conversations):06d}"
+
+    def tenant_of(self, conversation):
+        return f"tenant-{int(conversation[5:]) % TENANTS:03d}"
+
+    def timestamp(self, fraction):
+        return (START + self.span * fraction).isoformat()
+
+    def pick(self, table, columns):
+        spec = self.specs[table]
+        positions = [[column.name for column in spec.columns].index(c) for c in columns]
+        row = self.rng.choice(self.rows[table])
+        return tuple(row[p] for p in positions)
+
+    def _value(self, table, column, i):
+        name = column.name
+        if column.enum_values:
+            if name == "status" and table == "outbox_event":
+                return "pending" if self.rng.random() < 0.1 else "done"
+            return self.rng.choice(column.enum_values)
+        if name == "conversation_id":
+            return f"conv-{i:06d}" if table == "conversation" else self.conversation()
+        if name == "tenant_id":
+            return None  # filled from the conversation (or skewed pick) in _row
+        if name == "user_id":
+            return f"user-{self.rng.randrange(self.conversations // 2 + 1):06d}"
+        if name == "decision_type":
+            return self.rng.choice(DECISION_TYPES)
+        if name.endswith("_id") or name in ("idempotency_key", "hash_chain_prev", "hash_chain_curr"):
+            return f"{table}-{name}-{i:08d}"
+        if column.data_type == "TIMESTAMP":
+            return self.timestamp(i / max(1, self.counts[table]) if name == "created_at" else self.rng.random())
+        if column.data_type in ("INT", "BOOLEAN"):
+            return self.rng.randrange(2 if column.data_type == "BOOLEAN" else 10_000)
+        if column.data_type in ("FLOAT", "DECIMAL"):
+            return round(self.rng.random(), 6)
+        if column.data_type == "JSON":
+            return "{}"
+        return f"{name}-{self.rng.randrange(1000)}"
+
+    def _row(self, spec, i):
+        values = {column.name: self._value(spec.name, column, i) for column in spec.columns}
+        if "tenant_id" in values:
+            conversation = values.get("conversation_id")
+            values["tenant_id"] = self.tenant_of(conversation) if conversation else self.tenant()
+        return tuple(values[column.name] for column in spec.columns)
+
+
+def variant_indexes(specs, variant):
+    """CREATE INDEX statements replacing the generated ones for `variant`."""
+    if variant == "tuned":
+        return None
+    if variant == "pk-only":
+        return []
+    statements = []
+    for spec in specs:
+        seen = []
+        for index in spec.indexes:
+            for column in index.columns:
+                if column not in seen:
+                    seen.append(column)
+        statements.extend(f"CREATE INDEX {spec.name}_by_{column} ON {spec.name} ({column});" for column in seen)
+    return statements
+
+
+def build(path, specs, variant):
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute("PRAGMA synchronous = NORMAL")
+    conn.execute(f"PRAGMA cache_size = -{CACHE_KIB}")
+    statements = [line for line in sqlite_ddl(specs) if not line.startswith("CREATE INDEX")
+                  and not line.startswith("CREATE UNIQUE INDEX")]
+    conn.executescript("\n".join(statements))
+    extra = variant_indexes(specs, variant)
+    if extra is None:
+        extra = [line for line in sqlite_ddl(specs) if "INDEX" in line and line.startswith("CREATE")]
+    for statement in extra:
+        conn.execute(statement)
+    conn.commit()
+    return conn
+
+
+def insert(conn, spec, rows):
+    sql = f"INSERT INTO {spec.name} VALUES ({', '.join('?' * len(spec.columns))})"
+    start = time.perf_counter()
+    for offset in range(0, len(rows), BATCH):
+        with conn:
+            conn.executemany(sql, rows[offset:offset + BATCH])
+    return len(rows) / (time.perf_counter() - start)
+
+
+def time_query(conn, sql, params_list):
+    samples = []
+    for params in params_list:
+        start = time.perf_counter()
+        conn.execute(sql, params).fetchall()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1e6
+
+
+def query_plan(conn, sql, params):
+    return "; ".join(row[-1] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}", params))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the generated schema indexes on SQLite.")
+    parser.add_argument("--rows", type=int, default=50_000, help="conversation_message rows (other tables scale from it)")
+    parser.add_argument("--repeat", type=int, default=100, help="executions per query")
+    parser.add_argument("--json", metavar="PATH", help="also write the results as JSON")
+    args = parser.parse_args(argv)
+
+    specs = load_specs(load_catalog())
+    data = Synthetic(specs, args.rows)
+    params = {label: [make(data) for _ in range(args.repeat)] for label, _, _, make in QUERIES}
+    variants = ("pk-only", "per-column", "tuned")
+    results = {"rows": data.counts, "insert_rows_per_s": {}, "query_median_us": {}, "plans": {}}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for variant in variants:
+            conn = build(Path(tmp) / f"{variant}.sqlite", specs, variant)
+            results["insert_rows_per_s"][variant] = {
+                spec.name: round(insert(conn, spec, data.rows[spec.name])) for spec in specs if spec.name in data.rows
+            }
+            conn.execute("ANALYZE")
+            results["query_median_us"][variant] = {
+                label: round(time_query(conn, sql, params[label]), 1) for label, _, sql, _ in QUERIES
+            }
+            if variant == "tuned":
+                results["plans"] = {label: query_plan(conn, sql, params[label][0]) for label, _, sql, _ in QUERIES}
+            conn.close()
+
+    print(f"Rows: {', '.join(f'{name} {count}' for name, count in data.counts.items())}  (ddl: {ddl_dir / 'sqlite.sql'})")
+    print(f"\n{'insert rows/s':34}" + "".join(f"{variant:>14}" for variant in variants))
+    for spec in specs:
+        if spec.name in data.rows:
+            print(f"{spec.name:34}" + "".join(f"{results['insert_rows_per_s'][v][spec.name]:>14,}" for v in variants))
+    print(f"\n{'query median (us)':34}" + "".join(f"{variant:>14}" for variant in variants))
+    for label, _, _, _ in QUERIES:
+        print(f"{label:34}" + "".join(f"{results['query_median_us'][v][label]:>14,.1f}" for v in variants))
+    print("\ntuned plans:")
+    for label, plan in results["plans"].items():
+        print(f"  {label:32} {plan}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+            f.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,95 @@
+"""Startup-time and peak-RSS budget for generate_ssot.py.
+
+Each run executes the generator with `--force` in a scratch working directory, so
+the tree is never touched, and reads the child's wall time and ru_maxrss from
+os.wait4. The bare interpreter is measured the same way, so the report separates
+Python startup from the generator itself. The scratch outputs are compared
+byte-for-byte with governance/definitions.
+
+Exits 1 when the median wall time, the peak RSS or the output check fails, so a
+heavyweight import creeping back in shows up (with pandas a run took ~0.6s and
+~70 MiB; on the stdlib it is ~0.1s and ~20 MiB). Wall time on shared CI runners
+is noisy, so --report-only prints budget overruns as warnings and fails only on
+the output check; CI gates on that and runs the budgets in a non-blocking job.
+
+Usage (from the repo root):
+    python3 governance/scripts/bench_generate_ssot.py
+    python3 governance/scripts/bench_generate_ssot.py --runs 10 --max-seconds 0.25 --max-rss-mb 24
+    python3 governance/scripts/bench_generate_ssot.py --report-only
+"""
+import argparse
+import filecmp
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+script_dir = Path(__file__).resolve().parent
+generator = script_dir / "generate_ssot.py"
+definitions_dir = Path("governance/definitions")
+
+DEFAULT_RUNS = 5
+DEFAULT_MAX_SECONDS = 0.5
+DEFAULT_MAX_RSS_MB = 32
+
+
+def measure(argv, cwd):
+    """(wall seconds, peak RSS in MiB) of one child process."""
+    start = time.perf_counter()
+    proc = subprocess.Popen(argv, cwd=cwd, stdout=subprocess.DEVNULL)
+    _, status, usage = os.wait4(proc.pid, 0)
+    elapsed = time.perf_counter() - start
+    proc.returncode = os.waitstatus_to_exitcode(status)
+    if proc.returncode != 0:
+        raise RuntimeError(f"{' '.join(map(str, argv))} exited with {proc.returncode}")
+    return elapsed, usage.ru_maxrss / 1024  # ru_maxrss is KiB on Linux
+
+
+def mismatched_outputs(scratch):
+    produced = Path(scratch) / definitions_dir
+    names = sorted(p.name for p in produced.iterdir() if p.suffix == ".csv")
+    _, mismatch, errors = filecmp.cmpfiles(produced, definitions_dir, names, shallow=False)
+    return mismatch + errors
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark generate_ssot.py startup and memory.")
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS, help="timed generator runs")
+    parser.add_argument("--max-seconds", type=float, default=DEFAULT_MAX_SECONDS, help="budget for median wall time")
+    parser.add_argument("--max-rss-mb", type=float, default=DEFAULT_MAX_RSS_MB, help="budget for peak RSS")
+    parser.add_argument("--report-only", action="store_true", help="warn on budget overruns; fail only on outputs")
+    args = parser.parse_args(argv)
+
+    interpreter = [measure([sys.executable, "-c", "pass"], ".") for _ in range(args.runs)]
+    runs = []
+    with tempfile.TemporaryDirectory() as scratch:
+        for _ in range(args.runs):
+            runs.append(measure([sys.executable, str(generator), "--force"], scratch))
+        mismatched = mismatched_outputs(scratch)
+
+    base_seconds = statistics.median(t for t, _ in interpreter)
+    seconds = statistics.median(t for t, _ in runs)
+    rss = max(r for _, r in runs)
+    print(f"Interpreter startup: {base_seconds * 1000:.1f} ms, {max(r for _, r in interpreter):.1f} MiB")
+    print(f"generate_ssot.py:    {seconds * 1000:.1f} ms median of {args.runs} "
+          f"({(seconds - base_seconds) * 1000:.1f} ms over startup), peak RSS {rss:.1f} MiB")
+
+    failed = False
+    over_budget = "WARN" if args.report_only else "FAIL"
+    if seconds > args.max_seconds:
+        print(f"{over_budget}: median {seconds:.3f}s exceeds budget {args.max_seconds:.3f}s")
+        failed |= not args.report_only
+    if rss > args.max_rss_mb:
+        print(f"{over_budget}: peak RSS {rss:.1f} MiB exceeds budget {args.max_rss_mb:.1f} MiB")
+        failed |= not args.report_only
+    if mismatched:
+        print(f"FAIL: outputs differ from {definitions_dir}: {', '.join(mismatched)}")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,175 @@
+"""Telemetry ingestion throughput and the I/O saved by aggregating at ingest.
+
+Starts ingest_telemetry.TelemetryIngestor on a temporary unix socket with a small
+queue. --clients connections then each send --events LogEntry lines, as
+src/utils/logger.ts prints them. The lines are built from (prefix, scope,
+descriptor) triples the catalog accepts; every 50th one is invalid and a
+quarter carry a latency in ms.
+
+Reported:
+    throughput   accepted events per second, end to end through the socket
+    backpressure highest queue depth seen (must stay <= --queue)
+    accounting   accepted + rejected must equal the lines sent
+    hostile      lines with non-string keys or non-finite latencies are counted
+                 as malformed or kept out of the sketches without stopping the
+                 consumer, and a consumer that dies makes run() raise instead
+                 of hanging
+    I/O          raw bytes received against the bytes of the aggregated
+                 signal points written for them
+
+Usage (from the repo root):
+    python3 governance/scripts/bench_ingest.py [--clients 8] [--events 25000] [--queue 2000] [--batch 500]
+"""
+import argparse
+import asyncio
+import json
+import math
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from binary_catalog import BinaryCatalog, EventValidator, catalog_file, definitions_dir
+from ingest_telemetry import SignalAggregator, TelemetryIngestor
+
+
+def valid_triples(catalog):
+    validator = EventValidator(catalog)
+    descriptors = catalog.table("DescriptorCatalog.csv")
+    areas = catalog.table("RootNamespaceMap.csv")
+    return [(prefix, scope[0], row[0]) for prefix in ("OTEL-LOG", "OTEL-METRIC") for scope in areas
+            for row in descriptors if validator.validate(prefix, scope[0], row[0])]
+
+
+def lines_for(client, events, triples, seed):
+    rng = random.Random(seed + client)
+    lines = []
+    for i in range(events):
+        prefix, scope, descriptor = rng.choice(triples)
+        if i % 50 == 49:
+            scope = "NOT_AN_AREA"
+        telemetry = {"prefix": prefix, "scope": scope, "descriptor": descriptor}
+        if rng.random() < 0.25:
+            telemetry.update(value=round(rng.lognormvariate(3.0, 0.8), 2), unit="ms")
+        entry = {"timestamp": "2026-01-01T00:00:00.000Z", "level": "ERROR" if rng.random() < 0.02 else "INFO",
+                 "message": descriptor.lower(), "telemetry": telemetry,
+                 "context": {"traceId": f"{client:04x}{i:012x}", "userId": f"user-{rng.randrange(1000)}"}}
+        lines.append((json.dumps(entry) + "\n").encode())
+    return lines
+
+
+async def send(path, lines):
+    _, writer = await asyncio.open_unix_connection(path)
+    for start in range(0, len(lines), 200):
+        writer.write(b"".join(lines[start:start + 200]))
+        await writer.drain()  # waits while the ingestor is not reading (backpressure)
+    writer.close()
+    await writer.wait_closed()
+
+
+def hostile_lines(prefix, scope, descriptor):
+    """Three lines with non-string keys (malformed), then four valid events with non-finite latencies."""
+    keys = [{"prefix": [prefix], "scope": scope, "descriptor": descriptor},
+            {"prefix": prefix, "scope": {"area": scope}, "descriptor": descriptor},
+            {"prefix": prefix, "scope": scope, "descriptor": 7}]
+    event = f'{{"prefix": "{prefix}", "scope": "{scope}", "descriptor": "{descriptor}", "unit": "ms", "value": '
+    return ([(json.dumps(line) + "\n").encode() for line in keys]
+            + [f"{event}{value}}}\n".encode() for value in ("1e400", "NaN", "-Infinity", "9" * 400)])
+
+
+class DeadAggregator(SignalAggregator):
+    def add_lines(self, lines):
+        raise RuntimeError("consumer died")
+
+
+async def check_hostile(catalog, triple):
+    """Problems found feeding hostile lines through ingestors with a tiny queue."""
+    problems = []
+    prefix, scope, descriptor = triple
+    lines = hostile_lines(*triple) + [(json.dumps({"prefix": prefix, "scope": scope, "descriptor": descriptor,
+                                                   "unit": "ms", "value": 12.5}) + "\n").encode()] * 2
+
+    async def feed(ingestor, stop=None):
+        for line in lines:
+            await ingestor.submit(line)  # blocks for good if the consumer stopped
+        if stop is not None:
+            stop.set()
+
+    ingestor = TelemetryIngestor(SignalAggregator.from_catalog(catalog), interval=3600, queue_size=2)
+    stop = asyncio.Event()
+    try:
+        points = await asyncio.wait_for(ingestor.run([feed(ingestor, stop)], stop), 5)
+        stats = ingestor.aggregator.stats
+        if (stats["malformed"], stats["accepted"]) != (3, 6):
+            problems.append(f"hostile lines: expected 3 malformed and 6 accepted, got {dict(stats)}")
+        if not all(math.isfinite(point.value) for point in points):
+            problems.append(f"hostile lines: non-finite signal points {points}")
+    except Exception as exc:
+        problems.append(f"hostile lines: run() failed with {exc!r}")
+
+    ingestor = TelemetryIngestor(DeadAggregator.from_catalog(catalog), interval=3600, queue_size=2)
+    try:
+        await asyncio.wait_for(ingestor.run([feed(ingestor)], asyncio.Event()), 5)
+        problems.append("dead consumer: run() returned")
+    except RuntimeError:
+        pass
+    except asyncio.TimeoutError:
+        problems.append("dead consumer: run() hung")
+    return problems
+
+
+async def bench(catalog, args, lines):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = str(Path(tmp) / "telemetry.sock")
+        written = []
+        ingestor = TelemetryIngestor(SignalAggregator.from_catalog(catalog), interval=3600, batch_size=args.batch,
+                                     queue_size=args.queue,
+                                     emit=lambda name, value, **attributes: written.append(
+                                         json.dumps({"name": name, "value": value, **attributes})))
+        await ingestor.serve_unix(path)
+        stop = asyncio.Event()
+        runner = asyncio.create_task(ingestor.run([], stop))
+        start = time.perf_counter()
+        await asyncio.gather(*(send(path, chunk) for chunk in lines))
+        while ingestor.aggregator.stats["accepted"] + ingestor.aggregator.stats["rejected"] < sum(map(len, lines)):
+            await asyncio.sleep(0.001)
+        elapsed = time.perf_counter() - start
+        stop.set()
+        await runner
+        return ingestor, elapsed, written
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark asyncio telemetry ingestion.")
+    parser.add_argument("--clients", type=int, default=8)
+    parser.add_argument("--events", type=int, default=25_000, help="lines per client")
+    parser.add_argument("--queue", type=int, default=2000)
+    parser.add_argument("--batch", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    with BinaryCatalog(definitions_dir / catalog_file) as catalog:
+        triples = valid_triples(catalog)
+        lines = [lines_for(client, args.events, triples, args.seed) for client in range(args.clients)]
+        ingestor, elapsed, written = asyncio.run(bench(catalog, args, lines))
+        problems = asyncio.run(check_hostile(catalog, triples[0]))
+
+    stats = ingestor.aggregator.stats
+    sent = args.clients * args.events
+    bytes_out = sum(len(point) + 1 for point in written)
+    print(f"{sent:,} lines from {args.clients} clients in {elapsed:.2f}s: {stats['accepted'] / elapsed:,.0f} events/s "
+          f"({stats['batches']:,} batches)")
+    print(f"accepted {stats['accepted']:,}  rejected {stats['rejected']:,}  malformed {stats['malformed']:,}")
+    print(f"max queue depth {ingestor.max_queued:,} (limit {args.queue:,})")
+    print(f"raw {ingestor.bytes_in:,} bytes in -> {len(written)} signal points, {bytes_out:,} bytes out "
+          f"({ingestor.bytes_in / max(bytes_out, 1):,.0f}x less)")
+    for problem in problems:
+        print(problem)
+    print(f"hostile lines: {'ok' if not problems else 'FAILED'}")
+    ok = stats["accepted"] + stats["rejected"] == sent and ingestor.max_queued <= args.queue and not problems
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,98 @@
+"""Diff NamingLinter against a naming_corpus.py corpus and measure its throughput.
+
+The corpus carries the reference evaluator's verdict and violations for every
+name. Each name goes through the linter twice:
+
+    check      NamingLinter.check: the precomputed verdicts, then the memoised
+               rule evaluator (what lint_telemetry.py and the CLI use)
+    evaluate   the rule evaluator alone, bypassing both, so names the
+               precomputation covers are still exercised off the rules
+
+Any difference in verdict or violations is a mismatch, grouped by
+(expected, got) with examples. Throughput is reported per expected verdict as
+well as overall: the corpus is mostly DENY, and rejections often stop at the
+first failed rule, so the overall rate alone hides the ALLOW path. Each mode
+makes one pass over the corpus per verdict, in chunks of that verdict's names
+only, so the few ALLOW names are timed as one group rather than as scraps
+between DENY chunks. Memory stays flat whatever the corpus size.
+
+Exits 1 on any mismatch.
+
+Usage (from the repo root):
+    python3 governance/scripts/naming_corpus.py --out /tmp/corpus.csv
+    python3 governance/scripts/bench_naming_lint.py /tmp/corpus.csv [--examples 5]
+"""
+import argparse
+import csv
+import sys
+import time
+from collections import Counter, defaultdict
+from itertools import islice
+
+from naming_lint import NamingLinter, definitions_dir
+
+CHUNK_SIZE = 100_000
+VERDICTS = ("ALLOW", "DENY")
+
+
+def read_corpus(path, verdict):
+    """Chunks of up to CHUNK_SIZE (name, (verdict, violations)) rows expecting `verdict`."""
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        reader = csv.reader(f)
+        if next(reader, None) != ["expected", "example_name", "violations"]:
+            raise ValueError(f"{path} is not a naming_corpus.py corpus")
+        rows = ((name, (expected, tuple(v for v in violations.split("|") if v)))
+                for expected, name, violations in reader if expected == verdict)
+        while True:
+            chunk = list(islice(rows, CHUNK_SIZE))
+            if not chunk:
+                return
+            yield chunk
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Diff and time NamingLinter against a reference corpus.")
+    parser.add_argument("corpus", help="CSV written by naming_corpus.py")
+    parser.add_argument("--definitions", default=str(definitions_dir), help="catalog CSV directory")
+    parser.add_argument("--examples", type=int, default=5, help="examples printed per mismatch kind")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    linter = NamingLinter(args.definitions)
+    print(f"Compiled {linter.precomputed:,} names in {time.perf_counter() - start:.2f}s")
+
+    seconds = Counter()  # (mode, expected verdict) -> seconds
+    names = Counter()  # expected verdict -> names
+    mismatches = {"check": defaultdict(list), "evaluate": defaultdict(list)}
+    for mode, judge in (("check", linter.check), ("evaluate", linter._evaluate)):
+        for verdict in VERDICTS:
+            for chunk in read_corpus(args.corpus, verdict):
+                if mode == "check":
+                    names[verdict] += len(chunk)
+                begin = time.perf_counter()
+                results = [judge(name) for name, _ in chunk]
+                seconds[mode, verdict] += time.perf_counter() - begin
+                for (name, expected), result in zip(chunk, results):
+                    got = (result.verdict, result.violations)
+                    if got != expected:
+                        mismatches[mode][(expected, got)].append(name)
+
+    total = sum(names.values())
+    for mode in ("check", "evaluate"):
+        found = mismatches[mode]
+        count = sum(len(examples) for examples in found.values())
+        elapsed = sum(seconds[mode, verdict] for verdict in names)
+        rates = "  ".join(f"{verdict} {names[verdict]:,} at {names[verdict] / max(seconds[mode, verdict], 1e-9):,.0f}/s"
+                          for verdict in VERDICTS)
+        print(f"{mode:8} {total:,} names in {elapsed:.2f}s ({total / max(elapsed, 1e-9):,.0f} names/s; {rates}), "
+              f"{count:,} mismatches")
+        for (expected, got), examples in sorted(found.items(), key=lambda item: -len(item[1])):
+            print(f"  expected {expected[0]} [{','.join(expected[1]) or '-'}], "
+                  f"got {got[0]} [{','.join(got[1]) or '-'}]: {len(examples):,}")
+            for name in examples[:args.examples]:
+                print(f"    {name}")
+    return 1 if any(mismatches.values()) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,143 @@
+"""Outbox throughput: row-at-a-time polling vs the batched, leased dispatcher.
+
+Enqueues --events rows into a fresh SQLite outbox (schema from generate_ddl.py),
+then drains it twice with a handler that sleeps --latency-ms to stand in for the
+downstream call:
+
+    polling   one row claimed, dispatched and acked per transaction, one at a time
+    batched   --dispatchers OutboxDispatcher instances (own connections) claiming
+              --batch rows per transaction and dispatching on --workers threads
+
+Every dispatched id is recorded, so the run also checks that concurrent
+dispatchers never deliver an event twice (with --fail-rate 0) and that the
+outbox ends empty, with the final QUEUE_DEPTH/OUTBOX_DEPTH/DLQ_COUNT values.
+
+Usage (from the repo root):
+    python3 governance/scripts/bench_outbox.py [--events 2000] [--latency-ms 2] [--batch 100] [--workers 16]
+"""
+import argparse
+import random
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+
+from outbox_dispatcher import TABLE, OutboxDispatcher, OutboxEvent, connect, create_schema, enqueue, timestamp
+
+
+class Handler:
+    def __init__(self, latency, fail_rate, seed=11):
+        self.latency = latency
+        self.fail_rate = fail_rate
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+        self.delivered = Counter()
+
+    def __call__(self, event):
+        time.sleep(self.latency)
+        with self.lock:
+            if self.rng.random() < self.fail_rate:
+                raise RuntimeError("downstream unavailable")
+            self.delivered[event.outbox_id] += 1
+
+
+def fill(path, events):
+    conn = connect(path)
+    create_schema(conn)
+    start = time.perf_counter()
+    conn.execute("BEGIN")
+    for i in range(events):
+        enqueue(conn, f"tenant-{i % 20:03d}", "NOTIFY", {"n": i}, f"key-{i:08d}", trace_id=f"trace-{i:08d}")
+    conn.execute("COMMIT")
+    rate = events / (time.perf_counter() - start)
+    conn.close()
+    return rate
+
+
+def drain_polling(path, handler):
+    """The naive loop: claim one due row, dispatch it, ack it, repeat."""
+    conn = connect(path)
+    while True:
+        now = time.time()
+        conn.execute("BEGIN IMMEDIATE")
+        row = conn.execute(
+            f"SELECT outbox_id, tenant_id, trace_id, action_type, payload, idempotency_key, attempt FROM {TABLE} "
+            "WHERE status = 'pending' AND next_run_at <= ? ORDER BY next_run_at LIMIT 1", (timestamp(now),)).fetchone()
+        if row is None:
+            conn.execute("COMMIT")
+            break
+        conn.execute(f"UPDATE {TABLE} SET status = 'processing', attempt = attempt + 1 WHERE outbox_id = ?", (row[0],))
+        conn.execute("COMMIT")
+        try:
+            handler(OutboxEvent(*row, None))
+            status = "done"
+        except RuntimeError:
+            status = "pending"
+        conn.execute(f"UPDATE {TABLE} SET status = ?, updated_at = ? WHERE outbox_id = ?",
+                     (status, timestamp(time.time()), row[0]))
+    conn.close()
+
+
+def drain_batched(path, handler, dispatchers, batch, workers, gauges):
+    def emit(name, value, **attributes):
+        gauges[name] = value
+
+    def run():
+        conn = connect(path)
+        dispatcher = OutboxDispatcher(conn, handler, batch_size=batch, workers=workers,
+                                      backoff_seconds=0.01, max_backoff_seconds=0.05, emit=emit)
+        try:
+            dispatcher.run(idle_sleep=0.01, until_empty=True)
+            dispatcher.report_depth()
+        finally:
+            dispatcher.close()
+            conn.close()
+
+    threads = [threading.Thread(target=run) for _ in range(dispatchers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark outbox draining strategies on SQLite.")
+    parser.add_argument("--events", type=int, default=2000)
+    parser.add_argument("--latency-ms", type=float, default=2.0, help="simulated downstream latency per event")
+    parser.add_argument("--batch", type=int, default=100)
+    parser.add_argument("--workers", type=int, default=16)
+    parser.add_argument("--dispatchers", type=int, default=2, help="concurrent batched dispatchers")
+    parser.add_argument("--fail-rate", type=float, default=0.0, help="fraction of dispatches that raise")
+    args = parser.parse_args(argv)
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for mode in ("polling", "batched"):
+            path = Path(tmp) / f"{mode}.sqlite"
+            enqueue_rate = fill(path, args.events)
+            handler = Handler(args.latency_ms / 1000, args.fail_rate)
+            gauges = {}
+            start = time.perf_counter()
+            if mode == "polling":
+                drain_polling(path, handler)
+            else:
+                drain_batched(path, handler, args.dispatchers, args.batch, args.workers, gauges)
+            elapsed = time.perf_counter() - start
+            duplicates = sum(1 for count in handler.delivered.values() if count > 1)
+            results[mode] = (len(handler.delivered) / elapsed, elapsed, duplicates, gauges)
+            print(f"{mode:8} {len(handler.delivered):6} events in {elapsed:6.2f}s  "
+                  f"{results[mode][0]:9,.0f} events/s  duplicates={duplicates}  (enqueue {enqueue_rate:,.0f}/s)")
+            if gauges:
+                print("         " + "  ".join(f"{name}={value}" for name, value in sorted(gauges.items())
+                                          if name.startswith("OTEL-METRIC")))
+
+    speedup = results["batched"][0] / results["polling"][0]
+    print(f"batched/polling speedup: {speedup:.1f}x")
+    failed = any(result[2] for result in results.values()) and args.fail_rate == 0
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,79 @@
+"""Latency sketch accuracy, throughput and merge cost (see quantile_sketch.py).
+
+For each synthetic latency distribution (ms), --samples values are drawn and:
+
+    accuracy   the worst relative error of the sketch's P50/P95/P99/P99.9
+               against the exact percentiles of the sorted samples
+    add        single-sketch insert rate
+    merge      the samples split over --shards sketches (one per process/node),
+               each serialised, decoded and merged; the merged sketch must equal
+               the single sketch bucket for bucket
+    size       serialised bytes against 8 bytes per raw sample
+
+Usage (from the repo root):
+    python3 governance/scripts/bench_quantile_sketch.py [--samples 200000] [--shards 64] [--accuracy 0.01]
+"""
+import argparse
+import random
+import sys
+import time
+
+from quantile_sketch import DDSketch
+
+QUANTILES = (0.5, 0.95, 0.99, 0.999)
+
+
+def distributions(rng):
+    return {
+        "lognormal": lambda: rng.lognormvariate(3.0, 1.0),
+        "pareto": lambda: 5.0 * rng.paretovariate(1.5),
+        "bimodal": lambda: rng.gauss(8.0, 1.0) if rng.random() < 0.9 else rng.gauss(900.0, 150.0),
+        "uniform": lambda: rng.uniform(1.0, 2000.0),
+    }
+
+
+def exact(sorted_values, q):
+    return sorted_values[int(q * (len(sorted_values) - 1))]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark DDSketch latency percentiles.")
+    parser.add_argument("--samples", type=int, default=200_000)
+    parser.add_argument("--shards", type=int, default=64, help="sketches merged into the fleet-wide one")
+    parser.add_argument("--accuracy", type=float, default=0.01, help="sketch relative accuracy")
+    parser.add_argument("--seed", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    ok = True
+    print(f"{'distribution':12} {'max rel err':>11} {'add/s':>11} {'merge ms':>9} {'bytes':>7} {'raw bytes':>10}  merged==single")
+    for name, draw in distributions(rng).items():
+        values = [max(draw(), 0.01) for _ in range(args.samples)]
+
+        single = DDSketch(args.accuracy)
+        start = time.perf_counter()
+        single.add_many(values)
+        add_rate = len(values) / (time.perf_counter() - start)
+
+        ordered = sorted(values)
+        error = max(abs(single.quantile(q) - exact(ordered, q)) / exact(ordered, q) for q in QUANTILES)
+
+        shards = [DDSketch(args.accuracy) for _ in range(args.shards)]
+        for i, value in enumerate(values):
+            shards[i % args.shards].add(value)
+        payloads = [shard.to_bytes() for shard in shards]
+        start = time.perf_counter()
+        merged = DDSketch(args.accuracy)
+        for payload in payloads:
+            merged.merge(DDSketch.from_bytes(payload))
+        merge_ms = (time.perf_counter() - start) * 1000
+        same = merged.bins == single.bins and merged.count == single.count
+
+        ok &= same and error <= args.accuracy
+        print(f"{name:12} {error:11.4%} {add_rate:11,.0f} {merge_ms:9.2f} {len(single.to_bytes()):7,} "
+              f"{8 * len(values):10,}  {same}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
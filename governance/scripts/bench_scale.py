@@ -0,0 +1,361 @@
+"""Scaling benchmark: the governance toolchain on synthetically scaled catalogs.
+
+The real catalogs are small (~200 descriptors, 13 roots), so they say nothing
+about 10k-1M descriptors under hundreds of roots. For each --scale
+DESCRIPTORS:ROOTS this builds a catalog of that size in the real table shapes
+and runs the toolchain over it in a scratch directory:
+
+    synthetic roots      copies of real roots: the root's decision_map row, its
+                         RootNamespaceMap row and DescriptorFamilyRules row, and
+                         the root added to the OTEL-* prefixes' allowed_roots
+    synthetic families   one `<FAMILY>_*` allow pattern per family in its area's
+                         DescriptorFamilyRules row
+    descriptors          add_desc rows `<FAMILY>_<OBJECT>_<SUFFIX>`, spread over
+                         the roots OTEL-LOG may use, with its suffixes and the
+                         allowed_types of the root they were copied from
+
+Every other table is the real one. Stages, timed with instrument.py:
+
+    synthesize            building the scaled sources
+    build/write <table>   every generate_ssot pipeline node, then the bundle
+    read/module <file>    generate_sdk: reading the catalog, each TS module
+    lint                  NamingLinter compile + precomputed verdicts
+    check                 --names catalog names through NamingLinter.check
+    validate              --names events through binary_catalog.EventValidator
+
+Hard limits are recorded under "limits" instead of failing the run, since
+finding them is the point:
+    lint   NamingLinter precomputes a verdict per telemetry type x root x
+           descriptor name; above --lint-limit names lint and check are skipped
+    sdk    generate_sdk's scope bitmasks are 32-bit perfect-hash values, so at
+           most 32 roots (generate_sdk.MAX_SCOPES), and a table holds at most
+           32,767 keys per area
+
+With --history FILE, each scale appends one JSON line to FILE: timestamp, git
+commit, host, scale and per-stage ms / alloc_peak / output_bytes / rows. The run
+is compared with the latest earlier entry for the same scale and host; stages
+slower by more than --tolerance (and by at least --min-ms) are reported as
+regressions. Without it nothing is written, so a plain run leaves the tree
+clean; keep the history outside the repo (results are per host anyway).
+
+Exits 1 when a synthetic name or event is rejected, a table has the wrong size,
+or a stage regressed.
+
+Usage (from the repo root):
+    python3 governance/scripts/bench_scale.py                        # 10k:50 and 100k:200
+    python3 governance/scripts/bench_scale.py --scale 1000000:500 --trace-memory
+    python3 governance/scripts/bench_scale.py --scale 10000:50 --history /tmp/scale.jsonl --tolerance 1.5
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+from binary_catalog import BinaryCatalog, EventValidator, catalog_file
+from bundle import write_bundle, zip_path
+import generate_sdk
+import generate_ssot
+import instrument
+from naming_lint import NamingLinter
+from ssot_pipeline import Pipeline, Table
+
+DEFAULT_SCALES = ["10000:50", "100000:200"]
+DEFAULT_LINT_LIMIT = 5_000_000
+DEFAULT_NAMES = 50_000
+DEFAULT_TOLERANCE = 2.0
+DEFAULT_MIN_MS = 10.0
+
+LOG_SUFFIXES = ["OK", "FAIL", "DENY", "REJECTED", "TIMEOUT", "DETECTED", "APPLIED", "STARTED", "DONE",
+                "ENQUEUED", "DEQUEUED"]
+OBJECTS_PER_FAMILY = 8
+TELEMETRY_PREFIXES = ("OTEL-TRACE", "OTEL-LOG", "OTEL-METRIC")
+
+ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+
+def letters(n, width):
+    """n as a fixed-width base-26 word: catalog tokens are upper-case letters."""
+    out = []
+    for _ in range(width):
+        n, digit = divmod(n, 26)
+        out.append(ALPHABET[digit])
+    return "".join(reversed(out))
+
+
+def width_for(count):
+    width = 1
+    while 26 ** width < count:
+        width += 1
+    return width
+
+
+def parse_scale(value):
+    try:
+        descriptors, roots = (int(part.replace("_", "")) for part in value.split(":"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected DESCRIPTORS:ROOTS, got {value!r}")
+    if descriptors < 1 or roots < len(generate_ssot.roots):
+        raise argparse.ArgumentTypeError(f"need >= 1 descriptor and >= {len(generate_ssot.roots)} roots")
+    return descriptors, roots
+
+
+# --- Synthetic catalogs ---
+
+def scaled_sources(descriptors, roots):
+    """{pipeline node: replacement value} for a catalog of `descriptors` rows under `roots` roots."""
+    real = generate_ssot
+    # Templates: roots OTEL telemetry may use without a conditional (prefix-specific) decision.
+    otel_roots = set(next(row[5] for row in real.official_prefix_rows if row[0] == "OTEL-LOG").split("|"))
+    templates = [r for r in real.roots if r in otel_roots and "CONDITIONAL" not in real.decision_map[r].values()]
+    root_width = width_for(roots)
+    synthetic = {f"X{letters(i, root_width)}": templates[i % len(templates)]
+                 for i in range(roots - len(real.roots))}
+    all_roots = list(real.roots) + list(synthetic)
+
+    decision_map = dict(real.decision_map)
+    root_rows = list(real.root_rows)
+    root_row = {row[0]: row for row in real.root_rows}
+    for root, template in synthetic.items():
+        decision_map[root] = real.decision_map[template]
+        root_rows.append((root, *root_row[template][1:5], f"Synthetic copy of {template}"))
+
+    types = {}
+    for _, area, _, allowed_types, _ in real.descriptor_rows:
+        types.setdefault(area, allowed_types)
+    source = {root: synthetic.get(root, root) for root in all_roots}
+
+    # Descriptors go round-robin to the roots OTEL-LOG may emit under, OBJECTS_PER_FAMILY x
+    # LOG_SUFFIXES per family, so every synthetic descriptor is a valid OTEL-LOG event.
+    emitting = [root for root in all_roots if root in otel_roots or root in synthetic]
+    per_family = OBJECTS_PER_FAMILY * len(LOG_SUFFIXES)
+    families = -(-descriptors // per_family)
+    family_width, object_width = width_for(families), width_for(OBJECTS_PER_FAMILY)
+    descriptor_rows = []
+    family_patterns = {root: [] for root in all_roots}
+    for f in range(families):
+        root = emitting[f % len(emitting)]
+        family = f"S{letters(f, family_width)}"
+        family_patterns[root].append(f"{family}_*")
+        for k in range(min(per_family, descriptors - f * per_family)):
+            obj, suffix = divmod(k, len(LOG_SUFFIXES))
+            descriptor_rows.append((f"{family}_{letters(obj, object_width)}_{LOG_SUFFIXES[suffix]}", root, family,
+                                    types.get(source[root], "LOG"), ""))
+
+    rules = {row[0]: row for row in real.descriptor_family_rules}
+    family_rules = []
+    for root in all_roots:
+        template = rules.get(source[root], (root, "", "", ""))
+        allow = "|".join(p for p in [template[1]] + family_patterns[root] if p)
+        family_rules.append((root, allow, template[2], template[3]))
+
+    names = "|".join(synthetic)
+    prefix_rows = [row[:5] + (f"{row[5]}|{names}",) + row[6:] if row[0] in TELEMETRY_PREFIXES and names else row
+                   for row in real.official_prefix_rows]
+    return {
+        "roots": all_roots,
+        "decision_map": decision_map,
+        "descriptor_rows": descriptor_rows,
+        "RootNamespaceMap.csv": Table(list(real.pipeline.nodes["RootNamespaceMap.csv"].build().columns), root_rows),
+        "DescriptorFamilyRules.csv": Table(["area", "allow_patterns", "deny_patterns", "notes"], family_rules),
+        "OfficialPrefixRegistry.csv": Table(list(real.prefix_columns), prefix_rows),
+    }
+
+
+def scaled_pipeline(sources):
+    pipeline = Pipeline()
+    for name, node in generate_ssot.pipeline.nodes.items():
+        if name in sources:
+            node = node._replace(build=lambda value=sources[name]: value)
+        pipeline.nodes[name] = node
+    return pipeline
+
+
+@contextmanager
+def scratch_tree():
+    """Run inside an empty temp dir: every generator writes to paths relative to the repo root."""
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory(prefix="bench_scale.") as tmp:
+        os.chdir(tmp)
+        try:
+            yield Path(tmp)
+        finally:
+            os.chdir(cwd)
+
+
+# --- Stages ---
+
+def run_scale(descriptors, roots, args):
+    stages = instrument.Instrumentation("bench_scale", trace_memory=args.trace_memory).start()
+    failures, notes = [], {"limits": {}}
+    try:
+        with stages.stage("synthesize", "sources") as stage:
+            sources = scaled_sources(descriptors, roots)
+            stage.rows = len(sources["descriptor_rows"])
+        pipeline = scaled_pipeline(sources)
+        rng = random.Random(args.seed)
+        sample = [row[:2] for row in rng.choices(sources["descriptor_rows"], k=args.names)]
+
+        with scratch_tree():
+            out_dir = generate_ssot.out_dir
+            pipeline.run(out_dir, force=True, workers=1 if args.trace_memory else None, instrument=stages)
+            with stages.stage("bundle", zip_path.name) as stage:
+                write_bundle(pipeline.tables, out_dir)
+                stage.wrote(zip_path)
+            rows = len(pipeline.values["DescriptorCatalog.csv"].rows)
+            if rows != descriptors:
+                failures.append(f"DescriptorCatalog has {rows:,} rows, expected {descriptors:,}")
+
+            try:
+                generate_sdk.generate_sdk(stages)
+            except ValueError as exc:  # a hard limit of the SDK encoding, not a benchmark failure
+                notes["limits"]["sdk"] = str(exc)
+
+            vocabulary = descriptors + len(generate_ssot.signal_rows)
+            projected = len(TELEMETRY_PREFIXES) * roots * vocabulary
+            notes["lint_precomputed"] = projected
+            if projected > args.lint_limit:
+                notes["limits"]["lint"] = f"{projected:,} precomputed names > --lint-limit {args.lint_limit:,}"
+            else:
+                with stages.stage("lint", "NamingLinter") as stage:
+                    linter = NamingLinter(out_dir)
+                    stage.rows = linter.precomputed
+                notes["lint_precomputed"] = linter.precomputed
+                with stages.stage("check", f"{len(sample)} names") as stage:
+                    rejected = [name for name in (f"OTEL-LOG-{area}-{d}" for d, area in sample)
+                                if linter.check(name).verdict == "DENY"]
+                    stage.rows = len(sample)
+                if rejected:
+                    failures.append(f"{len(rejected):,} synthetic names denied, e.g. {rejected[0]}")
+
+            with BinaryCatalog(out_dir / catalog_file) as catalog:
+                with stages.stage("validate", f"{len(sample)} events") as stage:
+                    validator = EventValidator(catalog)
+                    rejected = [(d, area) for d, area in sample if not validator.validate("OTEL-LOG", area, d)]
+                    stage.rows = len(sample)
+            if rejected:
+                failures.append(f"{len(rejected):,} synthetic events rejected, e.g. {rejected[0]}")
+    finally:
+        stages.stop()
+    return stages, failures, notes
+
+
+# --- History ---
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def host():
+    return {"machine": platform.machine(), "python": platform.python_version(), "cpus": os.cpu_count(),
+            "node": platform.node()}
+
+
+def entry_for(descriptors, roots, stages, notes):
+    records = {}
+    for r in stages.records:
+        records[f"{r.stage}:{r.name}"] = {key: value for key, value in r._asdict().items()
+                                          if key not in ("stage", "name") and value is not None}
+    return {"timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()), "commit": git_commit(),
+            "host": host(), "scale": {"descriptors": descriptors, "roots": roots}, **notes,
+            "total_ms": sum(r.ms for r in stages.records), "stages": records}
+
+
+def read_history(path):
+    if not path.exists():
+        return []
+    with open(path, "r", encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def previous_entry(history, entry):
+    for earlier in reversed(history):
+        if earlier["scale"] == entry["scale"] and earlier["host"] == entry["host"]:
+            return earlier
+    return None
+
+
+def regressions(previous, entry, tolerance, min_ms):
+    slower = []
+    for key, record in entry["stages"].items():
+        before = previous["stages"].get(key)
+        if before is None:
+            continue
+        if record["ms"] > before["ms"] * tolerance and record["ms"] - before["ms"] >= min_ms:
+            slower.append((key, before["ms"], record["ms"]))
+    return slower
+
+
+def by_stage(stages):
+    """Per stage kind: (ms, count); pipeline and SDK stages have one record per table/module."""
+    totals = {}
+    for r in stages.records:
+        ms, count = totals.get(r.stage, (0.0, 0))
+        totals[r.stage] = (ms + r.ms, count + 1)
+    return totals
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the governance toolchain on scaled synthetic catalogs.")
+    parser.add_argument("--scale", action="append", type=parse_scale, help="DESCRIPTORS:ROOTS (repeatable)")
+    parser.add_argument("--names", type=int, default=DEFAULT_NAMES, help="names checked and events validated")
+    parser.add_argument("--lint-limit", type=int, default=DEFAULT_LINT_LIMIT,
+                        help="skip NamingLinter above this many precomputed names")
+    parser.add_argument("--trace-memory", action="store_true", help="record tracemalloc peaks per stage (serial run)")
+    parser.add_argument("--history", type=Path, help="JSON-lines results history to compare with and append to")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="flag stages slower than this factor of the previous run")
+    parser.add_argument("--min-ms", type=float, default=DEFAULT_MIN_MS, help="ignore slowdowns smaller than this")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args(argv)
+    scales = args.scale or [parse_scale(value) for value in DEFAULT_SCALES]
+    history = read_history(args.history) if args.history else []
+
+    ok = True
+    for descriptors, roots in scales:
+        print(f"== {descriptors:,} descriptors x {roots} roots")
+        stages, failures, notes = run_scale(descriptors, roots, args)
+        for stage, (ms, count) in sorted(by_stage(stages).items(), key=lambda item: -item[1][0]):
+            print(f"  {stage:10} {ms:10.1f} ms  ({count} records)")
+        for key in ("check", "validate"):
+            record = next((r for r in stages.records if r.stage == key), None)
+            if record is not None:
+                print(f"  {key} throughput {record.rows / (record.ms / 1000):,.0f}/s")
+        stages.summary(top=8)
+
+        entry = entry_for(descriptors, roots, stages, notes)
+        previous = previous_entry(history, entry)
+        if previous is not None:
+            slower = regressions(previous, entry, args.tolerance, args.min_ms)
+            print(f"  vs {previous['commit'] or '?'} ({previous['timestamp']}): "
+                  f"{len(slower)} stage(s) slower than {args.tolerance}x")
+            for key, before, after in slower:
+                print(f"    REGRESSION {key}: {before:.1f} -> {after:.1f} ms")
+            ok = ok and not slower
+        for stage, reason in entry["limits"].items():
+            print(f"  LIMIT {stage}: {reason}")
+        for failure in failures:
+            print(f"  FAIL {failure}")
+        ok = ok and not failures
+        history.append(entry)
+        if args.history:
+            args.history.parent.mkdir(parents=True, exist_ok=True)
+            with open(args.history, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry, sort_keys=True) + "\n")
+    if args.history:
+        print(f"Appended {len(scales)} entr{'y' if len(scales) == 1 else 'ies'} to {args.history}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,143 @@
+"""SLO burn-rate evaluation cost: ring-buffered windows vs rescanning raw history.
+
+Streams synthetic SLI points for --tenants instances of every SLOTemplateCatalog
+SLO (one point per instance every --step seconds over --hours of simulated time)
+and evaluates every --tick seconds, twice:
+
+    rescan    raw points kept per instance; each tick re-sums every policy window
+    rings     slo_burn.BurnRateEvaluator (window sums maintained incrementally)
+
+A fraction of the instances suffers an error spike half way through, so both
+evaluators must fire BURN_FAST/BURN_SLOW; the run checks they report the same
+transitions. The rescan baseline is run on --rescan-tenants instances and
+scaled to the full population, since its tick cost grows with history.
+
+Usage (from the repo root):
+    python3 governance/scripts/bench_slo_burn.py [--tenants 300] [--hours 2] [--step 10] [--tick 30]
+"""
+import argparse
+import random
+import sys
+import time
+from collections import deque
+
+from catalog import load_catalog
+from slo_burn import BurnRateEvaluator, BurnState
+
+
+class Rescan:
+    """Reference evaluator: keeps every point and re-sums windows on each tick."""
+
+    def __init__(self, evaluator):
+        self.slos = evaluator.slos
+        self.windows = evaluator.windows
+        self.policies = evaluator.policies
+        self.buckets = evaluator.buckets
+        self.resolution = {token: seconds / evaluator.buckets for token, seconds in self.windows.items()}
+        self.longest = max(self.windows.values())
+        self.points = {}
+        self.firing = {}
+
+    def observe(self, slo_name, ts, bad, total, labels=()):
+        self.points.setdefault((slo_name, tuple(labels)), deque()).append((ts, bad, total))
+
+    def burn(self, points, slo, window, now):
+        # Same slot alignment as the rings, so results are comparable exactly.
+        resolution = self.resolution[window]
+        first = int(now // resolution) - self.buckets + 1
+        bad = total = 0.0
+        for ts, b, t in points:
+            if int(ts // resolution) >= first:
+                bad += b
+                total += t
+        return (bad / total if total else 0.0) / (1 - slo.objective)
+
+    def evaluate(self, now):
+        changes = []
+        for key, points in self.points.items():
+            while points and points[0][0] < now - self.longest:
+                points.popleft()
+            slo = self.slos[key[0]]
+            for token, (long, short, factor) in self.policies.items():
+                burn_long = self.burn(points, slo, long or slo.window, now)
+                burn_short = self.burn(points, slo, short or slo.window, now)
+                firing = burn_long >= factor and burn_short >= factor
+                if firing != self.firing.get((key, token), False):
+                    self.firing[(key, token)] = firing
+                    changes.append(BurnState(key[0], key[1], token, None, firing, burn_long, burn_short, now))
+        return changes
+
+
+def stream(slos, tenants, hours, step, tick, seed):
+    """Yields ("point", slo, labels, ts, bad, total) and ("tick", now) in time order."""
+    rng = random.Random(seed)
+    spiking = {(slo.name, t) for slo in slos for t in range(tenants) if rng.random() < 0.05}
+    end = hours * 3600
+    for ts in range(0, end, step):
+        for slo in slos:
+            budget = 1 - slo.objective
+            for t in range(tenants):
+                total = rng.randint(50, 150)
+                rate = budget * 0.2
+                if (slo.name, t) in spiking and end / 2 <= ts < end / 2 + 1800:
+                    rate = min(1.0, budget * 40)
+                bad = sum(1 for _ in range(3) if rng.random() < rate * total / 3)
+                yield "point", slo.name, (f"tenant-{t:04d}",), ts + rng.random() * step, bad, total
+        if (ts + step) % tick == 0:
+            yield "tick", ts + step
+
+
+def run(evaluator, events):
+    observe = evaluator.observe
+    changes = []
+    observe_time = tick_time = 0.0
+    points = ticks = 0
+    for event in events:
+        if event[0] == "point":
+            start = time.perf_counter()
+            observe(event[1], event[3], event[4], event[5], event[2])
+            observe_time += time.perf_counter() - start
+            points += 1
+        else:
+            start = time.perf_counter()
+            changes.extend((c.slo, c.labels, c.token, c.firing, c.at) for c in evaluator.evaluate(event[1]))
+            tick_time += time.perf_counter() - start
+            ticks += 1
+    return points, ticks, observe_time, tick_time, changes
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark streaming SLO burn-rate evaluation.")
+    parser.add_argument("--tenants", type=int, default=300, help="instances per SLO")
+    parser.add_argument("--rescan-tenants", type=int, default=20, help="instances per SLO for the rescan baseline")
+    parser.add_argument("--hours", type=int, default=2, help="simulated duration")
+    parser.add_argument("--step", type=int, default=10, help="seconds between points of one instance")
+    parser.add_argument("--tick", type=int, default=30, help="seconds between evaluations")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args(argv)
+
+    catalog = load_catalog()
+    slos = list(BurnRateEvaluator.from_catalog(catalog).slos.values())
+
+    small = BurnRateEvaluator.from_catalog(catalog)
+    reference = Rescan(small)
+    events = list(stream(slos, args.rescan_tenants, args.hours, args.step, args.tick, args.seed))
+    _, _, _, _, ring_changes = run(small, events)
+    _, ticks, _, rescan_tick, rescan_changes = run(reference, events)
+    agree = ring_changes == rescan_changes
+    scale = args.tenants / args.rescan_tenants
+    print(f"rescan   {len(reference.points):6,} instances  {rescan_tick / ticks * 1000:9.2f} ms/tick "
+          f"(~{rescan_tick / ticks * 1000 * scale:,.0f} ms/tick at {len(slos) * args.tenants:,} instances)")
+
+    evaluator = BurnRateEvaluator.from_catalog(catalog)
+    points, ticks, observe_time, tick_time, changes = run(
+        evaluator, stream(slos, args.tenants, args.hours, args.step, args.tick, args.seed))
+    fired = sum(1 for change in changes if change[3])
+    print(f"rings    {len(evaluator.instances):6,} instances  {tick_time / ticks * 1000:9.2f} ms/tick  "
+          f"{points / observe_time:,.0f} points/s observed  ({points:,} points, {ticks} ticks, {fired} alerts fired)")
+    print(f"rescan and rings agree on {len(ring_changes)} transitions: {agree}")
+    return 0 if agree else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,328 @@
+"""Read-only binary catalog that worker processes can mmap and share.
+
+generate_ssot.py writes governance/definitions/catalog.gcat next to the CSVs. The
+file holds every table as fixed-width records of string ids, one deduplicated
+string table, and an open-addressing hash index per table over its natural key.
+`BinaryCatalog` maps the file read-only and reads it through memoryview casts, so
+opening it costs a few struct reads and every process shares the same page-cache
+copy instead of holding its own parsed dicts.
+
+Layout (little-endian, every section 4-byte aligned):
+    header     magic "GCAT", version u16, reserved u16, table_count, string_count,
+               string_offsets_off, string_data_off, string_data_size, directory_off
+    directory  per table: name_id, column_count, row_count, columns_off, records_off,
+               key_count, key_columns_off, index_slots, index_off            (9 x u32)
+    strings    string_count + 1 u32 offsets into the UTF-8 string data
+    records    row_count x column_count u32 string ids per table
+    index      index_slots u32 per table: row + 1, 0 = empty; linear probing on
+               crc32 of the key columns joined with 0x1f
+
+Usage (from the repo root):
+    python3 governance/scripts/binary_catalog.py                       # summary of catalog.gcat
+    python3 governance/scripts/binary_catalog.py SignalCatalog.csv ERROR_RATE
+"""
+import argparse
+import mmap
+import struct
+import sys
+import zlib
+from array import array
+from pathlib import Path
+
+from catalog import KEY_COLUMNS, key_columns
+from decision_matrix import parse_condition
+from ssot_pipeline import atomic_write
+
+# Paths
+definitions_dir = Path("governance/definitions")
+catalog_file = "catalog.gcat"
+
+MAGIC = b"GCAT"
+VERSION = 1
+HEADER = struct.Struct("<4sHHIIIIII")
+DIRECTORY_ENTRY = struct.Struct("<9I")
+KEY_SEPARATOR = b"\x1f"
+
+
+def key_bytes(values):
+    return KEY_SEPARATOR.join(value.encode("utf-8") for value in values)
+
+
+def _pad(buffer):
+    buffer.extend(b"\0" * (-len(buffer) % 4))
+
+
+def encode_catalog(tables):
+    """`tables` is {name: (columns, rows)}; returns the catalog file as bytes."""
+    strings = {}
+
+    def string_id(value):
+        sid = strings.get(value)
+        if sid is None:
+            sid = strings[value] = len(strings)
+        return sid
+
+    encoded = []
+    for name in sorted(tables):
+        columns, rows = tables[name]
+        key_positions = [list(columns).index(column) for column in key_columns(name, columns)]
+        ids = array("I")
+        for row in rows:
+            if len(row) != len(columns):
+                raise ValueError(f"{name}: row {row!r} does not have {len(columns)} fields")
+            ids.extend(string_id(str(value)) for value in row)
+        slots = 1
+        while slots < 2 * len(rows):
+            slots <<= 1
+        index = array("I", [0]) * slots
+        for r, row in enumerate(rows):
+            slot = zlib.crc32(key_bytes(str(row[k]) for k in key_positions)) & (slots - 1)
+            while index[slot]:
+                slot = (slot + 1) & (slots - 1)
+            index[slot] = r + 1
+        encoded.append((string_id(name), array("I", map(string_id, columns)), len(rows), ids,
+                        array("I", key_positions), index))
+
+    data = bytearray()
+    offsets = array("I", [0])
+    for value in strings:  # dicts keep insertion order == id order
+        data.extend(value.encode("utf-8"))
+        offsets.append(len(data))
+
+    out = bytearray(HEADER.size)
+    directory_off = len(out)
+    out.extend(b"\0" * (DIRECTORY_ENTRY.size * len(encoded)))
+    string_offsets_off = len(out)
+    out.extend(_le(offsets))
+    string_data_off = len(out)
+    out.extend(data)
+    _pad(out)
+    for t, (name_id, columns, row_count, ids, key_positions, index) in enumerate(encoded):
+        columns_off = len(out)
+        out.extend(_le(columns))
+        records_off = len(out)
+        out.extend(_le(ids))
+        key_columns_off = len(out)
+        out.extend(_le(key_positions))
+        index_off = len(out)
+        out.extend(_le(index))
+        DIRECTORY_ENTRY.pack_into(out, directory_off + t * DIRECTORY_ENTRY.size,
+                                  name_id, len(columns), row_count, columns_off, records_off,
+                                  len(key_positions), key_columns_off, len(index), index_off)
+    HEADER.pack_into(out, 0, MAGIC, VERSION, 0, len(encoded), len(strings),
+                     string_offsets_off, string_data_off, len(data), directory_off)
+    return bytes(out)
+
+
+def _le(values):
+    if sys.byteorder != "little":
+        values = array("I", values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def catalog_document(tables):
+    """Pipeline value for catalog.gcat: the layout settings are part of its digest."""
+    return {
+        "version": VERSION,
+        "keys": {name: list(KEY_COLUMNS[name]) for name in sorted(KEY_COLUMNS)},
+        "tables": {name: (list(columns), [list(row) for row in rows]) for name, (columns, rows) in tables.items()},
+    }
+
+
+def write_catalog(path, document):
+    data = encode_catalog(document["tables"])
+    atomic_write(path, lambda f: f.write(data), mode="wb")
+
+
+class BinaryTable:
+    def __init__(self, catalog, name, columns, row_count, records, key_positions, index):
+        self.catalog = catalog
+        self.name = name
+        self.columns = columns
+        self._width = len(columns)
+        self._rows = row_count
+        self._records = records
+        self._key_positions = key_positions
+        self._index = index
+        self._mask = len(index) - 1
+
+    def __len__(self):
+        return self._rows
+
+    def __iter__(self):
+        return (self.row(r) for r in range(self._rows))
+
+    def field(self, row, column):
+        return self.catalog.string(self._records[row * self._width + column])
+
+    def row(self, row):
+        base = row * self._width
+        string = self.catalog.string
+        return tuple(string(sid) for sid in self._records[base:base + self._width])
+
+    def record(self, row):
+        return dict(zip(self.columns, self.row(row)))
+
+    def _rows_for(self, key):
+        """Row numbers whose key columns equal `key` (a string or a tuple of strings)."""
+        values = (key,) if isinstance(key, str) else tuple(key)
+        wanted = key_bytes(values)
+        raw = self.catalog.raw_string
+        records, width, positions = self._records, self._width, self._key_positions
+        slot = zlib.crc32(wanted) & self._mask
+        while True:
+            entry = self._index[slot]
+            if not entry:
+                return
+            base = (entry - 1) * width
+            if KEY_SEPARATOR.join(raw(records[base + k]) for k in positions) == wanted:
+                yield entry - 1
+            slot = (slot + 1) & self._mask
+
+    def find(self, key):
+        return [self.row(r) for r in self._rows_for(key)]
+
+    def get(self, key):
+        for r in self._rows_for(key):
+            return self.row(r)
+        return None
+
+    def __contains__(self, key):
+        return next(self._rows_for(key), None) is not None
+
+
+class BinaryCatalog:
+    """Zero-copy view of catalog.gcat; `close()` (or `with`) releases the mapping."""
+
+    def __init__(self, path=None):
+        self.path = Path(path or definitions_dir / catalog_file)
+        with open(self.path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mmap)
+        (magic, version, _, table_count, string_count, string_offsets_off,
+         string_data_off, string_data_size, directory_off) = HEADER.unpack_from(self._view, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"{self.path} is not a v{VERSION} governance catalog")
+        self._views = []
+        self._offsets = self._u32(string_offsets_off, string_count + 1)
+        self._data = self._view[string_data_off:string_data_off + string_data_size]
+        self._strings = {}
+        self.tables = {}
+        for t in range(table_count):
+            (name_id, column_count, row_count, columns_off, records_off, key_count,
+             key_columns_off, index_slots, index_off) = DIRECTORY_ENTRY.unpack_from(
+                self._view, directory_off + t * DIRECTORY_ENTRY.size)
+            name = self.string(name_id)
+            columns = tuple(self.string(sid) for sid in self._u32(columns_off, column_count))
+            self.tables[name] = BinaryTable(
+                self, name, columns, row_count,
+                self._u32(records_off, row_count * column_count),
+                tuple(self._u32(key_columns_off, key_count)),
+                self._u32(index_off, index_slots),
+            )
+
+    def _u32(self, offset, count):
+        view = self._view[offset:offset + 4 * count]
+        if sys.byteorder != "little":
+            values = array("I", view.tobytes())
+            values.byteswap()
+            return values
+        view = view.cast("I")
+        self._views.append(view)
+        return view
+
+    def raw_string(self, sid):
+        return self._data[self._offsets[sid]:self._offsets[sid + 1]]
+
+    def string(self, sid):
+        value = self._strings.get(sid)
+        if value is None:
+            value = self._strings[sid] = str(self.raw_string(sid), "utf-8")
+        return value
+
+    def table(self, name):
+        return self.tables[name]
+
+    def close(self):
+        for view in getattr(self, "_views", ()):
+            view.release()
+        for view in ("_data", "_view"):
+            if getattr(self, view, None) is not None:
+                getattr(self, view).release()
+        self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class EventValidator:
+    """TelemetryEvent checks (prefix, scope, descriptor-in-scope, ROOT_COMPATIBLE) off the mmap."""
+
+    def __init__(self, catalog):
+        self.prefixes = catalog.table("OfficialPrefixRegistry.csv")
+        self.roots = catalog.table("RootNamespaceMap.csv")
+        self.matrix = catalog.table("RootPrefixFamilyMatrix.csv")
+        self.descriptors = catalog.table("DescriptorCatalog.csv")
+        self.signals = catalog.table("SignalCatalog.csv")
+        self._decision = self.matrix.columns.index("decision")
+        self._condition = self.matrix.columns.index("condition")
+        descriptor = self.descriptors.columns.index("descriptor")
+        self._catalogued = frozenset(self.descriptors.field(r, descriptor) for r in range(len(self.descriptors)))
+        self._allowed_areas = self.signals.columns.index("allowed_areas")
+        self._allowed_roots = self.prefixes.columns.index("allowed_roots")
+
+    def root_compatible(self, scope, prefix):
+        # The matrix cell and the prefix's own allowed_roots must both admit the scope (as in naming_lint).
+        prefix_row = self.prefixes.get(prefix)
+        if prefix_row is None or scope not in prefix_row[self._allowed_roots].split("|"):
+            return False
+        row = self.matrix.get((scope, prefix.split("-")[0]))
+        if row is None:
+            return False
+        if row[self._decision] == "CONDITIONAL":
+            return prefix in parse_condition(row[self._condition])
+        return row[self._decision] == "ALLOW"
+
+    def descriptor_in_scope(self, scope, descriptor):
+        # Catalogued descriptors are valid in their own area and, when they are also
+        # signals, in every area the SignalCatalog allows (same rule as generate_sdk.py).
+        if (scope, descriptor) in self.descriptors:
+            return True
+        if descriptor not in self._catalogued:
+            return False
+        signal = self.signals.get(descriptor)
+        return signal is not None and scope in signal[self._allowed_areas].split("|")
+
+    def validate(self, prefix, scope, descriptor):
+        return (prefix in self.prefixes and scope in self.roots
+                and self.root_compatible(scope, prefix)
+                and self.descriptor_in_scope(scope, descriptor))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Inspect or query the binary governance catalog.")
+    parser.add_argument("table", nargs="?", help="table to query, e.g. SignalCatalog.csv")
+    parser.add_argument("key", nargs="*", help="natural key value(s)")
+    parser.add_argument("--catalog", default=str(definitions_dir / catalog_file), help="catalog.gcat path")
+    args = parser.parse_args(argv)
+
+    with BinaryCatalog(args.catalog) as catalog:
+        if not args.table:
+            print(f"{catalog.path}: {catalog.path.stat().st_size} bytes, {len(catalog.tables)} tables")
+            for name, table in catalog.tables.items():
+                key = ",".join(table.columns[k] for k in table._key_positions)
+                print(f"  {name:36} {len(table):5} rows  key={key}")
+            return 0
+        table = catalog.table(args.table)
+        rows = table.find(tuple(args.key)) if args.key else list(table)
+        for row in rows:
+            print(dict(zip(table.columns, row)))
+        return 0 if rows else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,135 @@
+"""Reproducible, content-addressed governance bundle.
+
+`system_tables_bundle.zip` is written with sorted members, a fixed timestamp,
+fixed permissions and a fixed deflate level, so identical tables always give
+identical bytes. `bundle_manifest.json` records the sha256 of every table (over
+the uncompressed CSV bytes) and of the zip, plus a content-addressed file name
+for each, e.g. `SignalCatalog.3f1c9a0b2d4e5f67.csv`.
+
+`publish` copies those content-addressed files into a deploy directory, where
+they can be cached forever; only the manifest needs revalidation.
+
+Usage (from the repo root):
+    python3 governance/scripts/bundle.py build             # rebuild zip + manifest from the CSVs
+    python3 governance/scripts/bundle.py publish dist/governance
+"""
+import argparse
+import hashlib
+import json
+import shutil
+import sys
+import zipfile
+from pathlib import Path
+
+from ssot_pipeline import atomic_write, write_json
+
+# Paths
+base_dir = Path("governance")
+definitions_dir = base_dir / "definitions"
+zip_path = base_dir / "system_tables_bundle.zip"
+manifest_path = base_dir / "bundle_manifest.json"
+
+FORMAT = "governance-bundle/v1"
+ZIP_EPOCH = (1980, 1, 1, 0, 0, 0)  # earliest timestamp the zip format can store
+ZIP_FILE_MODE = 0o100644 << 16
+COMPRESS_LEVEL = 9
+DIGEST_CHARS = 16
+
+
+def sha256(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def addressed_name(name, digest):
+    path = Path(name)
+    return f"{path.stem}.{digest[:DIGEST_CHARS]}{path.suffix}"
+
+
+def write_zip(path, members):
+    """Write `members` ({arcname: bytes}) deterministically to `path`."""
+    def write(f):
+        with zipfile.ZipFile(f, "w") as z:
+            for name in sorted(members):
+                info = zipfile.ZipInfo(name, date_time=ZIP_EPOCH)
+                info.compress_type = zipfile.ZIP_DEFLATED
+                info.create_system = 3
+                info.external_attr = ZIP_FILE_MODE
+                z.writestr(info, members[name], compresslevel=COMPRESS_LEVEL)
+    atomic_write(path, write, mode="wb")
+
+
+def build_manifest(members, bundle_bytes):
+    bundle_digest = sha256(bundle_bytes)
+    tables = {}
+    for name in sorted(members):
+        digest = sha256(members[name])
+        tables[name] = {"sha256": digest, "bytes": len(members[name]), "file": addressed_name(name, digest)}
+    return {
+        "format": FORMAT,
+        "bundle": {
+            "sha256": bundle_digest,
+            "bytes": len(bundle_bytes),
+            "file": addressed_name(zip_path.name, bundle_digest),
+        },
+        "tables": tables,
+    }
+
+
+def write_bundle(table_names, source_dir=definitions_dir):
+    members = {name: (Path(source_dir) / name).read_bytes() for name in table_names}
+    write_zip(zip_path, members)
+    manifest = build_manifest(members, zip_path.read_bytes())
+    write_json(manifest_path, manifest, sort_keys=True)
+    return manifest
+
+
+def load_manifest(path=manifest_path):
+    with open(path, "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+    if manifest.get("format") != FORMAT:
+        raise ValueError(f"Unsupported bundle manifest format: {manifest.get('format')!r}")
+    return manifest
+
+
+def publish(target_dir, source_dir=definitions_dir):
+    """Copy content-addressed tables + bundle and the manifest into `target_dir`."""
+    manifest = load_manifest()
+    tables_dir = Path(target_dir) / "tables"
+    tables_dir.mkdir(parents=True, exist_ok=True)
+    copied = 0
+    for name, entry in manifest["tables"].items():
+        source = Path(source_dir) / name
+        if sha256(source.read_bytes()) != entry["sha256"]:
+            raise ValueError(f"{name} does not match bundle_manifest.json; regenerate the bundle first")
+        target = tables_dir / entry["file"]
+        if not target.exists():
+            shutil.copyfile(source, target)
+            copied += 1
+    bundle_target = tables_dir / manifest["bundle"]["file"]
+    if not bundle_target.exists():
+        shutil.copyfile(zip_path, bundle_target)
+        copied += 1
+    shutil.copyfile(manifest_path, Path(target_dir) / "manifest.json")
+    return copied
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build or publish the governance bundle.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("build", help="rebuild the zip and manifest from governance/definitions")
+    publish_parser = sub.add_parser("publish", help="copy content-addressed files into a deploy directory")
+    publish_parser.add_argument("target", help="e.g. dist/governance")
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        names = sorted(p.name for p in definitions_dir.glob("*.csv"))
+        manifest = write_bundle(names)
+        print(f"Created zip bundle at {zip_path} ({manifest['bundle']['sha256'][:DIGEST_CHARS]})")
+    else:
+        copied = publish(args.target)
+        print(f"Published governance bundle to {args.target} ({copied} new files)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,336 @@
+"""Semantic diff of two governance bundles, read straight from the zip members.
+
+Rows are matched by each table's natural key (catalog.key_columns: the first
+column, or e.g. root + prefix_family for the matrix) and reported as added,
+removed or modified, with the changed fields. Tables whose member has the same
+CRC-32 and size in both zips are skipped without being decompressed.
+
+Changes that can invalidate names, events or rows that were valid under the old
+bundle are flagged SCHEMA_BREAKING_CHANGE:
+
+    removed      a table, a column, or a keyed row (NamingTestSuite cases aside)
+    narrowed     an allowed_*/allow_*/applies_to list loses an item, or a
+                 CONDITIONAL cell's allowlist does; allowed_roots ALL and
+                 ALL_RUNTIME are expanded against each bundle's roots and
+                 prefix registries first, as naming_lint does, and roots the new
+                 bundle no longer defines are left to RootNamespaceMap's diff
+    widened      a denied_*/deny_*/required_* list gains an item
+    tightened    decision ALLOW -> CONDITIONAL -> DENY, severity
+                 INFO -> WARN -> ERROR, nullable YES -> NO
+    retyped      a schema column's data_type changes (an ENUM only gaining
+                 values is fine), or a binding column such as a descriptor's
+                 area or a signal's unit_type changes
+
+Memory stays bounded: a table whose old rows would not fit in --memory-mb is
+first split by key hash into partition files in a temporary directory, sized so
+that one partition's old rows do, and the partitions are diffed one at a time.
+Each member is read once and each row written and read back at most once, so
+the time is linear in the table size; a table within the budget is diffed
+straight from the zip in a single pass.
+
+Output is one line per change, or JSON lines with --json. Exits 1 when any
+change is breaking.
+
+Usage (from the repo root):
+    python3 governance/scripts/bundle_diff.py old_bundle.zip governance/system_tables_bundle.zip
+    python3 governance/scripts/bundle_diff.py HEAD~1:governance/system_tables_bundle.zip governance/system_tables_bundle.zip --json
+"""
+import argparse
+import csv
+import io
+import json
+import subprocess
+import sys
+import tempfile
+import zipfile
+import zlib
+from collections import Counter, namedtuple
+from contextlib import ExitStack, contextmanager
+from pathlib import Path
+
+from catalog import key_columns
+from decision_matrix import parse_condition
+
+BREAKING = "SCHEMA_BREAKING_CHANGE"
+DEFAULT_MEMORY_MB = 256
+# Parsed rows cost several times their CSV bytes (tuple + str objects + dict slot).
+ROW_OVERHEAD = 8
+
+# Tables whose rows may be dropped freely.
+REMOVABLE_ROWS = frozenset({"NamingTestSuite.csv"})
+# `|`-list columns by prefix: losing an item (allow lists) or gaining one (deny/required lists) breaks.
+NARROWING_PREFIXES = ("allowed_", "allow_", "applies_to")
+WIDENING_PREFIXES = ("denied_", "deny_", "required_")
+# Ordered values; moving right breaks.
+TIGHTENING = {
+    "decision": ("ALLOW", "CONDITIONAL", "DENY"),
+    "severity": ("INFO", "WARN", "ERROR"),
+    "nullable": ("YES", "NO"),
+}
+# Columns that bind a row to another catalog entry; any change breaks.
+BINDING_COLUMNS = frozenset({"area", "family", "unit_type", "token_category", "signal", "sli_signal", "target_type",
+                             "window", "naming_pattern", "prefix_family"})
+
+Change = namedtuple("Change", ["table", "kind", "key", "fields", "breaking"])
+# What allowed_roots ALL / ALL_RUNTIME mean in one bundle: its RootNamespaceMap roots, and
+# the allowed_roots of each prefix in its Official/ExtendedPrefixRegistry.
+RootScope = namedtuple("RootScope", ["roots", "prefix_roots"])
+PREFIX_REGISTRIES = ("OfficialPrefixRegistry.csv", "ExtendedPrefixRegistry.csv")
+
+
+def split_list(value):
+    return [item for item in (value or "").split("|") if item]
+
+
+def key_hash(key):
+    return zlib.crc32("\x1f".join(key).encode("utf-8"))
+
+
+# --- Breaking-change rules ---
+
+def enum_values(data_type):
+    if data_type.startswith("ENUM(") and data_type.endswith(")"):
+        return set(split_list(data_type[5:-1]))
+    return None
+
+
+def expand_roots(value, row, scope):
+    """allowed_roots items of `row`, with ALL / ALL_RUNTIME expanded as NamingLinter._expand_roots does."""
+    if value == "ALL":
+        return scope.roots
+    if value == "ALL_RUNTIME":
+        roots = set()
+        for prefix in split_list(row.get("allowed_prefixes")):
+            roots.update(split_list(scope.prefix_roots.get(prefix)))
+        return frozenset(roots)
+    return frozenset(split_list(value))
+
+
+def breaking_fields(table, fields, old_row=None, new_row=None, scopes=None):
+    """Reasons the field changes {column: (old, new)} of one row break consumers.
+
+    With the full rows and the (old, new) RootScopes, allowed_roots is compared as
+    the roots it expands to rather than item by item.
+    """
+    reasons = []
+    for column, (old, new) in fields.items():
+        if column == "allowed_roots" and scopes is not None:
+            old_scope, new_scope = scopes
+            kept = expand_roots(new, new_row, new_scope)
+            lost = sorted(root for root in expand_roots(old, old_row, old_scope) - kept
+                          if root in new_scope.roots or not new_scope.roots)
+            if lost:
+                reasons.append(f"{column} lost {'|'.join(lost)}")
+        elif column.startswith(NARROWING_PREFIXES):
+            lost = [item for item in split_list(old) if item not in split_list(new)]
+            if lost:
+                reasons.append(f"{column} lost {'|'.join(lost)}")
+        elif column.startswith(WIDENING_PREFIXES):
+            gained = [item for item in split_list(new) if item not in split_list(old)]
+            if gained:
+                reasons.append(f"{column} gained {'|'.join(gained)}")
+        elif column in TIGHTENING:
+            order = TIGHTENING[column]
+            if old in order and new in order and order.index(new) > order.index(old):
+                reasons.append(f"{column} {old}->{new}")
+        elif column == "condition":
+            lost = [item for item in parse_condition(old) if item not in parse_condition(new)]
+            if lost:
+                reasons.append(f"condition lost {'|'.join(lost)}")
+        elif column == "data_type":
+            before, after = enum_values(old), enum_values(new)
+            if before is None or after is None or not before <= after:
+                reasons.append(f"data_type {old}->{new}")
+        elif column in BINDING_COLUMNS:
+            reasons.append(f"{column} {old}->{new}")
+    return reasons
+
+
+# --- Reading ---
+
+def open_bundle(spec):
+    """A ZipFile for a path, or for `REV:PATH` read from git without touching the work tree."""
+    path = Path(spec)
+    if not path.exists() and ":" in spec:
+        data = subprocess.run(["git", "show", spec], capture_output=True, check=True).stdout
+        return zipfile.ZipFile(io.BytesIO(data))
+    return zipfile.ZipFile(path)
+
+
+@contextmanager
+def read_member(bundle, name):
+    """(columns, row iterator) streamed from the member, short rows padded."""
+    with io.TextIOWrapper(bundle.open(name), encoding="utf-8", newline="") as stream:
+        reader = csv.reader(stream)
+        columns = tuple(next(reader, ()))
+        yield columns, (tuple(row) + ("",) * (len(columns) - len(row)) for row in reader if row)
+
+
+def root_scope(bundle):
+    """The bundle's RootScope; tables it lacks leave that part empty."""
+    members = set(bundle.namelist())
+    roots, prefix_roots = frozenset(), {}
+    if "RootNamespaceMap.csv" in members:
+        with read_member(bundle, "RootNamespaceMap.csv") as (_, rows):
+            roots = frozenset(row[0] for row in rows)
+    for name in PREFIX_REGISTRIES:
+        if name in members:
+            with read_member(bundle, name) as (columns, rows):
+                if "allowed_roots" in columns:
+                    position = columns.index("allowed_roots")
+                    prefix_roots.update((row[0], row[position]) for row in rows)
+    return RootScope(roots, prefix_roots)
+
+
+def keyed_rows(columns, rows, key):
+    """(key values, {column: value}) for each row.
+
+    A key seen again gets an occurrence number appended, so duplicate keys pair up in
+    file order instead of overwriting each other.
+    """
+    positions = [columns.index(column) for column in key]
+    seen = Counter()
+    for row in rows:
+        values = tuple(row[k] for k in positions)
+        seen[values] += 1
+        if seen[values] > 1:
+            values += (f"#{seen[values]}",)
+        yield values, dict(zip(columns, row))
+
+
+def spill(bundle, name, key, partitions, directory, tag):
+    """Split the member's rows into `partitions` files by key hash, keeping file order."""
+    paths = [Path(directory) / f"{tag}.{partition}.csv" for partition in range(partitions)]
+    with read_member(bundle, name) as (columns, rows), ExitStack() as stack:
+        positions = [columns.index(column) for column in key]
+        writers = [csv.writer(stack.enter_context(open(path, "w", encoding="utf-8", newline="")))
+                   for path in paths]
+        for row in rows:
+            writers[key_hash(tuple(row[k] for k in positions)) % partitions].writerow(row)
+    return paths
+
+
+@contextmanager
+def read_spilled(path):
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        yield (tuple(row) for row in csv.reader(f))
+
+
+# --- Diff ---
+
+def diff_table(old, new, name, memory_mb=DEFAULT_MEMORY_MB, scopes=None):
+    """Changes between the `name` members of two open bundles, yielded as they are found.
+
+    `scopes` is the (old, new) RootScope pair; it is read from the bundles if not given.
+    """
+    if scopes is None:
+        scopes = (root_scope(old), root_scope(new))
+    with read_member(old, name) as (old_columns, _), read_member(new, name) as (new_columns, _):
+        pass
+    old_key, new_key = key_columns(name, old_columns), key_columns(name, new_columns)
+
+    dropped = [column for column in old_columns if column not in new_columns]
+    added = [column for column in new_columns if column not in old_columns]
+    if dropped or added:
+        yield Change(name, "columns", (), {"removed": dropped, "added": added},
+                     [f"column {column} removed" for column in dropped])
+    if old_key != new_key:
+        yield Change(name, "columns", (), {"key": [list(old_key), list(new_key)]},
+                     [f"natural key {'+'.join(old_key)} -> {'+'.join(new_key)}"])
+    key = new_key
+    if not set(key) <= set(old_columns) or not set(key) <= set(new_columns):
+        return  # rows cannot be matched; the column change above already says why
+
+    budget = memory_mb << 20
+    partitions = max(1, -(-old.getinfo(name).file_size * ROW_OVERHEAD // budget))
+    if partitions == 1:
+        with read_member(old, name) as (_, before), read_member(new, name) as (_, after):
+            yield from diff_rows(name, key, old_columns, before, new_columns, after, scopes)
+        return
+    with tempfile.TemporaryDirectory(prefix="bundle_diff.") as directory:
+        pairs = zip(spill(old, name, key, partitions, directory, "old"),
+                    spill(new, name, key, partitions, directory, "new"))
+        for old_path, new_path in pairs:
+            with read_spilled(old_path) as before, read_spilled(new_path) as after:
+                yield from diff_rows(name, key, old_columns, before, new_columns, after, scopes)
+
+
+def diff_rows(name, key, old_columns, before, new_columns, after, scopes=None):
+    """Changes between two row streams holding the same keys; only `before` is held in memory."""
+    common = [column for column in new_columns if column in old_columns]
+    held = dict(keyed_rows(old_columns, before, key))
+    for values, row in keyed_rows(new_columns, after, key):
+        previous = held.pop(values, None)
+        if previous is None:
+            yield Change(name, "added", values, row, [])
+            continue
+        fields = {column: (previous[column], row[column]) for column in common
+                  if previous[column] != row[column]}
+        if fields:
+            yield Change(name, "modified", values, fields, breaking_fields(name, fields, previous, row, scopes))
+    for values, row in held.items():
+        reasons = [] if name in REMOVABLE_ROWS else [f"{'+'.join(key)} {'|'.join(values)} removed"]
+        yield Change(name, "removed", values, row, reasons)
+
+
+def diff_bundles(old, new, memory_mb=DEFAULT_MEMORY_MB):
+    """Changes between two open bundles, table by table in name order."""
+    old_members = {info.filename: info for info in old.infolist()}
+    new_members = {info.filename: info for info in new.infolist()}
+    scopes = (root_scope(old), root_scope(new))
+    for name in sorted(old_members.keys() | new_members.keys()):
+        if name not in new_members:
+            yield Change(name, "table_removed", (), {}, [f"table {name} removed"])
+        elif name not in old_members:
+            yield Change(name, "table_added", (), {}, [])
+        elif (old_members[name].CRC, old_members[name].file_size) != (new_members[name].CRC,
+                                                                       new_members[name].file_size):
+            yield from diff_table(old, new, name, memory_mb, scopes)
+
+
+# --- CLI ---
+
+def describe(change):
+    key = "|".join(change.key)
+    if change.kind == "modified":
+        detail = "  ".join(f"{column}: {old!r} -> {new!r}" for column, (old, new) in change.fields.items())
+    elif change.kind == "columns":
+        detail = "  ".join(f"{part}: {value}" for part, value in change.fields.items() if value)
+    else:
+        detail = ""
+    mark = {"added": "+", "removed": "-", "modified": "~"}.get(change.kind, "*")
+    line = f"{mark} {change.table} {change.kind if mark == '*' else key}  {detail}".rstrip()
+    if change.breaking:
+        line += f"  {BREAKING} ({'; '.join(change.breaking)})"
+    return line
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Diff two governance bundles by natural key.")
+    parser.add_argument("old", help="old bundle zip (or REV:PATH)")
+    parser.add_argument("new", help="new bundle zip (or REV:PATH)")
+    parser.add_argument("--json", action="store_true", help="one JSON object per change")
+    parser.add_argument("--memory-mb", type=int, default=DEFAULT_MEMORY_MB,
+                        help="rows held per partition (larger tables take more passes)")
+    args = parser.parse_args(argv)
+    if args.memory_mb < 1:
+        parser.error("--memory-mb must be at least 1")
+
+    counts = Counter()
+    with open_bundle(args.old) as old, open_bundle(args.new) as new:
+        for change in diff_bundles(old, new, args.memory_mb):
+            counts[change.kind] += 1
+            counts[BREAKING] += bool(change.breaking)
+            if args.json:
+                print(json.dumps({"table": change.table, "kind": change.kind, "key": list(change.key),
+                                  "fields": change.fields, "breaking": change.breaking}))
+            else:
+                print(describe(change))
+    if not args.json:
+        summary = ", ".join(f"{counts[kind]} {kind}" for kind in ("added", "removed", "modified") if counts[kind])
+        print(f"{summary or 'no row changes'}; {counts[BREAKING]} breaking", file=sys.stderr)
+    return 1 if counts[BREAKING] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
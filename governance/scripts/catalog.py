@@ -0,0 +1,123 @@
+"""Shared loader for the governance catalogs with a cached parsed snapshot.
+
+Every generator and linter reads the same CSVs from governance/definitions.
+`load_catalog` parses them once and keeps a pickle snapshot (columns plus rows
+as tuples) in governance/.cache, keyed by the sha256 of each source file. Later
+runs hash the sources and unpickle the snapshot; only files whose hash changed
+(or that are new) are parsed again, and the snapshot is rewritten atomically.
+
+    catalog = load_catalog()                     # or load_catalog("path/to/definitions")
+    for row in catalog.records("SignalCatalog.csv"):
+        row['signal'], row['allowed_areas']
+
+`records` returns csv.DictReader-style dicts, so existing `read_csv` callers can
+switch over unchanged.
+"""
+import csv
+import hashlib
+import io
+import pickle
+import sys
+from pathlib import Path
+
+from ssot_pipeline import atomic_write
+
+# Paths
+definitions_dir = Path("governance/definitions")
+cache_dir = Path("governance/.cache")
+
+# Bump when the snapshot layout changes; the interpreter version is part of the key too.
+SNAPSHOT_VERSION = 1
+
+# Natural key per table; tables not listed are keyed by their first column.
+KEY_COLUMNS = {
+    "DescriptorCatalog.csv": ("area", "descriptor"),
+    "RootPrefixFamilyMatrix.csv": ("root", "prefix_family"),
+    "NamingTestSuite.csv": ("example_name",),
+}
+
+
+def key_columns(filename, columns):
+    return tuple(KEY_COLUMNS.get(filename, tuple(columns)[:1]))
+
+
+class Catalog:
+    def __init__(self, source_dir, tables):
+        self.source_dir = Path(source_dir)
+        self._tables = tables  # filename -> (columns, rows)
+
+    def __contains__(self, filename):
+        return filename in self._tables
+
+    @property
+    def filenames(self):
+        return sorted(self._tables)
+
+    def columns(self, filename):
+        return self._tables[filename][0]
+
+    def rows(self, filename):
+        """Rows as tuples in column order (cheapest access)."""
+        return self._tables[filename][1]
+
+    def records(self, filename):
+        """Rows as dicts keyed by column, like csv.DictReader; [] with a warning if missing."""
+        if filename not in self._tables:
+            print(f"Warning: {filename} not found.")
+            return []
+        columns, rows = self._tables[filename]
+        return [dict(zip(columns, row)) for row in rows]
+
+
+def parse_csv(data):
+    reader = csv.reader(io.StringIO(data.decode("utf-8"), newline=""))
+    columns = tuple(next(reader, ()))
+    # Pad short rows the way DictReader fills missing fields.
+    rows = [tuple(row) + ("",) * (len(columns) - len(row)) if len(row) < len(columns) else tuple(row)
+            for row in reader if row]
+    return columns, rows
+
+
+def snapshot_path(source_dir):
+    key = hashlib.sha256(str(Path(source_dir).resolve()).encode("utf-8")).hexdigest()[:16]
+    return cache_dir / f"catalog-{key}.pickle"
+
+
+def _read_snapshot(path):
+    try:
+        with open(path, "rb") as f:
+            snapshot = pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ValueError):
+        return {}
+    if snapshot.get("version") != (SNAPSHOT_VERSION, sys.version_info[:2]):
+        return {}
+    return snapshot.get("tables", {})
+
+
+def load_catalog(source_dir=None, use_cache=True):
+    """Parsed catalog for every CSV in `source_dir`, reusing the snapshot where hashes match."""
+    source_dir = Path(source_dir or definitions_dir)
+    path = snapshot_path(source_dir)
+    cached = _read_snapshot(path) if use_cache else {}
+
+    entries = {}
+    changed = False
+    for source in sorted(source_dir.glob("*.csv")):
+        data = source.read_bytes()
+        digest = hashlib.sha256(data).hexdigest()
+        entry = cached.get(source.name)
+        if entry is None or entry[0] != digest:
+            entry = (digest, *parse_csv(data))
+            changed = True
+        entries[source.name] = entry
+    changed = changed or entries.keys() != cached.keys()
+
+    if use_cache and changed:
+        snapshot = {"version": (SNAPSHOT_VERSION, sys.version_info[:2]), "tables": entries}
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            atomic_write(path, lambda f: pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL), mode="wb")
+        except OSError as e:
+            print(f"Warning: could not write catalog snapshot {path}: {e}")
+
+    return Catalog(source_dir, {name: (columns, rows) for name, (_, columns, rows) in entries.items()})
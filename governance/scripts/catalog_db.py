@@ -0,0 +1,192 @@
+"""Indexed SQLite build of the governance catalog.
+
+generate_ssot.py writes governance/definitions/catalog.sqlite alongside the CSVs.
+Every CSV becomes a snake_case table (DescriptorCatalog.csv -> descriptor_catalog)
+with its natural key as PRIMARY KEY, plus the secondary indexes in INDEXES.
+`|`-separated list columns are normalised into child tables named
+<table>_<column> with (key..., value, position) and an index on value, so
+"signals allowed in OBS" is an index lookup:
+
+    SELECT signal FROM signal_catalog_allowed_areas WHERE value = 'OBS'
+
+The database is built in memory, ANALYZEd and written atomically, so it is
+rebuilt only when a table (or the schema below) changes.
+
+Usage (from the repo root):
+    python3 governance/scripts/catalog_db.py                  # list tables and indexes
+    python3 governance/scripts/catalog_db.py "SELECT descriptor FROM descriptor_catalog WHERE area = 'RAG'"
+    python3 governance/scripts/catalog_db.py --plan "SELECT ..."   # EXPLAIN QUERY PLAN
+"""
+import argparse
+import re
+import sqlite3
+import sys
+from pathlib import Path
+
+from catalog import KEY_COLUMNS, key_columns
+from ssot_pipeline import atomic_write
+
+# Paths
+definitions_dir = Path("governance/definitions")
+database_file = "catalog.sqlite"
+
+# Bump when the database layout changes so the artifact is rebuilt.
+SCHEMA_VERSION = 1
+PAGE_SIZE = 1024
+
+# `|`-separated columns normalised into <table>_<column>(key..., value, position).
+LIST_COLUMNS = {
+    "AlertTemplateCatalog.csv": ("required_tokens", "allowed_roots"),
+    "ArtifactTypeRules.csv": ("allowed_roots", "allowed_prefixes"),
+    "DescriptorCatalog.csv": ("allowed_types",),
+    "DescriptorFamilyRules.csv": ("allow_patterns", "deny_patterns"),
+    "ExtendedPrefixRegistry.csv": ("allowed_roots", "allowed_artifact_types", "allowed_descriptor_families", "dependencies"),
+    "OfficialPrefixRegistry.csv": ("allowed_roots", "allowed_artifact_types", "allowed_descriptor_families", "dependencies"),
+    "RootNamespaceMap.csv": ("allowed_prefix_families", "denied_prefix_families"),
+    "SignalCatalog.csv": ("allowed_areas", "allowed_threshold_tokens"),
+}
+
+# Secondary indexes on the main tables (the natural key is already the primary key).
+INDEXES = {
+    "AlertTemplateCatalog.csv": [("signal",)],
+    "DashboardCatalog.csv": [("area",)],
+    "DescriptorCatalog.csv": [("area", "family"), ("family",)],
+    "ExtendedPrefixRegistry.csv": [("primary_area",)],
+    "LintRuleCatalog.csv": [("severity",)],
+    "NamingTestSuite.csv": [("expected",)],
+    "OfficialPrefixRegistry.csv": [("primary_area",)],
+    "RootPrefixFamilyMatrix.csv": [("prefix_family", "decision")],
+    "SLOTemplateCatalog.csv": [("area",), ("sli_signal",)],
+    "ThresholdTokenCatalog.csv": [("token_category",)],
+}
+
+
+def table_name(filename):
+    """`SLOTemplateCatalog.csv` -> `slo_template_catalog`."""
+    stem = Path(filename).stem
+    return re.sub(r"(?<=[a-z0-9])(?=[A-Z])|(?<=[A-Z])(?=[A-Z][a-z])", "_", stem).lower()
+
+
+def quote(identifier):
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+def _columns_sql(columns):
+    return ", ".join(quote(column) for column in columns)
+
+
+def database_document(tables):
+    """Pipeline value for catalog.sqlite: the schema settings are part of its digest."""
+    return {
+        "version": SCHEMA_VERSION,
+        "page_size": PAGE_SIZE,
+        "keys": {name: list(KEY_COLUMNS[name]) for name in sorted(KEY_COLUMNS)},
+        "lists": {name: list(columns) for name, columns in sorted(LIST_COLUMNS.items())},
+        "indexes": {name: [list(index) for index in indexes] for name, indexes in sorted(INDEXES.items())},
+        "tables": {name: (list(columns), [list(row) for row in rows]) for name, (columns, rows) in tables.items()},
+    }
+
+
+def build_database(conn, tables):
+    """Create and fill every table, list table and index from `{filename: (columns, rows)}`."""
+    # ~70 tiny tables and indexes take a page each; small pages keep the file compact.
+    conn.execute(f"PRAGMA page_size = {PAGE_SIZE}")
+    for filename in sorted(tables):
+        columns, rows = tables[filename]
+        table = table_name(filename)
+        key = key_columns(filename, columns)
+        conn.execute(
+            f"CREATE TABLE {quote(table)} ("
+            + ", ".join(f"{quote(column)} TEXT NOT NULL" for column in columns)
+            + f", PRIMARY KEY ({_columns_sql(key)})) WITHOUT ROWID"
+        )
+        conn.executemany(
+            f"INSERT INTO {quote(table)} VALUES ({', '.join('?' * len(columns))})", rows
+        )
+        for index in INDEXES.get(filename, ()):
+            name = f"{table}_by_{'_'.join(index)}"
+            conn.execute(f"CREATE INDEX {quote(name)} ON {quote(table)} ({_columns_sql(index)})")
+
+        key_positions = [columns.index(column) for column in key]
+        for column in LIST_COLUMNS.get(filename, ()):
+            child = f"{table}_{column}"
+            position = columns.index(column)
+            conn.execute(
+                f"CREATE TABLE {quote(child)} ("
+                + ", ".join(f"{quote(k)} TEXT NOT NULL" for k in key)
+                + ", value TEXT NOT NULL, position INTEGER NOT NULL"
+                + f", PRIMARY KEY ({_columns_sql(key)}, value)"
+                + f", FOREIGN KEY ({_columns_sql(key)}) REFERENCES {quote(table)} ({_columns_sql(key)})"
+                + ") WITHOUT ROWID"
+            )
+            conn.executemany(
+                f"INSERT OR IGNORE INTO {quote(child)} VALUES ({', '.join('?' * (len(key) + 2))})",
+                (
+                    (*(row[k] for k in key_positions), value, i)
+                    for row in rows
+                    for i, value in enumerate(item for item in row[position].split("|") if item)
+                ),
+            )
+            conn.execute(f"CREATE INDEX {quote(child + '_by_value')} ON {quote(child)} (value, {_columns_sql(key)})")
+    conn.execute("ANALYZE")
+    conn.commit()
+
+
+def write_database(path, document):
+    conn = sqlite3.connect(":memory:")
+    try:
+        build_database(conn, document["tables"])
+        data = conn.serialize()
+    finally:
+        conn.close()
+    atomic_write(path, lambda f: f.write(data), mode="wb")
+
+
+def connect(path=None):
+    """Read-only connection to catalog.sqlite."""
+    path = Path(path or definitions_dir / database_file)
+    if not path.exists():
+        raise FileNotFoundError(f"{path} not found; run generate_ssot.py first")
+    return sqlite3.connect(f"{path.resolve().as_uri()}?mode=ro", uri=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Query the SQLite governance catalog.")
+    parser.add_argument("sql", nargs="?", help="query to run (default: list tables and indexes)")
+    parser.add_argument("--plan", action="store_true", help="print EXPLAIN QUERY PLAN instead of rows")
+    parser.add_argument("--db", default=str(definitions_dir / database_file), help="catalog.sqlite path")
+    args = parser.parse_args(argv)
+
+    conn = connect(args.db)
+    try:
+        if not args.sql:
+            objects = conn.execute(
+                "SELECT type, name, tbl_name FROM sqlite_master "
+                "WHERE name NOT LIKE 'sqlite_%' ORDER BY tbl_name, type DESC, name"
+            ).fetchall()
+            for kind, name, table in objects:
+                if kind == "table":
+                    count = conn.execute(f"SELECT COUNT(*) FROM {quote(name)}").fetchone()[0]
+                    print(f"{name:50} {count:5} rows")
+                else:
+                    print(f"  index {name}")
+            return 0
+        if args.plan:
+            for row in conn.execute(f"EXPLAIN QUERY PLAN {args.sql}"):
+                print(row[-1])
+            return 0
+        cursor = conn.execute(args.sql)
+        if cursor.description:
+            print("\t".join(column[0] for column in cursor.description))
+        for row in cursor:
+            print("\t".join(str(value) for value in row))
+        return 0
+    except sqlite3.Error as e:
+        print(f"Error: {e}")
+        return 1
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
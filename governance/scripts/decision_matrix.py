@@ -0,0 +1,91 @@
+"""Bit-packed root x prefix-family decision matrix.
+
+generate_ssot.py flattens `decision_map` into RootPrefixFamilyMatrix.csv rows; this
+module packs the same decisions densely (2 bits per cell, row-major by root) into
+RootPrefixFamilyMatrix.packed.json so a ROOT_COMPATIBLE check is one array index.
+CONDITIONAL cells keep their prefix allowlists in a side table keyed by cell index.
+generate_sdk.py embeds the same layout in src/lib/governance/core.ts.
+"""
+import base64
+
+matrix_file = "RootPrefixFamilyMatrix.packed.json"
+
+FORMAT = "root-family-matrix/v1"
+BITS_PER_CELL = 2
+# DENY is 0 so unknown or padding cells are deny-by-default.
+CODES = {"DENY": 0, "ALLOW": 1, "CONDITIONAL": 2}
+DECISIONS = {code: decision for decision, code in CODES.items()}
+
+_ALLOWLIST_MARKER = "ALLOW only "
+
+
+def parse_condition(condition):
+    """`"ALLOW only RAG-CTXASM|RAG-CITE"` -> `["RAG-CTXASM", "RAG-CITE"]`."""
+    if not condition or not condition.startswith(_ALLOWLIST_MARKER):
+        return []
+    return [item for item in condition[len(_ALLOWLIST_MARKER):].split("|") if item]
+
+
+def pack_matrix(roots, families, decision_map, conditions):
+    cells = bytearray((len(roots) * len(families) + 3) // 4)
+    allowlists = []
+    for r, root in enumerate(roots):
+        for f, family in enumerate(families):
+            index = r * len(families) + f
+            decision = decision_map[root][family]
+            cells[index >> 2] |= CODES[decision] << ((index & 3) << 1)
+            if decision == "CONDITIONAL":
+                allowlists.append({
+                    "root": root,
+                    "family": family,
+                    "allow": parse_condition(conditions.get((root, family), "")),
+                })
+    return {
+        "format": FORMAT,
+        "bits_per_cell": BITS_PER_CELL,
+        "codes": CODES,
+        "roots": list(roots),
+        "families": list(families),
+        "cells": base64.b64encode(bytes(cells)).decode("ascii"),
+        "conditional_allowlists": allowlists,
+    }
+
+
+class DecisionMatrix:
+    """Read-only view of a packed matrix; lookups are an index plus a shift."""
+
+    def __init__(self, document):
+        if document.get("format") != FORMAT:
+            raise ValueError(f"Unsupported decision matrix format: {document.get('format')!r}")
+        self.roots = document["roots"]
+        self.families = document["families"]
+        self.root_ids = {root: i for i, root in enumerate(self.roots)}
+        self.family_ids = {family: i for i, family in enumerate(self.families)}
+        self.cells = base64.b64decode(document["cells"])
+        self._width = len(self.families)
+        self.allowlists = {
+            self.root_ids[entry["root"]] * self._width + self.family_ids[entry["family"]]: frozenset(entry["allow"])
+            for entry in document["conditional_allowlists"]
+        }
+
+    def cell(self, root, family):
+        """Cell index for a root/family pair, or -1 if either is unknown."""
+        r = self.root_ids.get(root)
+        f = self.family_ids.get(family)
+        return -1 if r is None or f is None else r * self._width + f
+
+    def code(self, index):
+        if index < 0:
+            return CODES["DENY"]
+        return (self.cells[index >> 2] >> ((index & 3) << 1)) & 3
+
+    def decision(self, root, family):
+        return DECISIONS[self.code(self.cell(root, family))]
+
+    def root_compatible(self, root, prefix):
+        """ROOT_COMPATIBLE + SUBPREFIX_ALLOWED for a full prefix such as `RAG-CITE`."""
+        index = self.cell(root, prefix.split("-")[0])
+        code = self.code(index)
+        if code == CODES["CONDITIONAL"]:
+            return prefix in self.allowlists.get(index, ())
+        return code == CODES["ALLOW"]
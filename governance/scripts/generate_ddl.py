@@ -0,0 +1,269 @@
+"""Generate storage DDL from the *TableSchema.csv catalogs.
+
+Each schema CSV (ConversationMessageTableSchema.csv -> conversation_message) lists
+column_name, data_type, nullable and an index_hint; see the comment above
+`schema_columns` in generate_ssot.py for the hint grammar. Two dialects are written:
+
+    governance/ddl/postgres.sql   native ENUM types, composite/unique indexes,
+                                  RANGE (monthly) or HASH (tenant) partitioning
+    governance/ddl/sqlite.sql     local stand-in: CHECK constraints for enums, same
+                                  keys and indexes, no partitioning
+
+bench_ddl.py loads sqlite.sql to measure insert/query throughput of the indexes.
+
+Usage (from the repo root):
+    python3 governance/scripts/generate_ddl.py [--partitions-from 2026-01 --months 12]
+
+The committed postgres.sql carries PARTITIONS_FROM and DEFAULT_MONTHS monthly
+partitions, so RANGE tables start with real partitions rather than only the
+catch-all DEFAULT one; pass later values when provisioning a new year.
+"""
+import argparse
+import re
+import sys
+from collections import namedtuple
+from pathlib import Path
+
+from catalog import load_catalog
+from catalog_db import table_name
+from ssot_pipeline import atomic_write
+
+# Paths
+ddl_dir = Path("governance/ddl")
+SCHEMA_SUFFIX = "TableSchema.csv"
+
+Column = namedtuple("Column", ["name", "data_type", "nullable", "semantics", "enum_values"])
+Index = namedtuple("Index", ["name", "columns", "unique"])
+Partition = namedtuple("Partition", ["column", "method", "arg"])
+TableSpec = namedtuple("TableSpec", ["name", "columns", "primary_key", "partition", "indexes"])
+
+POSTGRES_TYPES = {
+    "STRING": "TEXT",
+    "INT": "INTEGER",
+    "DECIMAL": "NUMERIC(12, 6)",
+    "FLOAT": "DOUBLE PRECISION",
+    "BOOLEAN": "BOOLEAN",
+    "JSON": "JSONB",
+    "TIMESTAMP": "TIMESTAMPTZ",
+}
+SQLITE_TYPES = {
+    "STRING": "TEXT",
+    "INT": "INTEGER",
+    "DECIMAL": "NUMERIC",
+    "FLOAT": "REAL",
+    "BOOLEAN": "INTEGER",
+    "JSON": "TEXT",
+    "TIMESTAMP": "TEXT",  # ISO-8601, sorts chronologically
+}
+
+# First monthly RANGE partition of the committed DDL: fixed rather than today's month,
+# so regenerating it is deterministic
+PARTITIONS_FROM = "2026-01"
+DEFAULT_MONTHS = 12
+
+_HINT = re.compile(r"^(PK|INDEX|UNIQUE|PARTITION)(?:\((.+)\))?$")
+_ENUM = re.compile(r"^ENUM\((.+)\)$")
+
+
+def header(comment):
+    return [
+        f"{comment} @generated by governance/scripts/generate_ddl.py",
+        f"{comment} DO NOT EDIT MANUALLY. Run 'python3 governance/scripts/generate_ddl.py' to update.",
+        "",
+    ]
+
+
+def sql_string(value):
+    return "'" + value.replace("'", "''") + "'"
+
+
+def parse_table(filename, records):
+    """TableSpec for one schema CSV; raises ValueError on malformed hints."""
+    name = table_name(filename[:-len(SCHEMA_SUFFIX)])
+    columns, primary_key, partitions = [], [], []
+    composites = {}  # (name, unique) -> {position: column}
+    for row in records:
+        column = row['column_name']
+        enum = _ENUM.match(row['data_type'])
+        base_type = "ENUM" if enum else row['data_type']
+        if not enum and base_type not in POSTGRES_TYPES:
+            raise ValueError(f"{name}.{column}: unknown data_type {row['data_type']!r}")
+        columns.append(Column(column, base_type, row['nullable'] == "YES", row['semantics'],
+                              tuple(enum.group(1).split("|")) if enum else ()))
+        for token in filter(None, row['index_hint'].split("|")):
+            match = _HINT.match(token)
+            if not match:
+                raise ValueError(f"{name}.{column}: unknown index_hint {token!r}")
+            kind, arg = match.groups()
+            if kind == "PK":
+                primary_key.append(column)
+            elif kind == "PARTITION":
+                method, _, size = (arg or "").partition(":")
+                if (method, size) != ("RANGE", "MONTH") and not (method == "HASH" and size.isdigit()):
+                    raise ValueError(f"{name}.{column}: expected PARTITION(RANGE:MONTH) or PARTITION(HASH:k), got {token!r}")
+                partitions.append(Partition(column, method, int(size) if method == "HASH" else size))
+            elif arg is None:
+                composites[(column, False)] = {1: column}
+            else:
+                index, _, position = arg.partition(":")
+                if not position.isdigit():
+                    raise ValueError(f"{name}.{column}: expected {kind}(name:position), got {token!r}")
+                slots = composites.setdefault((index, kind == "UNIQUE"), {})
+                if int(position) in slots:
+                    raise ValueError(f"{name}: {kind}({index}) has two columns at position {position}")
+                slots[int(position)] = column
+
+    if not primary_key:
+        raise ValueError(f"{name}: no PK column")
+    if len(partitions) > 1:
+        raise ValueError(f"{name}: more than one PARTITION column")
+    partition = partitions[0] if partitions else None
+    indexes = []
+    for (index, unique), slots in composites.items():
+        if sorted(slots) != list(range(1, len(slots) + 1)):
+            raise ValueError(f"{name}: index {index} has positions {sorted(slots)}, expected 1..{len(slots)}")
+        index_columns = tuple(slots[p] for p in sorted(slots))
+        # PostgreSQL only enforces uniqueness on partitioned tables when the key includes the partition column
+        if partition and (unique and partition.column not in index_columns):
+            raise ValueError(f"{name}: UNIQUE({index}) must include partition column {partition.column}")
+        indexes.append(Index(f"{name}_{index}", index_columns, unique))
+    if partition and partition.column not in primary_key:
+        raise ValueError(f"{name}: partition column {partition.column} must be part of the PK")
+    return TableSpec(name, columns, tuple(primary_key), partition, indexes)
+
+
+def load_specs(catalog):
+    return [parse_table(filename, catalog.records(filename))
+            for filename in catalog.filenames if filename.endswith(SCHEMA_SUFFIX)]
+
+
+def enum_types(specs):
+    """{(table, column): type name}; columns with one value set across tables share a type."""
+    value_sets = {}
+    for spec in specs:
+        for column in spec.columns:
+            if column.enum_values:
+                value_sets.setdefault(column.name, set()).add(column.enum_values)
+    types = {}
+    for spec in specs:
+        for column in spec.columns:
+            if column.enum_values:
+                shared = len(value_sets[column.name]) == 1
+                types[(spec.name, column.name)] = column.name if shared else f"{spec.name}_{column.name}"
+    return types
+
+
+def _column_lines(spec, column_type):
+    lines = []
+    for column in spec.columns:
+        null = "" if column.nullable else " NOT NULL"
+        lines.append(f"    {column.name} {column_type(spec, column)}{null},  -- {column.semantics}")
+    lines.append(f"    PRIMARY KEY ({', '.join(spec.primary_key)})")
+    return lines
+
+
+def _index_lines(spec):
+    return [f"CREATE {'UNIQUE ' if index.unique else ''}INDEX {index.name} ON {spec.name} ({', '.join(index.columns)});"
+            for index in spec.indexes]
+
+
+def month_range(start, months):
+    """`("2026-01", 2)` -> [("2026_01", "2026-01-01", "2026-02-01"), ("2026_02", ...)]."""
+    year, month = map(int, start.split("-"))
+    ranges = []
+    for _ in range(months):
+        next_year, next_month = (year + 1, 1) if month == 12 else (year, month + 1)
+        ranges.append((f"{year:04d}_{month:02d}", f"{year:04d}-{month:02d}-01", f"{next_year:04d}-{next_month:02d}-01"))
+        year, month = next_year, next_month
+    return ranges
+
+
+def postgres_ddl(specs, months=()):
+    types = enum_types(specs)
+    lines = header("--")
+    emitted = set()
+    for spec in specs:
+        for column in spec.columns:
+            type_name = types.get((spec.name, column.name))
+            if type_name and type_name not in emitted:
+                emitted.add(type_name)
+                values = ", ".join(sql_string(v) for v in column.enum_values)
+                lines.append(f"CREATE TYPE {type_name} AS ENUM ({values});")
+    lines.append("")
+
+    def column_type(spec, column):
+        return types.get((spec.name, column.name)) or POSTGRES_TYPES[column.data_type]
+
+    for spec in specs:
+        lines.append(f"CREATE TABLE {spec.name} (")
+        lines.extend(_column_lines(spec, column_type))
+        partition = spec.partition
+        if partition is None:
+            lines.append(");")
+        else:
+            lines.append(f") PARTITION BY {partition.method} ({partition.column});")
+            if partition.method == "HASH":
+                for remainder in range(partition.arg):
+                    lines.append(f"CREATE TABLE {spec.name}_p{remainder} PARTITION OF {spec.name} "
+                                 f"FOR VALUES WITH (MODULUS {partition.arg}, REMAINDER {remainder});")
+            else:
+                for suffix, start, end in months:
+                    lines.append(f"CREATE TABLE {spec.name}_{suffix} PARTITION OF {spec.name} "
+                                 f"FOR VALUES FROM ({sql_string(start)}) TO ({sql_string(end)});")
+                lines.append(f"CREATE TABLE {spec.name}_default PARTITION OF {spec.name} DEFAULT;")
+        lines.extend(_index_lines(spec))
+        lines.append("")
+    return lines
+
+
+def sqlite_ddl(specs):
+    lines = header("--")
+
+    def column_type(spec, column):
+        if column.enum_values:
+            values = ", ".join(sql_string(v) for v in column.enum_values)
+            return f"TEXT CHECK ({column.name} IN ({values}))"
+        return SQLITE_TYPES[column.data_type]
+
+    for spec in specs:
+        lines.append(f"CREATE TABLE {spec.name} (")
+        lines.extend(_column_lines(spec, column_type))
+        lines.append(");")
+        if spec.partition:
+            lines.append(f"-- PostgreSQL partitions by {spec.partition.method} ({spec.partition.column}); SQLite has no partitioning.")
+        lines.extend(_index_lines(spec))
+        lines.append("")
+    return lines
+
+
+def write_ddl(path, lines):
+    atomic_write(path, lambda f: f.write("\n".join(lines).rstrip("\n") + "\n"))
+    print(f"Generated {path}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate storage DDL from the table-schema catalogs.")
+    parser.add_argument("--partitions-from", metavar="YYYY-MM", default=PARTITIONS_FROM,
+                        help="first monthly RANGE partition to create")
+    parser.add_argument("--months", type=int, default=DEFAULT_MONTHS, help="monthly partitions to create")
+    args = parser.parse_args(argv)
+    if not re.match(r"^\d{4}-(0[1-9]|1[0-2])$", args.partitions_from):
+        parser.error("--partitions-from must look like 2026-01")
+    if args.months < 1:
+        parser.error("--months must be at least 1")
+
+    try:
+        specs = load_specs(load_catalog())
+    except ValueError as e:
+        print(f"Error: {e}")
+        return 1
+    months = month_range(args.partitions_from, args.months)
+
+    ddl_dir.mkdir(parents=True, exist_ok=True)
+    write_ddl(ddl_dir / "postgres.sql", postgres_ddl(specs, months))
+    write_ddl(ddl_dir / "sqlite.sql", sqlite_ddl(specs))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
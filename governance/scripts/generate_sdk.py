@@ -1,45 +1,96 @@
-import csv
+import argparse
+import base64
+import json
 import os
 from pathlib import Path
 
+import instrument
+from catalog import load_catalog
+from decision_matrix import DecisionMatrix
+from perfect_hash import BUCKET_SEED, DIRECT, FINGERPRINT_SEED, MAX_SEED, PerfectHash
+
 # Paths
 base_dir = Path("governance")
 definitions_dir = base_dir / "definitions"
-src_lib_dir = Path("src/lib")
-src_lib_dir.mkdir(parents=True, exist_ok=True)
-output_file = src_lib_dir / "governance.ts"
+sdk_dir = Path("src/lib/governance")
+areas_dir = sdk_dir / "areas"
+
+# Areas most pages never log under; index.ts loads them with a dynamic import()
+LAZY_AREAS = ("SUPPLY", "BILLING")
+
+# Catalog generator metrics (instrument.py): catalogued so the linter accepts them, but
+# emitted by build tooling, never by the app, so the runtime SDK leaves them out
+TOOLING_SIGNALS = frozenset(instrument.SIGNALS.values())
 
-def read_csv(filename):
+# Scope masks give each root one bit of a 32-bit perfect-hash value (perfect_hash.MAX_VALUE)
+MAX_SCOPES = 32
+
+def read_json(filename):
     filepath = definitions_dir / filename
     if not filepath.exists():
         print(f"Warning: {filename} not found.")
-        return []
+        return None
     with open(filepath, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        return list(reader)
+        return json.load(f)
 
-def generate_sdk():
-    print("Generating Governance SDK...")
-    
-    # 1. Read Data
-    official_prefixes = read_csv("OfficialPrefixRegistry.csv")
-    signals = read_csv("SignalCatalog.csv")
-    roots = read_csv("RootNamespaceMap.csv")
-    descriptors = read_csv("DescriptorCatalog.csv")
+def enum_key(token):
+    # Tokens such as 'CSF-GV' or '80053-AU' are not identifiers; quote them.
+    return token if token.isidentifier() else f"'{token}'"
+
+def header():
+    return [
+        "// @generated by governance/scripts/generate_sdk.py",
+        "// DO NOT EDIT MANUALLY. Run 'python3 governance/scripts/generate_sdk.py' to update.",
+        "",
+    ]
+
+def union_type(name, tokens):
+    if not tokens:
+        return [f"export type {name} = never;"]
+    lines = [f"export type {name} ="]
+    lines.extend(f"  | '{token}'" for token in tokens)
+    lines[-1] += ";"
+    return lines
 
-    # 2. Build Content
-    lines = []
-    lines.append("// @generated by governance/scripts/generate_sdk.py")
-    lines.append("// DO NOT EDIT MANUALLY. Run 'python3 governance/scripts/generate_sdk.py' to update.")
+def area_module_name(area):
+    return area.lower()
+
+def area_type_name(area):
+    return f"{area.title()}AreaDescriptor"
+
+def phf_table(values):
+    phf = PerfectHash(values)
+    assert all(phf.lookup(kind, name) == value for (kind, name), value in values.items())
+    return (f"{{ size: {phf.size}, buckets: {phf.bucket_count}, "
+            f"seeds: '{phf.encoded_seeds()}', entries: '{phf.encoded_entries()}' }}")
+
+def write_module(path, lines):
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write("\n".join(lines) + "\n")
+
+def area_module(area, area_descriptors, values):
+    lines = header()
+    lines.append("import type { AreaTable } from '../core';")
+    lines.append("")
+    lines.append(f"// Descriptors catalogued under {area}")
+    lines.extend(union_type(area_type_name(area), area_descriptors))
+    lines.append("")
+    lines.append(f"// Perfect hash of every descriptor/signal valid in the {area} scope")
+    lines.append(f"export const table: AreaTable = {phf_table(values)};")
+    return lines
+
+def core_module(roots, official_prefixes, unique_signals, matrix, areas):
+    lines = header()
+    for area in areas:
+        lines.append(f"import type {{ {area_type_name(area)} }} from './areas/{area_module_name(area)}';")
     lines.append("")
 
     # --- GovernanceScope Enum ---
     lines.append("// Top-level domains/areas")
     lines.append("export enum GovernanceScope {")
     for row in roots:
-        token = row['root_token']
-        # Sanitize mostly upper case
-        lines.append(f"  {token} = '{token}',")
+        token = row['root']
+        lines.append(f"  {enum_key(token)} = '{token}',")
     lines.append("}")
     lines.append("")
 
@@ -48,26 +99,18 @@ def generate_sdk():
     lines.append("export enum TelemetryPrefix {")
     for row in official_prefixes:
         prefix = row['prefix']
-        lines.append(f"  {prefix} = '{prefix}',")
+        lines.append(f"  {enum_key(prefix)} = '{prefix}',")
     lines.append("}")
     lines.append("")
 
-    # --- MetricType Enum (Signals) ---
+    # --- Signal / Descriptor vocabularies (types only: no runtime enum objects) ---
     lines.append("// Standardized Metrics")
-    lines.append("export enum MetricType {")
-    unique_signals = sorted(list(set(row['signal_name'] for row in signals)))
-    for sig in unique_signals:
-        lines.append(f"  {sig} = '{sig}',")
-    lines.append("}")
+    lines.extend(union_type("MetricType", unique_signals))
     lines.append("")
-
-    # --- Descriptor Enum ---
-    lines.append("// Standardized Descriptors (Logs/Events)")
-    lines.append("export enum EventDescriptor {")
-    unique_descriptors = sorted(list(set(row['descriptor_token'] for row in descriptors)))
-    for desc in unique_descriptors:
-        lines.append(f"  {desc} = '{desc}',")
-    lines.append("}")
+    lines.append("// Standardized Descriptors (Logs/Events): the union of every area's vocabulary")
+    lines.append("export type EventDescriptor =")
+    lines.extend(f"  | {area_type_name(area)}" for area in areas)
+    lines[-1] += ";"
     lines.append("")
 
     # --- Constants & Helper Types ---
@@ -75,6 +118,171 @@ def generate_sdk():
     lines.append("export const VALID_SCOPES = Object.values(GovernanceScope);")
     lines.append("export const VALID_PREFIXES = Object.values(TelemetryPrefix);")
     lines.append("")
+
+    # --- Perfect-hash scope masks (see perfect_hash.py) ---
+    # A scope maps to its own bit, a prefix to the roots it is compatible with.
+    # Like naming_lint's ROOT_COMPATIBLE, a root must pass the matrix and be in the prefix's allowed_roots.
+    scope_ids = {row['root']: i for i, row in enumerate(roots)}
+    if len(scope_ids) > MAX_SCOPES:
+        raise ValueError(f"{len(scope_ids)} roots exceed the SDK limit of {MAX_SCOPES}: "
+                         f"scope masks are one bit per root in a 32-bit value")
+    decision_matrix = DecisionMatrix(matrix) if matrix else None
+    values = {("S", root): 1 << i for root, i in scope_ids.items()}
+    for row in official_prefixes:
+        prefix = row['prefix']
+        allowed_roots = set(row['allowed_roots'].split("|"))
+        values[("P", prefix)] = sum(1 << i for root, i in scope_ids.items() if root in allowed_roots
+                                    and (decision_matrix is None or decision_matrix.root_compatible(root, prefix)))
+
+    lines.append("// Minimal perfect hash tables: two little-endian uint32 per slot, fingerprint then value (base64)")
+    lines.append("export interface AreaTable {")
+    lines.append("  size: number;")
+    lines.append("  buckets: number;")
+    lines.append("  seeds: string;")
+    lines.append("  entries: string;")
+    lines.append("}")
+    lines.append("")
+    lines.append("export interface DecodedTable {")
+    lines.append("  size: number;")
+    lines.append("  buckets: number;")
+    lines.append("  seeds: Uint16Array;")
+    lines.append("  entries: Uint32Array;")
+    lines.append("}")
+    lines.append("")
+    lines.append("export const KIND_SCOPE = 0x53; // 'S'")
+    lines.append("export const KIND_PREFIX = 0x50; // 'P'")
+    lines.append("export const KIND_DESCRIPTOR = 0x44; // 'D'")
+    lines.append("export const KIND_SIGNAL = 0x4d; // 'M'")
+    lines.append("")
+    lines.append("function decodeBase64(base64: string): ArrayBuffer {")
+    lines.append("  const raw = atob(base64);")
+    lines.append("  const bytes = new Uint8Array(raw.length);")
+    lines.append("  for (let i = 0; i < raw.length; i++) bytes[i] = raw.charCodeAt(i);")
+    lines.append("  return bytes.buffer;")
+    lines.append("}")
+    lines.append("")
+    lines.append("export function decodeTable(table: AreaTable): DecodedTable {")
+    lines.append("  return {")
+    lines.append("    size: table.size,")
+    lines.append("    buckets: table.buckets,")
+    lines.append("    seeds: new Uint16Array(decodeBase64(table.seeds)),")
+    lines.append("    entries: new Uint32Array(decodeBase64(table.entries)),")
+    lines.append("  };")
+    lines.append("}")
+    lines.append("")
+    lines.append("// FNV-1a over the kind byte and UTF-16 code units (mirrors perfect_hash.key_hash)")
+    lines.append("function phfKeyHash(kind: number, key: string): number {")
+    lines.append("  let h = Math.imul(0x811c9dc5 ^ kind, 0x01000193);")
+    lines.append("  for (let i = 0; i < key.length; i++) h = Math.imul(h ^ key.charCodeAt(i), 0x01000193);")
+    lines.append("  return h;")
+    lines.append("}")
+    lines.append("")
+    lines.append("// murmur3 finaliser of the key hash xor the scaled seed (mirrors perfect_hash.mix)")
+    lines.append("function phfMix(h: number, seed: number): number {")
+    lines.append("  h ^= Math.imul(seed, 0x9e3779b9);")
+    lines.append("  h ^= h >>> 16;")
+    lines.append("  h = Math.imul(h, 0x85ebca6b);")
+    lines.append("  h ^= h >>> 13;")
+    lines.append("  h = Math.imul(h, 0xc2b2ae35);")
+    lines.append("  return (h ^ (h >>> 16)) >>> 0;")
+    lines.append("}")
+    lines.append("")
+    lines.append("// Value stored for a key, 0 if it is not in the table")
+    lines.append("export function phfLookup(table: DecodedTable, kind: number, key: string): number {")
+    lines.append("  const h = phfKeyHash(kind, key);")
+    lines.append(f"  const seed = table.seeds[phfMix(h, {BUCKET_SEED}) % table.buckets];")
+    lines.append(f"  const slot = (seed & 0x{DIRECT:x} ? seed & 0x{MAX_SEED:x} : phfMix(h, seed) % table.size) << 1;")
+    lines.append(f"  return table.entries[slot] === phfMix(h, 0x{FINGERPRINT_SEED:x}) ? table.entries[slot + 1] : 0;")
+    lines.append("}")
+    lines.append("")
+    lines.append(f"// Scopes and prefixes, each mapped to a bitmask of scopes")
+    lines.append(f"const CORE_TABLE = decodeTable({phf_table(values)});")
+    lines.append("")
+
+    # --- Area registry ---
+    lines.append("// Per-area descriptor tables, registered by index.ts (eagerly or on first use)")
+    lines.append("const AREA_TABLES = new Map<string, DecodedTable>();")
+    lines.append("const AREA_LOADERS = new Map<string, () => Promise<{ table: AreaTable }>>();")
+    lines.append("const AREA_LOADING = new Map<string, Promise<void>>();")
+    lines.append("")
+    lines.append("export function registerArea(scope: string, table: AreaTable): void {")
+    lines.append("  AREA_TABLES.set(scope, decodeTable(table));")
+    lines.append("}")
+    lines.append("")
+    lines.append("export function registerLazyArea(scope: string, load: () => Promise<{ table: AreaTable }>): void {")
+    lines.append("  AREA_LOADERS.set(scope, load);")
+    lines.append("}")
+    lines.append("")
+    lines.append("export function loadArea(scope: string): Promise<void> {")
+    lines.append("  if (AREA_TABLES.has(scope)) return Promise.resolve();")
+    lines.append("  const load = AREA_LOADERS.get(scope);")
+    lines.append("  if (!load) return Promise.resolve();")
+    lines.append("  let loading = AREA_LOADING.get(scope);")
+    lines.append("  if (!loading) {")
+    lines.append("    loading = load().then((module) => registerArea(scope, module.table));")
+    lines.append("    AREA_LOADING.set(scope, loading);")
+    lines.append("  }")
+    lines.append("  return loading;")
+    lines.append("}")
+    lines.append("")
+    lines.append("// A lazy area that is still loading cannot be checked yet: start the load and reject")
+    lines.append("// (fail closed). validateEventAsync waits for the table instead.")
+    lines.append("function inArea(scope: string, kind: number, key: string): boolean {")
+    lines.append("  const table = AREA_TABLES.get(scope);")
+    lines.append("  if (table) return phfLookup(table, kind, key) !== 0;")
+    lines.append("  if (AREA_LOADERS.has(scope)) void loadArea(scope);")
+    lines.append("  return false;")
+    lines.append("}")
+    lines.append("")
+    lines.append("export function isDescriptorInScope(scope: string, descriptor: string): boolean {")
+    lines.append("  return phfLookup(CORE_TABLE, KIND_SCOPE, scope) !== 0 && inArea(scope, KIND_DESCRIPTOR, descriptor);")
+    lines.append("}")
+    lines.append("")
+    lines.append("export function isSignalInScope(scope: string, signal: string): boolean {")
+    lines.append("  return phfLookup(CORE_TABLE, KIND_SCOPE, scope) !== 0 && inArea(scope, KIND_SIGNAL, signal);")
+    lines.append("}")
+    lines.append("")
+    # --- Root x Prefix Family Matrix (2 bits per cell, row-major by root) ---
+    if matrix:
+        width = len(matrix['families'])
+        codes = matrix['codes']
+        cells = list(base64.b64decode(matrix['cells']))
+        lines.append("// Root x Prefix Family decisions (see RootPrefixFamilyMatrix.packed.json)")
+        for decision in ("DENY", "ALLOW", "CONDITIONAL"):
+            lines.append(f"export const DECISION_{decision} = {codes[decision]};")
+        root_ids = ", ".join(f"['{root}', {i}]" for i, root in enumerate(matrix['roots']))
+        family_ids = ", ".join(f"['{family}', {i}]" for i, family in enumerate(matrix['families']))
+        lines.append(f"const MATRIX_ROOT_IDS = new Map<string, number>([{root_ids}]);")
+        lines.append(f"const MATRIX_FAMILY_IDS = new Map<string, number>([{family_ids}]);")
+        lines.append(f"const MATRIX_WIDTH = {width};")
+        lines.append(f"const MATRIX_CELLS = new Uint8Array([{', '.join(str(b) for b in cells)}]);")
+        lines.append("const MATRIX_ALLOWLISTS = new Map<number, ReadonlySet<string>>([")
+        for entry in matrix['conditional_allowlists']:
+            cell = matrix['roots'].index(entry['root']) * width + matrix['families'].index(entry['family'])
+            allowed = ", ".join(f"'{prefix}'" for prefix in entry['allow'])
+            lines.append(f"  [{cell}, new Set([{allowed}])], // {entry['root']} x {entry['family']}")
+        lines.append("]);")
+        lines.append("")
+        lines.append("function matrixCell(scope: string, family: string): number {")
+        lines.append("  const r = MATRIX_ROOT_IDS.get(scope);")
+        lines.append("  const f = MATRIX_FAMILY_IDS.get(family);")
+        lines.append("  return r === undefined || f === undefined ? -1 : r * MATRIX_WIDTH + f;")
+        lines.append("}")
+        lines.append("")
+        lines.append("export function rootDecision(scope: string, family: string): number {")
+        lines.append("  const cell = matrixCell(scope, family);")
+        lines.append("  return cell < 0 ? DECISION_DENY : (MATRIX_CELLS[cell >> 2] >> ((cell & 3) << 1)) & 3;")
+        lines.append("}")
+        lines.append("")
+        lines.append("// ROOT_COMPATIBLE (+ SUBPREFIX_ALLOWED for CONDITIONAL cells)")
+        lines.append("export function isRootCompatible(scope: string, prefix: string): boolean {")
+        lines.append("  const cell = matrixCell(scope, prefix.split('-')[0]);")
+        lines.append("  if (cell < 0) return false;")
+        lines.append("  const decision = (MATRIX_CELLS[cell >> 2] >> ((cell & 3) << 1)) & 3;")
+        lines.append("  if (decision === DECISION_CONDITIONAL) return MATRIX_ALLOWLISTS.get(cell)?.has(prefix) ?? false;")
+        lines.append("  return decision === DECISION_ALLOW;")
+        lines.append("}")
+        lines.append("")
     
     # --- Interface for Strict Typing ---
     lines.append("// Strict Telemetry Event Structure")
@@ -89,19 +297,97 @@ def generate_sdk():
 
     # --- Validator Function ---
     lines.append("")
-    lines.append("// Runtime Validator")
+    lines.append("// Runtime Validator: two core probes and an AND cover prefix, scope and root compatibility")
+    lines.append("// (ROOT_COMPATIBLE/SUBPREFIX_ALLOWED); one probe of the scope's table covers the descriptor")
     lines.append("export function validateEvent(event: TelemetryEvent): boolean {")
+    lines.append("  const scope = phfLookup(CORE_TABLE, KIND_SCOPE, event.scope);")
     lines.append("  return (")
-    lines.append("    VALID_PREFIXES.includes(event.prefix) &&")
-    lines.append("    VALID_SCOPES.includes(event.scope)")
+    lines.append("    (phfLookup(CORE_TABLE, KIND_PREFIX, event.prefix) & scope) !== 0 &&")
+    lines.append("    inArea(event.scope, KIND_DESCRIPTOR, event.descriptor)")
     lines.append("  );")
     lines.append("}")
+    lines.append("")
+    lines.append("// Same check, after loading the scope's table if it is a lazy area")
+    lines.append("export async function validateEventAsync(event: TelemetryEvent): Promise<boolean> {")
+    lines.append("  await loadArea(event.scope);")
+    lines.append("  return validateEvent(event);")
+    lines.append("}")
+    return lines
 
-    # 3. Write File
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write("\n".join(lines))
-    
-    print(f"Successfully generated {output_file}")
+def index_module(areas):
+    lines = header()
+    lines.append("// Core enums, types and validators plus every area's descriptor type. Eager areas are")
+    lines.append(f"// bundled here; {', '.join(a for a in areas if a in LAZY_AREAS) or 'no area'} load in their own chunk on first use.")
+    lines.append("import { registerArea, registerLazyArea } from './core';")
+    for area in areas:
+        if area not in LAZY_AREAS:
+            lines.append(f"import {{ table as {area}_AREA }} from './areas/{area_module_name(area)}';")
+    lines.append("")
+    lines.append("export * from './core';")
+    for area in areas:
+        lines.append(f"export type {{ {area_type_name(area)} }} from './areas/{area_module_name(area)}';")
+    lines.append("")
+    for area in areas:
+        if area in LAZY_AREAS:
+            lines.append(f"registerLazyArea('{area}', () => import('./areas/{area_module_name(area)}'));")
+        else:
+            lines.append(f"registerArea('{area}', {area}_AREA);")
+    return lines
+
+def generate_sdk(stages=instrument.NULL):
+    print("Generating Governance SDK...")
+
+    # 1. Read Data
+    with stages.stage("read", "catalog"):
+        catalog = load_catalog(definitions_dir)
+        official_prefixes = catalog.records("OfficialPrefixRegistry.csv")
+        signals = [row for row in catalog.records("SignalCatalog.csv") if row['signal'] not in TOOLING_SIGNALS]
+        roots = catalog.records("RootNamespaceMap.csv")
+        descriptors = catalog.records("DescriptorCatalog.csv")
+        matrix = read_json("RootPrefixFamilyMatrix.packed.json")
+
+    # 2. Per-area vocabularies: a descriptor is valid in its catalog area and, when it is
+    # also a signal, in every area the SignalCatalog allows; signals in their allowed areas.
+    areas = [row['root'] for row in roots]
+    signal_areas = {row['signal']: set(row['allowed_areas'].split("|")) for row in signals}
+    catalogued = {area: set() for area in areas}
+    area_values = {area: {} for area in areas}
+    for row in descriptors:
+        if row['area'] not in catalogued:
+            continue
+        catalogued[row['area']].add(row['descriptor'])
+        for area in {row['area']} | (signal_areas.get(row['descriptor'], set()) & set(areas)):
+            area_values[area][("D", row['descriptor'])] = 1
+    for sig, allowed in signal_areas.items():
+        for area in allowed & set(areas):
+            area_values[area][("M", sig)] = 1
+    unique_signals = sorted(signal_areas)
+
+    # 3. Write Files
+    areas_dir.mkdir(parents=True, exist_ok=True)
+    expected = {f"{area_module_name(area)}.ts" for area in areas}
+    for stale in areas_dir.glob("*.ts"):
+        if stale.name not in expected:
+            stale.unlink()
+    modules = [(areas_dir / f"{area_module_name(area)}.ts",
+                lambda area=area: area_module(area, sorted(catalogued[area]), area_values[area])) for area in areas]
+    modules.append((sdk_dir / "core.ts", lambda: core_module(roots, official_prefixes, unique_signals, matrix, areas)))
+    modules.append((sdk_dir / "index.ts", lambda: index_module(areas)))
+    for path, build in modules:
+        with stages.stage("module", path.name) as stage:
+            write_module(path, build())
+            stage.wrote(path)
+
+    print(f"Successfully generated {sdk_dir} (core, index and {len(areas)} area modules)")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate the TypeScript governance SDK from the SSOT tables.")
+    instrument.add_arguments(parser)
+    args = parser.parse_args(argv)
+    stages = instrument.from_args("generate_sdk", args)
+    with stages.stage("run", "generate_sdk"):
+        generate_sdk(stages)
+    instrument.finish(stages, args)
 
 if __name__ == "__main__":
-    generate_sdk()
+    main()
@@ -1,11 +1,28 @@
-import pandas as pd
+"""Generate the SSOT governance tables in governance/definitions.
+
+Every table is declared once on an ssot_pipeline.Pipeline, with explicit
+dependencies for derived tables (the root x family matrix is built from `roots`,
+`families`, `decision_map` and `conditions`). Changed tables are rewritten
+atomically and bundled with bundle.py; binary_catalog.py packs them into the
+mmap-able catalog.gcat and catalog_db.py into the indexed catalog.sqlite.
+
+Usage (from the repo root):
+    python3 governance/scripts/generate_ssot.py [--force] [--workers N]
+    python3 governance/scripts/generate_ssot.py --force --timings [--trace-memory] [--metrics stages.jsonl] [--profile ssot.pstats]
+"""
+import argparse
+import sys
 from pathlib import Path
-import zipfile
-import os
 
-# Create output directories
+from binary_catalog import catalog_document, catalog_file, write_catalog
+from bundle import manifest_path as bundle_manifest_path, write_bundle, zip_path
+from catalog_db import database_document, database_file, write_database
+from decision_matrix import matrix_file, pack_matrix
+import instrument
+from ssot_pipeline import Pipeline
+
 out_dir = Path("governance/definitions")
-out_dir.mkdir(parents=True, exist_ok=True)
+pipeline = Pipeline()
 
 # --- 1) Official 30 prefixes registry (expanded columns) ---
 official_prefix_rows = [
@@ -48,11 +65,12 @@ official_prefix_rows = [
     ("EVENT-DLQ","Event & Durability","DURABILITY","EVENT","Dead letter queue handling","EVENT|OPS","DOC-DESIGN|DOC-RUNBOOK","DLQ_*|REPLAY_*|POISON_*","SRE-SLO-EVENT-DLQ_COUNT-TARGET_DELIVERY-W28D","SRE-ALERT-DLQ_COUNT-DLQ_CRITICAL-W15M","EVENT-DLQ-OPS-RUNBOOK-DLQ_REPROCESS","SRE-INC","Failure isolation"),
 ]
 
-df_official_prefix = pd.DataFrame(official_prefix_rows, columns=[
+prefix_columns = [
     "prefix","category","plane","primary_area","primary_purpose",
     "allowed_roots","allowed_artifact_types","allowed_descriptor_families",
     "default_slo","default_alerts","default_runbooks","dependencies","notes"
-])
+]
+pipeline.static_table("OfficialPrefixRegistry.csv", prefix_columns, official_prefix_rows)
 
 # --- 2) Extended prefixes (subprefixes) used by lint/taxonomy but not in official 30 ---
 extended_prefix_rows = [
@@ -116,7 +134,7 @@ extended_prefix_rows = [
     ("RAG-CTXASM","RAG","EXTENDED","RAG","Context assembly for generation","RAG|LLM","DOC-DESIGN","CTXASM_*","","","", "", ""),
     ("RAG-FRESH","RAG","EXTENDED","RAG","Freshness policy","RAG","DOC-POLICY","FRESH_*","","","", "", ""),
 ]
-df_extended_prefix = pd.DataFrame(extended_prefix_rows, columns=df_official_prefix.columns)
+pipeline.static_table("ExtendedPrefixRegistry.csv", prefix_columns, extended_prefix_rows)
 
 # --- 3) Root namespace map (summarized) ---
 root_rows = [
@@ -134,7 +152,7 @@ root_rows = [
     ("BILLING","Billing Plane","Plans, entitlements, metering, payments","CSF(GV/PR)|80053(AU/AC)|SRE|OTEL|API|EVENT","IAM|LLM|RAG|SUPPLY","Usage-based governance"),
     ("TENANT","Tenant Plane","Tenant lifecycle, config, quotas, keys","CSF(GV/ID/PR)|80053(AC/IA/AU/CM)|SRE|OTEL|API|EVENT","IAM|LLM|RAG|SUPPLY","Tenant isolation & governance"),
 ]
-df_root_map = pd.DataFrame(root_rows, columns=["root","plane","description","allowed_prefix_families","denied_prefix_families","notes"])
+pipeline.static_table("RootNamespaceMap.csv", ["root","plane","description","allowed_prefix_families","denied_prefix_families","notes"], root_rows)
 
 # --- 4) Root × Prefix Family matrix (ALLOW/DENY/CONDITIONAL) ---
 roots = ["INGRESS","CORE","IAM","API","EVENT","LLM","RAG","OBS","SEC","OPS","SUPPLY","BILLING","TENANT"]
@@ -162,15 +180,24 @@ conditions = {
     ("RAG","LLM"): "ALLOW only LLM-OUTVAL",
     ("SEC","LLM"): "ALLOW only LLM-INJDEF",
 }
-matrix_rows = []
-for r in roots:
-    for f in families:
-        decision = decision_map[r][f]
-        cond = ""
-        if decision == "CONDITIONAL":
-            cond = conditions.get((r,f),"CONDITIONAL_ALLOWLIST")
-        matrix_rows.append((r,f,decision,cond))
-df_root_prefix_family_matrix = pd.DataFrame(matrix_rows, columns=["root","prefix_family","decision","condition"])
+for name, value in (("roots", roots), ("families", families), ("decision_map", decision_map), ("conditions", conditions)):
+    pipeline.source(name, value)
+
+@pipeline.table("RootPrefixFamilyMatrix.csv", ["root","prefix_family","decision","condition"],
+                depends=("roots", "families", "decision_map", "conditions"))
+def root_prefix_family_matrix(roots, families, decision_map, conditions):
+    for r in roots:
+        for f in families:
+            decision = decision_map[r][f]
+            cond = ""
+            if decision == "CONDITIONAL":
+                cond = conditions.get((r,f),"CONDITIONAL_ALLOWLIST")
+            yield (r,f,decision,cond)
+
+# Dense 2-bit form of the same decisions for O(1) ROOT_COMPATIBLE lookups
+@pipeline.artifact(matrix_file, depends=("roots", "families", "decision_map", "conditions"))
+def packed_matrix(roots, families, decision_map, conditions):
+    return pack_matrix(roots, families, decision_map, conditions)
 
 # --- 5) Descriptor catalog (explicit descriptors) ---
 descriptor_rows = []
@@ -315,7 +342,11 @@ tenant_descriptors = [
 for d in tenant_descriptors:
     add_desc("TENANT", d, "LOG|DOC")
 
-df_descriptor_catalog = pd.DataFrame(descriptor_rows, columns=["descriptor","area","family","allowed_types","notes"]).sort_values(["area","descriptor"])
+pipeline.source("descriptor_rows", descriptor_rows)
+
+@pipeline.table("DescriptorCatalog.csv", ["descriptor","area","family","allowed_types","notes"], depends=("descriptor_rows",))
+def descriptor_catalog(descriptor_rows):
+    return sorted(descriptor_rows, key=lambda row: (row[1], row[0]))
 
 # --- 6) Descriptor family allow rules (pattern-based) ---
 descriptor_family_rules = [
@@ -332,7 +363,7 @@ descriptor_family_rules = [
     ("BILLING","PLAN_*|ENTITLEMENT_*|METERING_*|INVOICE_*|PAYMENT_*|DUNNING_*","PLAN_GENERATED|RETRIEVE_*","Billing only"),
     ("TENANT","TENANT_*","PLAN_GENERATED|RETRIEVE_*|TOKEN_*","Tenant only"),
 ]
-df_descriptor_family_rules = pd.DataFrame(descriptor_family_rules, columns=["area","allow_patterns","deny_patterns","notes"])
+pipeline.static_table("DescriptorFamilyRules.csv", ["area","allow_patterns","deny_patterns","notes"], descriptor_family_rules)
 
 # --- 7) Signal catalog (OTEL-METRIC signals) ---
 signal_rows = [
@@ -362,8 +393,13 @@ signal_rows = [
     ("RETRIEVAL_PRECISION","RATIO","Retrieval precision (eval-derived)","OBS|RAG","HIGH|W1H|W1D"),
     ("CITATION_COVERAGE","RATIO","Citation coverage","OBS|RAG|LLM","CITATION_DROP|HIGH|CRITICAL|W15M"),
     ("GROUNDING_FAIL_RATE","RATE","Grounding failures per time","OBS|RAG|LLM","HIGH|CRITICAL|W15M"),
+    # Generator instrumentation (see instrument.py)
+    ("SSOT_STAGE_DURATION_MS","MS","Catalog generator stage wall time","CORE","HIGH|W1D"),
+    ("SSOT_STAGE_ALLOC_PEAK","BYTES","Catalog generator stage peak allocation","CORE","HIGH|W1D"),
+    ("SSOT_STAGE_OUTPUT_BYTES","BYTES","Catalog generator stage output size","CORE","HIGH|W1D"),
+    ("SSOT_STAGE_ROWS","COUNT","Catalog generator stage rows built","CORE","HIGH|W1D"),
 ]
-df_signal_catalog = pd.DataFrame(signal_rows, columns=["signal","unit_type","description","allowed_areas","allowed_threshold_tokens"])
+pipeline.static_table("SignalCatalog.csv", ["signal","unit_type","description","allowed_areas","allowed_threshold_tokens"], signal_rows)
 
 # --- 8) Threshold tokens catalog ---
 threshold_rows = [
@@ -404,7 +440,7 @@ threshold_rows = [
     ("W7D","WINDOW","Window 7 days","window"),
     ("W28D","WINDOW","Window 28 days","window"),
 ]
-df_threshold_catalog = pd.DataFrame(threshold_rows, columns=["token","token_category","semantics","applies_to"])
+pipeline.static_table("ThresholdTokenCatalog.csv", ["token","token_category","semantics","applies_to"], threshold_rows)
 
 # --- 9) Alert templates catalog ---
 alert_templates = [
@@ -422,7 +458,7 @@ alert_templates = [
     ("SRE-ALERT-CITATION_COVERAGE-CITATION_DROP-HIGH-W15M","CITATION_COVERAGE","CITATION_DROP|HIGH|W15M","OBS|RAG|LLM","Citation coverage drop"),
     ("SRE-ALERT-RETRIEVAL_EMPTY-RETRIEVAL_EMPTY_SPIKE-HIGH-W15M","RETRIEVAL_EMPTY_RATE","RETRIEVAL_EMPTY_SPIKE|HIGH|W15M","OBS|RAG","Retrieval empty spike"),
 ]
-df_alert_templates = pd.DataFrame(alert_templates, columns=["alert_name","signal","required_tokens","allowed_roots","notes"])
+pipeline.static_table("AlertTemplateCatalog.csv", ["alert_name","signal","required_tokens","allowed_roots","notes"], alert_templates)
 
 # --- 10) SLO templates catalog ---
 slo_templates = [
@@ -437,7 +473,7 @@ slo_templates = [
     ("SRE-SLO-RAG-CITATION_COVERAGE-TARGET_GROUNDING-W28D","RAG","CITATION_COVERAGE","TARGET_GROUNDING","W28D","Grounding quality"),
     ("SRE-SLO-RAG-RETRIEVAL_EMPTY_RATE-TARGET_CORRECTNESS-W28D","RAG","RETRIEVAL_EMPTY_RATE","TARGET_CORRECTNESS","W28D","Retrieval health"),
 ]
-df_slo_templates = pd.DataFrame(slo_templates, columns=["slo_name","area","sli_signal","target_type","window","notes"])
+pipeline.static_table("SLOTemplateCatalog.csv", ["slo_name","area","sli_signal","target_type","window","notes"], slo_templates)
 
 # --- 11) Dashboard doc names ---
 dashboards = [
@@ -449,7 +485,7 @@ dashboards = [
     ("SRE-GS-OBS-DOC-DESIGN-DASHBOARD_IAM","IAM","Auth/authz/MFA"),
     ("SRE-GS-OBS-DOC-DESIGN-DASHBOARD_BILLING","BILLING","Metering/payment failures"),
 ]
-df_dashboards = pd.DataFrame(dashboards, columns=["dashboard_doc_name","area","notes"])
+pipeline.static_table("DashboardCatalog.csv", ["dashboard_doc_name","area","notes"], dashboards)
 
 # --- 12) Artifact type rules ---
 artifact_rules = [
@@ -464,7 +500,7 @@ artifact_rules = [
     ("METRIC","Metric name","ALL_RUNTIME","OTEL-METRIC","OTEL-METRIC-<AREA>-<SIGNAL>"),
     ("TRACE","Trace/span name","ALL_RUNTIME","OTEL-TRACE","OTEL-TRACE-<AREA>-<OPERATION>"),
 ]
-df_artifact_rules = pd.DataFrame(artifact_rules, columns=["artifact_type","semantics","allowed_roots","allowed_prefixes","naming_pattern"])
+pipeline.static_table("ArtifactTypeRules.csv", ["artifact_type","semantics","allowed_roots","allowed_prefixes","naming_pattern"], artifact_rules)
 
 # --- 13) Lint rules (high-level) ---
 lint_rules = [
@@ -479,7 +515,7 @@ lint_rules = [
     ("NO_AMBIGUOUS_TOKENS","WARN","Disallow MISC/TEMP/NEW/OLD/FIX in names","GLOBAL"),
     ("DENY_OVERRIDES","INFO","Any DENY rule wins over ALLOW","GLOBAL"),
 ]
-df_lint_rules = pd.DataFrame(lint_rules, columns=["rule_id","severity","semantics","scope"])
+pipeline.static_table("LintRuleCatalog.csv", ["rule_id","severity","semantics","scope"], lint_rules)
 
 # --- 14) Naming test suite examples ---
 test_cases = [
@@ -494,19 +530,26 @@ test_cases = [
     ("ALLOW","RAG-CITE-LLM-DOC-SPEC","Allowed conditional in LLM only for cite/ctxasm interfaces"),
     ("DENY","RAG-INGEST-LLM-DOC-SPEC","RAG ingest forbidden in LLM root"),
 ]
-df_test_suite = pd.DataFrame(test_cases, columns=["expected","example_name","reason"])
+pipeline.static_table("NamingTestSuite.csv", ["expected","example_name","reason"], test_cases)
 
 # --- 15) ConversationMessageTable schema ---
+schema_columns = ["column_name","data_type","nullable","semantics","index_hint"]
+# index_hint is a `|` list consumed by generate_ddl.py:
+#   PK                    part of the primary key (in column order)
+#   INDEX                 single-column secondary index
+#   INDEX(name:n)         column n of composite index `name`; UNIQUE(name:n) likewise
+#   PARTITION(RANGE:MONTH) / PARTITION(HASH:k)   partition key (partition keys must be in the PK)
+
 conversation_message_schema = [
-    ("message_id","STRING","NO","PK (ULID/UUID)","INDEX"),
-    ("conversation_id","STRING","NO","Conversation thread FK","INDEX"),
-    ("tenant_id","STRING","NO","Tenant boundary FK","INDEX"),
-    ("user_id","STRING","YES","End-user identifier","INDEX"),
-    ("actor_type","ENUM(HUMAN|AGENT|SYSTEM|TOOL)","NO","Who produced the message","INDEX"),
+    ("message_id","STRING","NO","PK (ULID/UUID)","PK"),
+    ("conversation_id","STRING","NO","Conversation thread FK","INDEX(tenant_conversation_time:2)"),
+    ("tenant_id","STRING","NO","Tenant boundary FK","INDEX(tenant_conversation_time:1)|INDEX(tenant_user_time:1)|INDEX(tenant_idempotency:1)"),
+    ("user_id","STRING","YES","End-user identifier","INDEX(tenant_user_time:2)"),
+    ("actor_type","ENUM(HUMAN|AGENT|SYSTEM|TOOL)","NO","Who produced the message",""),
     ("actor_id","STRING","YES","Agent/tool/system identifier",""),
-    ("channel","ENUM(whatsapp|web|ios|android|api)","NO","Channel source","INDEX"),
+    ("channel","ENUM(whatsapp|web|ios|android|api)","NO","Channel source",""),
     ("role","ENUM(user|assistant|system|tool)","NO","Chat role",""),
-    ("message_type","ENUM(text|image|audio|tool_call|tool_result|event)","NO","Message kind","INDEX"),
+    ("message_type","ENUM(text|image|audio|tool_call|tool_result|event)","NO","Message kind",""),
     ("content_text","STRING","YES","Text content (post-redaction)",""),
     ("content_structured","JSON","YES","Structured payload (tool args/result, metadata)",""),
     ("language","STRING","YES","Detected language (iso)",""),
@@ -514,113 +557,133 @@ conversation_message_schema = [
     ("token_count","INT","YES","Total tokens",""),
     ("input_tokens","INT","YES","Input tokens",""),
     ("output_tokens","INT","YES","Output tokens",""),
-    ("cost_usd","DECIMAL","YES","Estimated cost","INDEX"),
+    ("cost_usd","DECIMAL","YES","Estimated cost",""),
     ("model_provider","ENUM(openai|anthropic|google|local)","YES","Model provider",""),
     ("model_name","STRING","YES","Model identifier",""),
-    ("tool_name","STRING","YES","Tool invoked (allowlisted)","INDEX"),
+    ("tool_name","STRING","YES","Tool invoked (allowlisted)",""),
     ("tool_call_id","STRING","YES","Tool call correlation id","INDEX"),
-    ("tool_status","ENUM(proposed|allowed|executed|failed|rejected)","YES","Tool lifecycle status","INDEX"),
-    ("policy_decision","ENUM(allow|deny|degrade)","YES","Policy gate decision","INDEX"),
+    ("tool_status","ENUM(proposed|allowed|executed|failed|rejected)","YES","Tool lifecycle status",""),
+    ("policy_decision","ENUM(allow|deny|degrade)","YES","Policy gate decision",""),
     ("policy_reason","STRING","YES","Reason code",""),
-    ("risk_level","ENUM(low|med|high)","YES","Risk classification","INDEX"),
-    ("is_pii","BOOLEAN","YES","PII detected","INDEX"),
+    ("risk_level","ENUM(low|med|high)","YES","Risk classification",""),
+    ("is_pii","BOOLEAN","YES","PII detected",""),
     ("redaction_applied","BOOLEAN","YES","Redaction performed",""),
     ("is_hallucination","ENUM(true|false|unknown)","YES","Hallucination label (eval)",""),
     ("confidence_score","FLOAT","YES","Confidence score (0-1)",""),
     ("citation_count","INT","YES","Citations count",""),
     ("citation_ids","STRING","YES","Cited doc ids (pipe-separated)",""),
-    ("retrieval_used","BOOLEAN","YES","RAG used","INDEX"),
+    ("retrieval_used","BOOLEAN","YES","RAG used",""),
     ("retrieval_query","STRING","YES","Normalized query",""),
     ("retrieval_doc_ids","STRING","YES","Retrieved doc ids (pipe-separated)",""),
-    ("fsm_state_before","STRING","YES","FSM state before","INDEX"),
-    ("fsm_state_after","STRING","YES","FSM state after","INDEX"),
+    ("fsm_state_before","STRING","YES","FSM state before",""),
+    ("fsm_state_after","STRING","YES","FSM state after",""),
     ("trace_id","STRING","YES","Distributed trace id","INDEX"),
     ("parent_message_id","STRING","YES","Parent message id",""),
-    ("idempotency_key","STRING","YES","Idempotency key","INDEX"),
-    ("created_at","TIMESTAMP","NO","Persist time","INDEX"),
+    ("idempotency_key","STRING","YES","Idempotency key","INDEX(tenant_idempotency:2)"),
+    ("created_at","TIMESTAMP","NO","Persist time","PK|PARTITION(RANGE:MONTH)|INDEX(tenant_conversation_time:3)|INDEX(tenant_user_time:3)"),
     ("received_at","TIMESTAMP","YES","Ingress time",""),
     ("processed_at","TIMESTAMP","YES","Processing completion time",""),
     ("latency_ms","INT","YES","End-to-end latency ms",""),
-    ("status","ENUM(ok|error|timeout|dropped)","NO","Final status","INDEX"),
+    ("status","ENUM(ok|error|timeout|dropped)","NO","Final status",""),
     ("error_code","STRING","YES","Normalized error code",""),
     ("error_message","STRING","YES","Sanitized error message",""),
 ]
-df_conversation_message_schema = pd.DataFrame(conversation_message_schema, columns=["column_name","data_type","nullable","semantics","index_hint"])
+pipeline.static_table("ConversationMessageTableSchema.csv", schema_columns, conversation_message_schema)
 
 # Additional schemas (minimal) for completeness
 conversation_schema = [
-    ("conversation_id","STRING","NO","PK","INDEX"),
-    ("tenant_id","STRING","NO","Tenant boundary","INDEX"),
-    ("user_id","STRING","YES","End-user","INDEX"),
-    ("channel","ENUM(whatsapp|web|ios|android|api)","NO","Primary channel","INDEX"),
-    ("status","ENUM(open|closed|archived)","NO","Conversation status","INDEX"),
-    ("current_fsm_state","STRING","YES","Current FSM state","INDEX"),
-    ("created_at","TIMESTAMP","NO","Created","INDEX"),
+    ("conversation_id","STRING","NO","PK","PK"),
+    ("tenant_id","STRING","NO","Tenant boundary","INDEX(tenant_activity:1)|INDEX(tenant_status_activity:1)|INDEX(tenant_user:1)"),
+    ("user_id","STRING","YES","End-user","INDEX(tenant_user:2)"),
+    ("channel","ENUM(whatsapp|web|ios|android|api)","NO","Primary channel",""),
+    ("status","ENUM(open|closed|archived)","NO","Conversation status","INDEX(tenant_status_activity:2)"),
+    ("current_fsm_state","STRING","YES","Current FSM state",""),
+    ("created_at","TIMESTAMP","NO","Created",""),
     ("updated_at","TIMESTAMP","NO","Updated",""),
-    ("last_message_at","TIMESTAMP","YES","Last activity","INDEX"),
+    ("last_message_at","TIMESTAMP","YES","Last activity","INDEX(tenant_activity:2)|INDEX(tenant_status_activity:3)"),
 ]
-df_conversation_schema = pd.DataFrame(conversation_schema, columns=["column_name","data_type","nullable","semantics","index_hint"])
+pipeline.static_table("ConversationTableSchema.csv", schema_columns, conversation_schema)
 
 outbox_schema = [
-    ("outbox_id","STRING","NO","PK (ULID)","INDEX"),
-    ("tenant_id","STRING","NO","Tenant boundary","INDEX"),
+    ("outbox_id","STRING","NO","PK (ULID)","PK"),
+    ("tenant_id","STRING","NO","Tenant boundary","PK|PARTITION(HASH:8)|UNIQUE(tenant_idempotency:1)"),
     ("trace_id","STRING","YES","Trace correlation","INDEX"),
-    ("action_type","STRING","NO","Side-effect action type","INDEX"),
+    ("action_type","STRING","NO","Side-effect action type",""),
     ("payload","JSON","NO","Action payload",""),
-    ("idempotency_key","STRING","NO","Idempotency key","INDEX"),
-    ("status","ENUM(pending|processing|done|failed)","NO","Outbox status","INDEX"),
+    ("idempotency_key","STRING","NO","Idempotency key","UNIQUE(tenant_idempotency:2)"),
+    ("status","ENUM(pending|processing|done|failed)","NO","Outbox status","INDEX(due:1)"),
     ("attempt","INT","NO","Attempt count",""),
-    ("next_run_at","TIMESTAMP","YES","Next scheduled run","INDEX"),
-    ("created_at","TIMESTAMP","NO","Created","INDEX"),
+    ("next_run_at","TIMESTAMP","YES","Next scheduled run","INDEX(due:2)"),
+    ("created_at","TIMESTAMP","NO","Created",""),
     ("updated_at","TIMESTAMP","NO","Updated",""),
 ]
-df_outbox_schema = pd.DataFrame(outbox_schema, columns=["column_name","data_type","nullable","semantics","index_hint"])
+pipeline.static_table("OutboxEventTableSchema.csv", schema_columns, outbox_schema)
 
 audit_schema = [
-    ("audit_id","STRING","NO","PK (ULID)","INDEX"),
-    ("tenant_id","STRING","NO","Tenant boundary","INDEX"),
+    ("audit_id","STRING","NO","PK (ULID)","PK"),
+    ("seq","INT","NO","Position in the hash chain (0-based)","INDEX"),
+    ("tenant_id","STRING","NO","Tenant boundary","INDEX(tenant_time:1)|INDEX(tenant_decision_time:1)"),
     ("trace_id","STRING","YES","Trace correlation","INDEX"),
     ("actor_type","ENUM(HUMAN|AGENT|SYSTEM|TOOL)","NO","Actor type",""),
     ("actor_id","STRING","YES","Actor id",""),
-    ("decision_type","STRING","NO","Decision/action type","INDEX"),
-    ("decision_outcome","STRING","NO","Outcome","INDEX"),
+    ("decision_type","STRING","NO","Decision/action type","INDEX(tenant_decision_time:2)"),
+    ("decision_outcome","STRING","NO","Outcome",""),
     ("inputs_hash","STRING","YES","Hash of inputs",""),
     ("outputs_hash","STRING","YES","Hash of outputs",""),
     ("hash_chain_prev","STRING","YES","Previous hash chain value",""),
     ("hash_chain_curr","STRING","NO","Current hash chain value",""),
-    ("created_at","TIMESTAMP","NO","Created","INDEX"),
+    ("created_at","TIMESTAMP","NO","Created","PK|PARTITION(RANGE:MONTH)|INDEX(tenant_time:2)|INDEX(tenant_decision_time:3)"),
 ]
-df_audit_schema = pd.DataFrame(audit_schema, columns=["column_name","data_type","nullable","semantics","index_hint"])
-
-# --- Save all tables as CSVs and zip them ---
-tables = {
-    "OfficialPrefixRegistry.csv": df_official_prefix,
-    "ExtendedPrefixRegistry.csv": df_extended_prefix,
-    "RootNamespaceMap.csv": df_root_map,
-    "RootPrefixFamilyMatrix.csv": df_root_prefix_family_matrix,
-    "DescriptorCatalog.csv": df_descriptor_catalog,
-    "DescriptorFamilyRules.csv": df_descriptor_family_rules,
-    "SignalCatalog.csv": df_signal_catalog,
-    "ThresholdTokenCatalog.csv": df_threshold_catalog,
-    "AlertTemplateCatalog.csv": df_alert_templates,
-    "SLOTemplateCatalog.csv": df_slo_templates,
-    "DashboardCatalog.csv": df_dashboards,
-    "ArtifactTypeRules.csv": df_artifact_rules,
-    "LintRuleCatalog.csv": df_lint_rules,
-    "NamingTestSuite.csv": df_test_suite,
-    "ConversationMessageTableSchema.csv": df_conversation_message_schema,
-    "ConversationTableSchema.csv": df_conversation_schema,
-    "OutboxEventTableSchema.csv": df_outbox_schema,
-    "AuditLogTableSchema.csv": df_audit_schema,
-}
-
-for name, df in tables.items():
-    df.to_csv(out_dir / name, index=False)
-
-zip_path = Path("governance/system_tables_bundle.zip")
-with zipfile.ZipFile(zip_path, "w", compression=zipfile.ZIP_DEFLATED) as z:
-    for name in tables.keys():
-        z.write(out_dir / name, arcname=name)
-
-print(f"Generated {len(tables)} CSV files in {out_dir}")
-print(f"Created zip bundle at {zip_path}")
+pipeline.static_table("AuditLogTableSchema.csv", schema_columns, audit_schema)
+
+# Merkle checkpoint over each fixed-size segment of the audit chain (see audit_chain.py)
+audit_checkpoint_schema = [
+    ("checkpoint_seq","INT","NO","Checkpoint number (0-based)","PK"),
+    ("first_seq","INT","NO","First audit seq covered",""),
+    ("last_seq","INT","NO","Last audit seq covered","INDEX"),
+    ("merkle_root","STRING","NO","Merkle root over the segment's entry hashes",""),
+    ("chain_head","STRING","NO","hash_chain_curr at last_seq",""),
+    ("checkpoint_hash","STRING","NO","Hash of previous checkpoint_hash, merkle_root, chain_head and last_seq",""),
+    ("created_at","TIMESTAMP","NO","Created",""),
+]
+pipeline.static_table("AuditCheckpointTableSchema.csv", schema_columns, audit_checkpoint_schema)
+
+# --- Binary catalog of every table for mmap-sharing runtime validators (see binary_catalog.py) ---
+@pipeline.artifact(catalog_file, depends=tuple(pipeline.tables), write=write_catalog)
+def binary_catalog(*tables):
+    return catalog_document(dict(zip(pipeline.nodes[catalog_file].depends, tables)))
+
+# --- Indexed SQLite build of every table for tooling and dashboards (see catalog_db.py) ---
+@pipeline.artifact(database_file, depends=tuple(pipeline.tables), write=write_database)
+def catalog_database(*tables):
+    return database_document(dict(zip(pipeline.nodes[database_file].depends, tables)))
+
+# --- Build, save changed tables and bundle them (see bundle.py) ---
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate the SSOT governance tables.")
+    parser.add_argument("--force", action="store_true", help="rewrite every output, ignoring ssot_manifest.json")
+    parser.add_argument("--workers", type=int, default=None, help="build threads (default: executor default)")
+    instrument.add_arguments(parser)
+    args = parser.parse_args(argv)
+
+    stages = instrument.from_args("generate_ssot", args)
+    # tracemalloc peaks are process-wide: build one node at a time so each peak belongs to one table
+    workers = 1 if args.trace_memory else args.workers
+    with stages.stage("run", "generate_ssot"):
+        written = pipeline.run(out_dir, force=args.force, workers=workers, instrument=stages)
+
+        if any(name in pipeline.tables for name in written) or not zip_path.exists() or not bundle_manifest_path.exists():
+            with stages.stage("bundle", zip_path.name) as stage:
+                bundle = write_bundle(pipeline.tables, out_dir)
+                stage.wrote(zip_path)
+            print(f"Created zip bundle at {zip_path} ({bundle['bundle']['file']})")
+        else:
+            print(f"Zip bundle unchanged at {zip_path}")
+
+    print(f"Wrote {len(written)} of {len(pipeline.outputs)} outputs in {out_dir}")
+    instrument.finish(stages, args)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
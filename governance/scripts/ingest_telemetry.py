@@ -0,0 +1,357 @@
+"""Server-side ingestion that rolls TelemetryEvents up into SignalCatalog metrics.
+
+Input is one JSON object per line: either a LogEntry as src/utils/logger.ts
+prints it (`{"timestamp", "level", "message", "telemetry": {...}, ...}`) or a
+bare TelemetryEvent (`{"prefix", "scope", "descriptor", "value"?, "unit"?}`, the
+shape generate_sdk.py emits). Lines come from a local socket (unix or TCP),
+a file being tailed, or both.
+
+Every event is validated against the catalogs, using binary_catalog.EventValidator
+over the mmap'd catalog.gcat with the same rule as the SDK's validateEvent, and
+then folded into per-area aggregates. Every --interval seconds each area emits:
+
+    OTEL-METRIC-<AREA>-REQUEST_RATE   events per second
+    OTEL-METRIC-<AREA>-ERROR_RATE     share of events that are errors (level
+                                      ERROR/CRITICAL, or a *_FAIL / *_TIMEOUT /
+                                      *_REJECTED descriptor)
+    OTEL-METRIC-<AREA>-LATENCY_P50/P95/P99   from events with unit "ms"
+                                      (quantile_sketch.DDSketch, 1% rel. error)
+
+A signal is emitted only in the areas its SignalCatalog row allows (e.g.
+REQUEST_RATE only for OBS, INGRESS and API). Events that fail validation or
+do not parse (including non-string prefix/scope/descriptor fields) are counted
+in the ingest stats and dropped, as is a line longer than READ_LIMIT (1 MiB),
+which is skipped whole up to its newline; latencies that are not finite numbers
+are left out of the sketches. governance/tests/test_ingest_telemetry.py covers
+these cases.
+
+Flow control: readers put lines on a bounded asyncio.Queue (--queue). When the
+aggregator falls behind, `await queue.put()` blocks, so the tail stops reading
+and socket readers stop draining their streams. The kernel buffers then fill
+and TCP/unix flow control slows the senders down; nothing is buffered without
+bound. The consumer takes lines in batches of up to --batch, so parsing and
+validation run without a task switch per event.
+
+Usage (from the repo root):
+    python3 governance/scripts/ingest_telemetry.py --unix /tmp/telemetry.sock [--interval 10] [--out signals.jsonl]
+    python3 governance/scripts/ingest_telemetry.py --tcp 127.0.0.1:4319 --tail logs/app.jsonl
+"""
+import argparse
+import asyncio
+import json
+import math
+import signal
+import sys
+import time
+from collections import Counter, namedtuple
+from pathlib import Path
+
+from binary_catalog import BinaryCatalog, EventValidator, catalog_file, definitions_dir
+from quantile_sketch import PERCENTILES, DDSketch
+
+ERROR_LEVELS = frozenset({"ERROR", "CRITICAL"})
+ERROR_SUFFIXES = ("_FAIL", "_TIMEOUT", "_REJECTED")
+LATENCY_UNIT = "ms"
+READ_LIMIT = 1 << 20  # longest accepted line
+
+SignalPoint = namedtuple("SignalPoint", ["name", "area", "signal", "value", "count", "start", "end"])
+
+
+def latency_ms(value):
+    """A finite float for a JSON number, else None (1e400 and NaN parse as inf/nan, huge ints overflow)."""
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return None
+    try:
+        value = float(value)
+    except OverflowError:
+        return None
+    return value if math.isfinite(value) else None
+
+
+class AreaWindow:
+    __slots__ = ("events", "errors", "latency")
+
+    def __init__(self):
+        self.events = 0
+        self.errors = 0
+        self.latency = DDSketch()
+
+
+class SignalAggregator:
+    """Validates parsed lines and keeps per-area counters and latency sketches for one window."""
+
+    def __init__(self, validator, signal_areas, clock=time.time):
+        self.validator = validator
+        self.signal_areas = signal_areas  # signal -> set of areas it may be reported for
+        self.clock = clock
+        self.areas = {}
+        self.stats = Counter()
+        self.start = clock()
+        self._valid = {}  # (prefix, scope, descriptor) -> bool
+
+    @classmethod
+    def from_catalog(cls, catalog, **kwargs):
+        signals = catalog.table("SignalCatalog.csv")
+        allowed = signals.columns.index("allowed_areas")
+        signal_areas = {row[0]: set(row[allowed].split("|")) for row in signals}
+        return cls(EventValidator(catalog), signal_areas, **kwargs)
+
+    def add_lines(self, lines):
+        for line in lines:
+            try:
+                entry = json.loads(line)
+                if not isinstance(entry, dict):
+                    raise ValueError("not a JSON object")
+                self.add(entry)
+            except Exception:  # one bad line must not take the consumer (and the ingestor) down
+                self.stats["malformed"] += 1
+
+    def add(self, entry):
+        telemetry = entry.get("telemetry") if "prefix" not in entry else entry
+        if not telemetry:
+            self.stats["untyped"] += 1
+            return
+        try:
+            key = (telemetry["prefix"], telemetry["scope"], telemetry["descriptor"])
+        except (KeyError, TypeError):
+            self.stats["malformed"] += 1
+            return
+        if not all(isinstance(part, str) for part in key):  # also keeps unhashable values out of the cache
+            self.stats["malformed"] += 1
+            return
+        valid = self._valid.get(key)
+        if valid is None:
+            valid = self._valid[key] = self.validator.validate(*key)
+        if not valid:
+            self.stats["rejected"] += 1
+            return
+        latency = latency_ms(telemetry.get("value")) if telemetry.get("unit") == LATENCY_UNIT else None
+        area = self.areas.get(key[1])
+        if area is None:
+            area = self.areas[key[1]] = AreaWindow()
+        area.events += 1
+        if entry.get("level") in ERROR_LEVELS or key[2].endswith(ERROR_SUFFIXES):
+            area.errors += 1
+        if latency is not None and key[2] not in PERCENTILES:
+            area.latency.add(latency)
+        self.stats["accepted"] += 1
+
+    def flush(self):
+        """Close the window; returns its SignalPoints and starts the next one."""
+        end = self.clock()
+        seconds = max(end - self.start, 1e-9)
+        points = []
+        for name, area in sorted(self.areas.items()):
+            values = {"REQUEST_RATE": (area.events / seconds, area.events),
+                      "ERROR_RATE": (area.errors / area.events, area.events)}
+            if area.latency.count:
+                signals = list(PERCENTILES)
+                for signal_name, value in zip(signals, area.latency.quantiles([PERCENTILES[s] for s in signals])):
+                    values[signal_name] = (value, area.latency.count)
+            for signal_name, (value, count) in values.items():
+                if name in self.signal_areas.get(signal_name, ()):
+                    points.append(SignalPoint(f"OTEL-METRIC-{name}-{signal_name}", name, signal_name, value, count,
+                                              self.start, end))
+        self.areas = {}
+        self.start = end
+        return points
+
+
+class TelemetryIngestor:
+    def __init__(self, aggregator, interval=10.0, batch_size=500, queue_size=10_000, emit=None):
+        self.aggregator = aggregator
+        self.interval = interval
+        self.batch_size = batch_size
+        self.queue = asyncio.Queue(queue_size)
+        self.emit = emit or (lambda name, value, **attributes: None)
+        self.servers = []
+        self.bytes_in = 0
+        self.max_queued = 0
+
+    async def submit(self, line):
+        self.bytes_in += len(line)
+        await self.queue.put(line)
+        if self.queue.qsize() > self.max_queued:
+            self.max_queued = self.queue.qsize()
+
+    # --- Sources ---
+
+    async def _read_stream(self, reader, writer):
+        skipping = False  # inside a line longer than READ_LIMIT, dropped up to its newline
+        try:
+            while True:
+                try:
+                    line = await reader.readuntil(b"\n")
+                except asyncio.LimitOverrunError as e:
+                    # Nothing is consumed on an overrun: discard what is buffered of the line
+                    # (up to its newline if that arrived) and count the line once
+                    if not skipping:
+                        self.aggregator.stats["malformed"] += 1
+                        skipping = True
+                    await reader.readexactly(e.consumed)
+                    continue
+                except asyncio.IncompleteReadError as e:
+                    line = e.partial  # the stream ended mid-line
+                    if not line:
+                        break
+                if skipping:
+                    skipping = False  # the rest of the over-long line
+                elif line.strip():
+                    await self.submit(line)
+        finally:
+            writer.close()
+
+    async def serve_unix(self, path):
+        Path(path).unlink(missing_ok=True)
+        self.servers.append(await asyncio.start_unix_server(self._read_stream, path, limit=READ_LIMIT))
+
+    async def serve_tcp(self, host, port):
+        self.servers.append(await asyncio.start_server(self._read_stream, host, port, limit=READ_LIMIT))
+
+    async def tail(self, path, poll=0.2, from_start=False):
+        """Follow `path` like `tail -F`: new lines, truncation and replacement are picked up.
+
+        A line longer than READ_LIMIT is counted as malformed and skipped up to its
+        newline, as on the sockets, so `partial` stays bounded.
+        """
+        handle, inode, partial, skipping = None, None, b"", False
+        try:
+            while True:
+                if handle is None:
+                    try:
+                        handle = open(path, "rb")
+                    except FileNotFoundError:
+                        from_start = True  # everything in a file that appears later is new
+                        await asyncio.sleep(poll)
+                        continue
+                    inode = Path(path).stat().st_ino
+                    if not from_start:
+                        handle.seek(0, 2)
+                    from_start = True  # replacements are read from their start
+                chunk = handle.readline(READ_LIMIT)
+                if chunk:
+                    if skipping:
+                        skipping = not chunk.endswith(b"\n")
+                        continue
+                    partial += chunk
+                    if len(partial) > READ_LIMIT + partial.endswith(b"\n"):
+                        self.aggregator.stats["malformed"] += 1
+                        skipping = not partial.endswith(b"\n")
+                        partial = b""
+                    elif partial.endswith(b"\n"):
+                        if partial.strip():
+                            await self.submit(partial)
+                        partial = b""
+                    continue
+                await asyncio.sleep(poll)
+                try:
+                    stat = Path(path).stat()
+                except FileNotFoundError:
+                    continue
+                if stat.st_ino != inode or stat.st_size < handle.tell():
+                    handle.close()
+                    handle, partial, skipping = None, b"", False
+        finally:
+            if handle is not None:
+                handle.close()
+
+    # --- Consumer ---
+
+    async def _consume(self):
+        while True:
+            batch = [await self.queue.get()]
+            while len(batch) < self.batch_size and not self.queue.empty():
+                batch.append(self.queue.get_nowait())
+            self.aggregator.add_lines(batch)
+            self.aggregator.stats["batches"] += 1
+            for _ in batch:
+                self.queue.task_done()
+
+    def flush(self):
+        points = self.aggregator.flush()
+        for point in points:
+            self.emit(point.name, point.value, area=point.area, count=point.count, start=point.start, end=point.end)
+        return points
+
+    async def _flush_every(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            self.flush()
+
+    async def run(self, sources, stop):
+        """Run the given source coroutines until `stop` (an asyncio.Event) is set, then drain and flush.
+
+        If the consumer dies, nothing would drain the queue again, so the readers are
+        shut down and its exception is raised here instead of waiting on the queue.
+        """
+        consumer = asyncio.create_task(self._consume())
+        flusher = asyncio.create_task(self._flush_every())
+        readers = [asyncio.create_task(source) for source in sources]
+        stopped = asyncio.create_task(stop.wait())
+        drained = None
+        try:
+            await asyncio.wait((stopped, consumer), return_when=asyncio.FIRST_COMPLETED)
+            for server in self.servers:
+                server.close()
+                await server.wait_closed()
+            for task in readers:
+                task.cancel()
+            await asyncio.gather(*readers, return_exceptions=True)
+            if not consumer.done():
+                drained = asyncio.create_task(self.queue.join())
+                await asyncio.wait((drained, consumer), return_when=asyncio.FIRST_COMPLETED)
+            if consumer.done():
+                consumer.result()  # the consumer only returns by raising
+        finally:
+            for task in (stopped, drained, flusher, consumer):
+                if task is not None:
+                    task.cancel()
+            await asyncio.gather(stopped, flusher, consumer, *([drained] if drained else []), return_exceptions=True)
+        return self.flush()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Aggregate TelemetryEvent lines into catalog signals.")
+    parser.add_argument("--unix", help="listen on this unix socket path")
+    parser.add_argument("--tcp", help="listen on HOST:PORT")
+    parser.add_argument("--tail", action="append", default=[], help="follow this JSON-lines file (repeatable)")
+    parser.add_argument("--from-start", action="store_true", help="read tailed files from the beginning")
+    parser.add_argument("--interval", type=float, default=10.0, help="seconds per aggregation window")
+    parser.add_argument("--batch", type=int, default=500, help="lines validated per consumer batch")
+    parser.add_argument("--queue", type=int, default=10_000, help="queued lines before readers are paused")
+    parser.add_argument("--out", type=Path, help="append signal points as JSON lines here (default stdout)")
+    parser.add_argument("--catalog", default=str(definitions_dir / catalog_file), help="catalog.gcat path")
+    args = parser.parse_args(argv)
+    if not (args.unix or args.tcp or args.tail):
+        parser.error("give at least one of --unix, --tcp or --tail")
+
+    out = args.out.open("a", encoding="utf-8") if args.out else sys.stdout
+
+    def emit(name, value, **attributes):
+        out.write(json.dumps({"name": name, "value": value, **attributes}) + "\n")
+        out.flush()
+
+    async def serve(catalog):
+        ingestor = TelemetryIngestor(SignalAggregator.from_catalog(catalog), args.interval, args.batch,
+                                     args.queue, emit)
+        if args.unix:
+            await ingestor.serve_unix(args.unix)
+        if args.tcp:
+            host, _, port = args.tcp.rpartition(":")
+            await ingestor.serve_tcp(host or "127.0.0.1", int(port))
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, stop.set)
+        await ingestor.run([ingestor.tail(path, from_start=args.from_start) for path in args.tail], stop)
+        print(f"ingest stats: {dict(ingestor.aggregator.stats)}", file=sys.stderr)
+
+    with BinaryCatalog(args.catalog) as catalog:
+        asyncio.run(serve(catalog))
+    if args.out:
+        out.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
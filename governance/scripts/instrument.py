@@ -0,0 +1,208 @@
+"""Per-stage instrumentation for the catalog generators.
+
+A stage is one timed unit of a generator run: building or writing one table,
+writing one SDK module, bundling. For each stage it records:
+
+    wall time        SSOT_STAGE_DURATION_MS   (time.perf_counter)
+    peak allocation  SSOT_STAGE_ALLOC_PEAK    (tracemalloc, bytes above the stage's start; --trace-memory)
+    output size      SSOT_STAGE_OUTPUT_BYTES  (bytes written by the stage)
+    rows             SSOT_STAGE_ROWS          (rows of a built table)
+
+They are reported as OTEL-METRIC-CORE-<signal>, with generator, stage and target
+attributes. The signals are declared for CORE in SignalCatalog. With --profile
+the run is also profiled with cProfile: one profiler per thread, since the
+pipeline builds on a thread pool, merged into one pstats dump.
+
+tracemalloc's peak is process-wide, so --trace-memory makes the generators run
+nodes one at a time to keep peaks attributable to a single table. Timings are
+valid either way. Nested stages (a node inside the whole run) keep correct
+peaks.
+
+Generators take the flags with add_arguments(parser) and report with finish():
+
+    python3 governance/scripts/generate_ssot.py --force --metrics stages.jsonl --trace-memory --profile ssot.pstats
+    python3 -m pstats ssot.pstats   # then: sort cumtime / stats 20
+"""
+import json
+import sys
+import threading
+import time
+from collections import namedtuple
+from contextlib import contextmanager
+from pathlib import Path
+
+# cProfile, pstats and tracemalloc are imported on first use: every generator imports
+# this module and bench_generate_ssot.py budgets their startup time.
+
+AREA = "CORE"
+# StageRecord field -> SignalCatalog signal
+SIGNALS = {
+    "ms": "SSOT_STAGE_DURATION_MS",
+    "alloc_peak": "SSOT_STAGE_ALLOC_PEAK",
+    "output_bytes": "SSOT_STAGE_OUTPUT_BYTES",
+    "rows": "SSOT_STAGE_ROWS",
+}
+
+StageRecord = namedtuple("StageRecord", ["stage", "name", "ms", "alloc_peak", "output_bytes", "rows"])
+
+
+def metric(signal):
+    return f"OTEL-METRIC-{AREA}-{signal}"
+
+
+class Stage:
+    """Handed to the `with` body, which may set output_bytes and rows."""
+
+    __slots__ = ("stage", "name", "output_bytes", "rows", "base", "peak")
+
+    def __init__(self, stage, name):
+        self.stage = stage
+        self.name = name
+        self.output_bytes = None
+        self.rows = None
+        self.base = self.peak = 0
+
+    def wrote(self, path):
+        self.output_bytes = Path(path).stat().st_size
+
+
+class Instrumentation:
+    def __init__(self, generator, trace_memory=False, profile=False):
+        self.generator = generator
+        self.trace_memory = trace_memory
+        self.profile = profile
+        self.records = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._profiles = []
+        self._tracemalloc = None
+        self._started_tracing = False
+
+    def start(self):
+        if self.trace_memory:
+            import tracemalloc
+            self._tracemalloc = tracemalloc
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracing = True
+        return self
+
+    def stop(self):
+        if self._started_tracing:
+            self._tracemalloc.stop()
+            self._started_tracing = False
+
+    def _stack(self):
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _profiler(self):
+        profiler = getattr(self._local, "profiler", None)
+        if profiler is None:
+            import cProfile
+            profiler = self._local.profiler = cProfile.Profile()
+            with self._lock:
+                self._profiles.append(profiler)
+        return profiler
+
+    @contextmanager
+    def stage(self, stage, name=""):
+        """Time the body; with trace_memory, also its allocation peak above its starting size."""
+        record = Stage(stage, name)
+        stack = self._stack()
+        tracemalloc = self._tracemalloc
+        tracing = tracemalloc is not None and tracemalloc.is_tracing()
+        if tracing:
+            current, peak = tracemalloc.get_traced_memory()
+            if stack:
+                stack[-1].peak = max(stack[-1].peak, peak)
+            tracemalloc.reset_peak()
+            record.base = record.peak = current
+        profiler = self._profiler() if self.profile and not stack else None
+        stack.append(record)
+        if profiler is not None:
+            profiler.enable()
+        start = time.perf_counter()
+        try:
+            yield record
+        finally:
+            elapsed = (time.perf_counter() - start) * 1000
+            if profiler is not None:
+                profiler.disable()
+            stack.pop()
+            alloc_peak = None
+            if tracing:
+                record.peak = max(record.peak, tracemalloc.get_traced_memory()[1])
+                alloc_peak = record.peak - record.base
+                if stack:
+                    stack[-1].peak = max(stack[-1].peak, record.peak)
+                tracemalloc.reset_peak()
+            with self._lock:
+                self.records.append(StageRecord(stage, name, elapsed, alloc_peak, record.output_bytes, record.rows))
+
+    def report(self, emit):
+        for record in self.records:
+            for field, signal in SIGNALS.items():
+                value = getattr(record, field)
+                if value is not None:
+                    emit(metric(signal), value, generator=self.generator, stage=record.stage, target=record.name)
+
+    def summary(self, out=sys.stdout, top=15):
+        records = sorted(self.records, key=lambda r: r.ms, reverse=True)[:top]
+        out.write(f"{'stage':8} {'name':40} {'ms':>9} {'alloc KiB':>10} {'bytes':>10} {'rows':>7}\n")
+        for r in records:
+            alloc = f"{r.alloc_peak / 1024:,.1f}" if r.alloc_peak is not None else "-"
+            size = f"{r.output_bytes:,}" if r.output_bytes is not None else "-"
+            rows = f"{r.rows:,}" if r.rows is not None else "-"
+            out.write(f"{r.stage:8} {r.name[:40]:40} {r.ms:9.2f} {alloc:>10} {size:>10} {rows:>7}\n")
+
+    def dump_profile(self, path):
+        with self._lock:
+            profiles = list(self._profiles)
+        if profiles:
+            import pstats
+            pstats.Stats(*profiles).dump_stats(str(path))
+
+
+class NullInstrumentation:
+    """Stand-in when no instrumentation was asked for; stages cost one generator frame."""
+
+    @contextmanager
+    def stage(self, stage, name=""):
+        yield Stage(stage, name)
+
+
+NULL = NullInstrumentation()
+
+
+def add_arguments(parser):
+    group = parser.add_argument_group("instrumentation")
+    group.add_argument("--metrics", type=Path, help="write per-stage OTEL-METRIC points as JSON lines")
+    group.add_argument("--trace-memory", action="store_true", help="record tracemalloc peaks per stage (serial run)")
+    group.add_argument("--profile", type=Path, help="write a cProfile (pstats) dump of the run")
+    group.add_argument("--timings", action="store_true", help="print the slowest stages")
+
+
+def from_args(generator, args):
+    """A started Instrumentation when any instrumentation flag was given, else NULL."""
+    if not (args.metrics or args.trace_memory or args.profile or args.timings):
+        return NULL
+    return Instrumentation(generator, trace_memory=args.trace_memory, profile=bool(args.profile)).start()
+
+
+def finish(instrumentation, args):
+    if instrumentation is NULL:
+        return
+    instrumentation.stop()
+    if args.metrics:
+        with open(args.metrics, "w", encoding="utf-8") as f:
+            instrumentation.report(lambda name, value, **attributes: f.write(
+                json.dumps({"name": name, "value": value, **attributes}) + "\n"))
+        print(f"Wrote {len(instrumentation.records)} stage records to {args.metrics}")
+    if args.profile:
+        instrumentation.dump_profile(args.profile)
+        print(f"Wrote cProfile dump to {args.profile}")
+    if args.timings or args.trace_memory:
+        instrumentation.summary()
@@ -0,0 +1,166 @@
+"""Stream JSONL telemetry exports through the naming rules on a process pool.
+
+Records are `TelemetryEvent` objects (prefix/scope/descriptor, see generate_sdk.py),
+either at the top level or nested under `telemetry` as the logger's LogEntry does.
+Input is read in byte-bounded chunks of lines; at most `2 * workers` chunks are in
+flight, so memory stays flat regardless of export size. Each worker compiles the
+catalogs once and lints every distinct name in a chunk a single time.
+
+Usage (from the repo root):
+    python3 governance/scripts/lint_telemetry.py exports/*.jsonl
+    zcat dump.jsonl.gz | python3 governance/scripts/lint_telemetry.py - --json
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from naming_lint import DENY, NamingLinter, definitions_dir
+
+DEFAULT_CHUNK_MB = 8
+DEFAULT_TOP = 20
+# Distinct offenders kept between merges; pruning keeps the heaviest hitters.
+OFFENDER_LIMIT = 100_000
+
+_linter = None
+
+
+def _init_worker(source_dir):
+    global _linter
+    _linter = NamingLinter(source_dir)
+
+
+def event_name(record):
+    event = record.get('telemetry', record) if isinstance(record, dict) else None
+    if not isinstance(event, dict):
+        return None
+    prefix, scope, descriptor = event.get('prefix'), event.get('scope'), event.get('descriptor')
+    if not (prefix and scope and descriptor):
+        return None
+    return f"{prefix}-{scope}-{descriptor}"
+
+
+def lint_chunk(lines):
+    names = Counter()
+    malformed = skipped = 0
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError:
+            malformed += 1
+            continue
+        name = event_name(record)
+        if name is None:
+            skipped += 1
+        else:
+            names[name] += 1
+
+    rule_counts = Counter()
+    offenders = Counter()
+    denied = 0
+    for name, count in names.items():
+        result = _linter.check(name)
+        for rule_id in result.violations:
+            rule_counts[rule_id] += count
+        if result.verdict == DENY:
+            denied += count
+            offenders[name] += count
+    return {
+        'linted': sum(names.values()),
+        'denied': denied,
+        'malformed': malformed,
+        'skipped': skipped,
+        'rules': rule_counts,
+        'offenders': offenders,
+    }
+
+
+def read_chunks(paths, chunk_bytes):
+    for path in paths:
+        stream = sys.stdin.buffer if path == "-" else open(path, 'rb')
+        try:
+            while True:
+                lines = stream.readlines(chunk_bytes)
+                if not lines:
+                    break
+                yield lines
+        finally:
+            if stream is not sys.stdin.buffer:
+                stream.close()
+
+
+class Report:
+    def __init__(self):
+        self.totals = Counter()
+        self.rules = Counter()
+        self.offenders = Counter()
+
+    def merge(self, partial):
+        for key in ('linted', 'denied', 'malformed', 'skipped'):
+            self.totals[key] += partial[key]
+        self.rules.update(partial['rules'])
+        self.offenders.update(partial['offenders'])
+        if len(self.offenders) > 2 * OFFENDER_LIMIT:
+            self.offenders = Counter(dict(self.offenders.most_common(OFFENDER_LIMIT)))
+
+
+def lint_stream(paths, source_dir=None, workers=None, chunk_mb=DEFAULT_CHUNK_MB):
+    workers = workers or os.cpu_count() or 1
+    report = Report()
+    pending = set()
+    with ProcessPoolExecutor(workers, initializer=_init_worker,
+                             initargs=(str(source_dir or definitions_dir),)) as pool:
+        for lines in read_chunks(paths, chunk_mb << 20):
+            if len(pending) >= 2 * workers:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    report.merge(future.result())
+            pending.add(pool.submit(lint_chunk, lines))
+        for future in pending:
+            report.merge(future.result())
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Lint telemetry names in JSONL exports.")
+    parser.add_argument("paths", nargs="+", help="JSONL files ('-' for stdin)")
+    parser.add_argument("--definitions", default=str(definitions_dir), help="catalog CSV directory")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--chunk-mb", type=int, default=DEFAULT_CHUNK_MB, help="input chunk size in MiB")
+    parser.add_argument("--top", type=int, default=DEFAULT_TOP, help="worst offenders to report")
+    parser.add_argument("--json", action="store_true", help="emit the report as JSON")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    report = lint_stream(args.paths, args.definitions, args.workers, args.chunk_mb)
+    elapsed = time.perf_counter() - start
+    severity = NamingLinter(args.definitions).severity
+
+    if args.json:
+        print(json.dumps({
+            **report.totals,
+            'seconds': round(elapsed, 3),
+            'rules': {rule_id: {'severity': severity.get(rule_id, "ERROR"), 'count': count}
+                      for rule_id, count in report.rules.most_common()},
+            'offenders': report.offenders.most_common(args.top),
+        }, indent=2))
+    else:
+        totals = report.totals
+        print(f"Linted {totals['linted']} events in {elapsed:.2f}s "
+              f"({totals['denied']} denied, {totals['skipped']} without telemetry, {totals['malformed']} malformed)")
+        for rule_id, count in report.rules.most_common():
+            print(f"  {rule_id:24} {severity.get(rule_id, 'ERROR'):5} {count}")
+        if report.offenders:
+            print(f"Top {args.top} offenders:")
+            for name, count in report.offenders.most_common(args.top):
+                print(f"  {count:>10}  {name}")
+    return 1 if report.totals['denied'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
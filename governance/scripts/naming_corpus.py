@@ -0,0 +1,552 @@
+"""Fuzzed naming corpus with verdicts from a slow reference evaluator.
+
+NamingTestSuite.csv has ten hand-written cases; this writes millions. Names come
+from two sources:
+
+    enumeration   every shape the catalogs can form: each prefix (hyphenated
+                  ones like 80053-AU and CSF-GV included) under each root and
+                  some non-roots, as telemetry (`<P>-<ROOT>-<DESCRIPTOR>`),
+                  documents (`<P>-<ROOT>-DOC-<KIND>[-<DESCRIPTOR>]`) and
+                  runbooks, every alert and SLO token combination, and the
+                  template names
+    fuzzing       --fuzz mutations of enumerated names, half of them seeded
+                  from names the reference allowed: swapped roots and
+                  prefixes, prefixes cut at their hyphen, conditional cells
+                  (e.g. RAG-CITE vs RAG-INGEST under LLM), unknown descriptors
+                  built from family globs, provider/ambiguous tokens, case and
+                  separator changes, empty, dropped, doubled and truncated
+                  segments
+
+Every name is judged by ReferenceEvaluator, which applies LintRuleCatalog rule by
+rule straight off the catalog records, with linear scans and a regex per glob.
+It imports nothing from naming_lint (no precomputed verdicts, hash maps, pattern
+automata or token lists), so the two can be diffed at scale: the ambiguous tokens
+are read from the NO_AMBIGUOUS_TOKENS rule's semantics in LintRuleCatalog, and
+the provider names, which no catalog lists, are a second copy kept here so a
+change to either list shows up as mismatches. It judges ~9k
+names/s, ~10x slower than the linter's rule evaluator, so the corpus is judged
+on a process pool, a bounded number of chunks at a time, and written in
+generation order. The default corpus (2.3M enumerated + 1M fuzzed) takes about
+six CPU-minutes.
+
+Most of the namespace is invalid, so the corpus is overwhelmingly DENY (about
+0.4% ALLOW by default); bench_naming_lint.py times the two verdicts separately.
+
+Output is CSV in NamingTestSuite's layout plus the expected violations:
+
+    expected,example_name,violations
+    DENY,OTEL-LOG-CORE-OIDC_LOGIN_OK,DESCRIPTOR_VOCAB_ONLY
+
+Usage (from the repo root):
+    python3 governance/scripts/naming_corpus.py --out corpus.csv [--fuzz 1000000] [--seed 1] [--workers N]
+    python3 governance/scripts/bench_naming_lint.py corpus.csv     # diff + throughput of NamingLinter
+"""
+import argparse
+import csv
+import os
+import random
+import re
+import sys
+import time
+from collections import Counter, deque, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from operator import itemgetter
+
+from catalog import definitions_dir, load_catalog
+
+ALLOW = "ALLOW"
+DENY = "DENY"
+
+DEFAULT_FUZZ = 1_000_000
+CHUNK_SIZE = 20_000
+# Enumerated names kept as seeds for fuzzing
+RESERVOIR_SIZE = 100_000
+
+# Provider/brand names for NO_PROVIDER_NAMES, maintained independently of naming_lint's list
+PROVIDER_NAMES = frozenset(["AWS", "AZURE", "GCP", "GOOGLE", "CLOUDFLARE", "OPENAI", "ANTHROPIC", "STRIPE", "TWILIO"])
+
+Verdict = namedtuple("Verdict", ["name", "verdict", "violations"])
+
+NON_ROOTS = ("UNKNOWN", "core", "")
+DOC_KINDS = ("SPEC", "DESIGN", "POLICY", "CHECKLIST", "ADR", "RUNBOOK", "MEMO", "")
+
+
+def split_list(value):
+    return [item for item in (value or "").split("|") if item]
+
+
+def listed_tokens(semantics):
+    """`"Disallow MISC/TEMP/NEW/OLD/FIX in names"` -> `{"MISC", "TEMP", "NEW", "OLD", "FIX"}`."""
+    match = re.search(r"\b[A-Z]+(?:/[A-Z]+)+\b", semantics or "")
+    return frozenset(match.group(0).split("/")) if match else frozenset()
+
+
+def glob_match(pattern, value):
+    """`*` matches any run of characters; everything else is literal."""
+    return re.fullmatch(".*".join(re.escape(part) for part in pattern.split("*")), value, re.DOTALL) is not None
+
+
+# --- Reference evaluator ---
+
+class ReferenceEvaluator:
+    """LintRuleCatalog applied rule by rule to the raw catalog records; slow on purpose."""
+
+    def __init__(self, source_dir=None):
+        load = load_catalog(source_dir or definitions_dir).records
+        self.rules = load("LintRuleCatalog.csv")
+        self.roots = [row['root'] for row in load("RootNamespaceMap.csv")]
+        self.prefix_rows = load("OfficialPrefixRegistry.csv") + load("ExtendedPrefixRegistry.csv")
+        self.matrix = load("RootPrefixFamilyMatrix.csv")
+        self.artifact_rules = load("ArtifactTypeRules.csv")
+        self.descriptors = load("DescriptorCatalog.csv")
+        self.family_rules = load("DescriptorFamilyRules.csv")
+        self.signals = load("SignalCatalog.csv")
+        self.thresholds = load("ThresholdTokenCatalog.csv")
+        self.slo_names = [row['slo_name'] for row in load("SLOTemplateCatalog.csv")]
+        self.alert_names = [row['alert_name'] for row in load("AlertTemplateCatalog.csv")]
+        self.dashboard_names = [row['dashboard_doc_name'] for row in load("DashboardCatalog.csv")]
+        # Catalog-wide facts every name needs; the lookups below stay linear scans.
+        self.telemetry_types = self.typed_artifact("area")
+        self.rootless_types = self.typed_artifact("rootless")
+        self.slo_prefixes = ["-".join(slo.split("-")[:2]) for slo in self.slo_names]
+        self.windows = [row['token'] for row in self.thresholds if row['token_category'] == "WINDOW"]
+        self.typed = {"METRIC"} | {t for row in self.descriptors for t in split_list(row['allowed_types'])}
+        self.deny_overrides = self.last(self.rules, rule_id="DENY_OVERRIDES") is not None
+        ambiguous = self.last(self.rules, rule_id="NO_AMBIGUOUS_TOKENS")
+        self.ambiguous_tokens = listed_tokens(ambiguous['semantics'] if ambiguous is not None else "")
+
+    # Lookups. Later rows win, as they do when the catalogs are loaded into dicts.
+
+    def last(self, rows, **match):
+        key = itemgetter(*match)
+        wanted = tuple(match.values()) if len(match) > 1 else next(iter(match.values()))
+        for row in reversed(rows):
+            if key(row) == wanted:
+                return row
+        return None
+
+    def severity(self, rule_id):
+        row = self.last(self.rules, rule_id=rule_id)
+        return row['severity'] if row is not None else "ERROR"
+
+    def known_name(self, name):
+        return name in self.slo_names or name in self.alert_names or name in self.dashboard_names
+
+    def signal(self, name):
+        return self.last(self.signals, signal=name)
+
+    def typed_artifact(self, marker):
+        """Prefix -> artifact type for naming patterns `<P>-<AREA>-...` ("area") or `<P>-*` ("rootless")."""
+        types = {}
+        for row in self.artifact_rules:
+            pattern = row['naming_pattern']
+            if marker == "area" and "-<AREA>-" in pattern:
+                types[pattern.split("-<AREA>-")[0]] = row['artifact_type']
+            elif marker == "rootless" and "-<AREA>-" not in pattern and pattern.endswith("-*"):
+                types[pattern[:-2]] = row['artifact_type']
+        return types
+
+    def families_allow(self, prefix_row, descriptor):
+        return any(glob_match(p, descriptor) for p in split_list(prefix_row['allowed_descriptor_families']))
+
+    def area_verdict(self, area, descriptor):
+        row = self.last(self.family_rules, area=area)
+        if row is None:
+            return None
+        allowed = any(glob_match(p, descriptor) for p in split_list(row['allow_patterns']))
+        denied = any(glob_match(p, descriptor) for p in split_list(row['deny_patterns']))
+        if denied and (self.deny_overrides or not allowed):
+            return DENY
+        return ALLOW if allowed else None
+
+    # Evaluation
+
+    def evaluate(self, name):
+        violations = []
+        segments = name.split("-")
+        prefix = "-".join(segments[:2])
+        prefix_row = self.last(self.prefix_rows, prefix=prefix)
+        if len(segments) < 2 or prefix_row is None:
+            return self.result(name, ["PREFIX_REQUIRED"])
+
+        words = re.split(r"[-_]", name)
+        if any(word in PROVIDER_NAMES for word in words):
+            violations.append("NO_PROVIDER_NAMES")
+        if any(word in self.ambiguous_tokens for word in words):
+            violations.append("NO_AMBIGUOUS_TOKENS")
+
+        tail = segments[2:]
+        if prefix in self.rootless_types:
+            self.alert(name, prefix, prefix_row, tail, violations)
+        elif tail and tail[0] == "RUNBOOK":
+            self.runbook(prefix, prefix_row, tail[1:], violations)
+        elif not tail or tail[0] not in self.roots:
+            violations.append("AREA_CONTROLLED")
+        elif prefix in self.slo_prefixes and (len(tail) < 2 or tail[1] != "DOC"):
+            self.slo(name, tail, violations)
+        else:
+            root, body = tail[0], tail[1:]
+            self.root_compatible(prefix, prefix_row, root, violations)
+            if prefix in self.telemetry_types:
+                artifact_type = self.telemetry_types[prefix]
+                self.type_binding(prefix, prefix_row, artifact_type, root, violations)
+                descriptor = "-".join(body)
+                if not descriptor:
+                    violations.append("DESCRIPTOR_REQUIRED")
+                elif not self.descriptor_allowed(name, root, artifact_type, descriptor, prefix_row, True):
+                    violations.append("DESCRIPTOR_VOCAB_ONLY")
+            elif body and body[0] == "DOC":
+                kind = body[1] if len(body) > 1 else ""
+                self.type_binding(prefix, prefix_row, f"DOC-{kind}", root, violations)
+                descriptor = "-".join(body[2:])
+                if descriptor and not self.descriptor_allowed(name, root, "DOC", descriptor, prefix_row, False):
+                    violations.append("DESCRIPTOR_VOCAB_ONLY")
+            else:
+                violations.append("TYPE_BINDING")
+        return self.result(name, violations)
+
+    def result(self, name, violations):
+        violations = tuple(dict.fromkeys(violations))
+        denied = any(self.severity(rule_id) == "ERROR" for rule_id in violations)
+        return Verdict(name, DENY if denied else ALLOW, violations)
+
+    def root_compatible(self, prefix, prefix_row, root, violations):
+        family = prefix.split("-")[0]
+        cell = self.last(self.matrix, root=root, prefix_family=family)
+        decision = cell['decision'] if cell is not None else DENY
+        if decision == DENY or root not in split_list(prefix_row['allowed_roots']):
+            violations.append("ROOT_COMPATIBLE")
+        if decision == "CONDITIONAL":
+            condition = cell['condition']
+            allowed = split_list(condition[len("ALLOW only "):]) if condition.startswith("ALLOW only ") else []
+            if prefix not in allowed:
+                violations.append("SUBPREFIX_ALLOWED")
+
+    def type_binding(self, prefix, prefix_row, artifact_type, root, violations):
+        row = self.last(self.artifact_rules, artifact_type=artifact_type)
+        if row is None or artifact_type not in split_list(prefix_row['allowed_artifact_types']):
+            violations.append("TYPE_BINDING")
+            return
+        allowed_prefixes = split_list(row['allowed_prefixes'])
+        if row['allowed_roots'] == "ALL":
+            roots = self.roots
+        elif row['allowed_roots'] == "ALL_RUNTIME":
+            roots = [r for p in allowed_prefixes if self.last(self.prefix_rows, prefix=p) is not None
+                     for r in split_list(self.last(self.prefix_rows, prefix=p)['allowed_roots'])]
+        else:
+            roots = split_list(row['allowed_roots'])
+        if root is not None and root not in roots:
+            violations.append("TYPE_BINDING")
+        elif prefix not in allowed_prefixes and prefix.split("-")[0] not in allowed_prefixes:
+            violations.append("TYPE_BINDING")
+
+    def descriptor_allowed(self, name, area, kind, descriptor, prefix_row, require_both):
+        if self.known_name(name):
+            return True
+        area_verdict = self.area_verdict(area, descriptor)
+        if area_verdict == DENY:
+            return False
+        row = self.last(self.descriptors, area=area, descriptor=descriptor)
+        if row is not None and kind in split_list(row['allowed_types']):
+            return True
+        signal = self.signal(descriptor)
+        if kind == "METRIC" and signal is not None and area in split_list(signal['allowed_areas']):
+            return True
+        in_family = self.families_allow(prefix_row, descriptor)
+        if kind not in self.typed:
+            return in_family
+        in_area = area_verdict == ALLOW
+        return (in_area and in_family) if require_both else (in_area or in_family)
+
+    def alert(self, name, prefix, prefix_row, tail, violations):
+        self.type_binding(prefix, prefix_row, self.rootless_types[prefix], None, violations)
+        if not tail:
+            violations.append("DESCRIPTOR_REQUIRED")
+            return
+        if self.known_name(name):
+            return
+        signal = self.signal(tail[0])
+        if signal is None or any(token not in split_list(signal['allowed_threshold_tokens']) for token in tail[1:]):
+            violations.append("DESCRIPTOR_VOCAB_ONLY")
+
+    def runbook(self, prefix, prefix_row, body, violations):
+        self.type_binding(prefix, prefix_row, "DOC-RUNBOOK", None, violations)
+        descriptor = "-".join(body)
+        if not descriptor:
+            violations.append("DESCRIPTOR_REQUIRED")
+        elif not (any(row['descriptor'] == descriptor for row in self.descriptors)
+                  or any(row['token'] == descriptor for row in self.thresholds)
+                  or self.families_allow(prefix_row, descriptor)):
+            violations.append("DESCRIPTOR_VOCAB_ONLY")
+
+    def slo(self, name, tail, violations):
+        if self.known_name(name):
+            return
+        area, body = tail[0], tail[1:]
+        signal = self.signal(body[0]) if body else None
+        if (len(body) != 3 or signal is None or area not in split_list(signal['allowed_areas'])
+                or not body[1].startswith("TARGET_") or body[2] not in self.windows):
+            violations.append("DESCRIPTOR_VOCAB_ONLY")
+
+
+# --- Corpus ---
+
+class Vocabulary:
+    """The tokens names are built from, read off the same catalogs."""
+
+    def __init__(self, source_dir=None):
+        load = load_catalog(source_dir or definitions_dir).records
+        self.roots = [row['root'] for row in load("RootNamespaceMap.csv")]
+        prefix_rows = load("OfficialPrefixRegistry.csv") + load("ExtendedPrefixRegistry.csv")
+        self.prefixes = list(dict.fromkeys(row['prefix'] for row in prefix_rows))
+        self.descriptors = sorted({row['descriptor'] for row in load("DescriptorCatalog.csv")})
+        self.signals = [row['signal'] for row in load("SignalCatalog.csv")]
+        thresholds = load("ThresholdTokenCatalog.csv")
+        self.tokens = [row['token'] for row in thresholds]
+        self.windows = [row['token'] for row in thresholds if row['token_category'] == "WINDOW"]
+        self.targets = [row['token'] for row in thresholds if row['token'].startswith("TARGET_")]
+        globs = {pattern for row in prefix_rows for pattern in split_list(row['allowed_descriptor_families'])}
+        for row in load("DescriptorFamilyRules.csv"):
+            globs.update(split_list(row['allow_patterns']) + split_list(row['deny_patterns']))
+        self.globs = sorted(globs)
+        self.known_names = ([row['slo_name'] for row in load("SLOTemplateCatalog.csv")]
+                            + [row['alert_name'] for row in load("AlertTemplateCatalog.csv")]
+                            + [row['dashboard_doc_name'] for row in load("DashboardCatalog.csv")])
+        self.conditional = [(row['root'], row['prefix_family']) for row in load("RootPrefixFamilyMatrix.csv")
+                            if row['decision'] == "CONDITIONAL"]
+        # Literal operations such as OTEL-TRACE's RECEIVE|VALIDATE|...
+        self.literals = sorted({g for g in self.globs if "*" not in g})
+        rules = {row['rule_id']: row for row in load("LintRuleCatalog.csv")}
+        self.injected = sorted(PROVIDER_NAMES | listed_tokens(rules.get("NO_AMBIGUOUS_TOKENS", {}).get('semantics')))
+        self.rootless = [row['naming_pattern'][:-2] for row in load("ArtifactTypeRules.csv")
+                         if row['naming_pattern'].endswith("-*") and "-<AREA>-" not in row['naming_pattern']]
+
+    def enumerate(self):
+        areas = self.roots + list(NON_ROOTS)
+        vocabulary = list(dict.fromkeys(self.descriptors + self.signals + self.literals))
+        yield from self.known_names
+        for prefix in self.prefixes:
+            for root in areas:
+                for descriptor in vocabulary:
+                    yield f"{prefix}-{root}-{descriptor}"
+                for kind in DOC_KINDS:
+                    yield f"{prefix}-{root}-DOC-{kind}"
+                    for descriptor in self.descriptors:
+                        yield f"{prefix}-{root}-DOC-{kind}-{descriptor}"
+            for descriptor in vocabulary + self.tokens:
+                yield f"{prefix}-RUNBOOK-{descriptor}"
+        for prefix in self.rootless:
+            for signal in self.signals:
+                yield f"{prefix}-{signal}"
+                for first in self.tokens:
+                    yield f"{prefix}-{signal}-{first}"
+                    for window in self.windows:
+                        yield f"{prefix}-{signal}-{first}-{window}"
+        slo_prefixes = {"-".join(name.split("-")[:2]) for name in self.known_names if name.startswith("SRE-SLO")}
+        for slo_prefix in sorted(slo_prefixes):
+            for root in areas:
+                for signal in self.signals:
+                    for target in self.targets:
+                        for window in self.windows:
+                            yield f"{slo_prefix}-{root}-{signal}-{target}-{window}"
+
+    # Fuzzing: each mutation takes a seed name and returns a new one.
+
+    def fuzz(self, rng, seeds, allowed, count):
+        mutations = [self.swap_root, self.swap_prefix, self.cut_prefix, self.conditional_cell, self.glob_descriptor,
+                     self.inject_token, self.change_case, self.swap_separator, self.empty_segment,
+                     self.drop_segment, self.double_segment, self.truncate]
+        for _ in range(count):
+            name = rng.choice(allowed if allowed and rng.random() < 0.5 else seeds)
+            for _ in range(rng.choice((1, 1, 1, 2, 3))):
+                name = rng.choice(mutations)(rng, name)
+            yield name
+
+    def swap_root(self, rng, name):
+        segments = name.split("-")
+        spots = [i for i, s in enumerate(segments) if s in self.roots] or [min(2, len(segments) - 1)]
+        segments[rng.choice(spots)] = rng.choice(self.roots + list(NON_ROOTS))
+        return "-".join(segments)
+
+    def swap_prefix(self, rng, name):
+        segments = name.split("-")
+        return "-".join([rng.choice(self.prefixes)] + segments[2:])
+
+    def cut_prefix(self, rng, name):
+        """Keep only the family (`80053-AU-SEC-...` -> `80053-SEC-...`), or glue the prefix's hyphen away."""
+        segments = name.split("-")
+        if len(segments) < 2:
+            return name
+        if rng.random() < 0.5:
+            return "-".join(segments[:1] + segments[2:])
+        return "-".join([segments[0] + segments[1]] + segments[2:])
+
+    def conditional_cell(self, rng, name):
+        if not self.conditional:
+            return name
+        root, family = rng.choice(self.conditional)
+        prefix = rng.choice([p for p in self.prefixes if p.split("-")[0] == family] or self.prefixes)
+        return f"{prefix}-{root}-DOC-{rng.choice(DOC_KINDS)}"
+
+    def glob_descriptor(self, rng, name):
+        """Replace the last segment with an uncatalogued token some family glob accepts."""
+        pattern = rng.choice(self.globs)
+        word = "".join(rng.choice("ABCDEFGHIJKLMNOPQRSTUVWXYZ_") for _ in range(rng.randint(0, 8)))
+        segments = name.split("-")
+        segments[-1] = pattern.replace("*", word, 1).replace("*", "")
+        return "-".join(segments)
+
+    def inject_token(self, rng, name):
+        token = rng.choice(self.injected)
+        if rng.random() < 0.5:
+            return f"{name}_{token}"
+        segments = name.split("-")
+        segments.insert(rng.randint(0, len(segments)), token)
+        return "-".join(segments)
+
+    def change_case(self, rng, name):
+        segments = name.split("-")
+        i = rng.randrange(len(segments))
+        segments[i] = segments[i].lower() if rng.random() < 0.8 else segments[i].title()
+        return "-".join(segments)
+
+    def swap_separator(self, rng, name):
+        if "_" in name and rng.random() < 0.5:
+            return name.replace("_", "-", 1)
+        segments = name.split("-")
+        if len(segments) < 2:
+            return name
+        i = rng.randrange(len(segments) - 1)
+        return "-".join(segments[:i] + [f"{segments[i]}_{segments[i + 1]}"] + segments[i + 2:])
+
+    def empty_segment(self, rng, name):
+        position = rng.choice(("lead", "trail", "double"))
+        if position == "lead":
+            return f"-{name}"
+        if position == "trail":
+            return f"{name}-"
+        return name.replace("-", "--", 1)
+
+    def drop_segment(self, rng, name):
+        segments = name.split("-")
+        del segments[rng.randrange(len(segments))]
+        return "-".join(segments)
+
+    def double_segment(self, rng, name):
+        segments = name.split("-")
+        i = rng.randrange(len(segments))
+        segments.insert(i, segments[i])
+        return "-".join(segments)
+
+    def truncate(self, rng, name):
+        return name[:rng.randrange(len(name) + 1)]
+
+
+class Reservoir:
+    """Uniform sample of at most `size` offered names (reservoir sampling)."""
+
+    def __init__(self, rng, size=RESERVOIR_SIZE):
+        self.rng = rng
+        self.size = size
+        self.items = []
+        self.offered = 0
+
+    def offer(self, name):
+        self.offered += 1
+        if len(self.items) < self.size:
+            self.items.append(name)
+        else:
+            slot = self.rng.randrange(self.offered)
+            if slot < self.size:
+                self.items[slot] = name
+
+
+def unique(names):
+    seen = set()
+    for name in names:
+        if name not in seen:
+            seen.add(name)
+            yield name
+
+
+# --- Judging ---
+
+_evaluator = None
+
+
+def _init_worker(source_dir):
+    global _evaluator
+    _evaluator = ReferenceEvaluator(source_dir)
+
+
+def judge_chunk(names):
+    return [_evaluator.evaluate(name) for name in names]
+
+
+def judged(names, source_dir=None, workers=None):
+    """Verdicts for `names`, in order, with at most 2 * workers chunks in flight."""
+    workers = workers or os.cpu_count() or 1
+    names = iter(names)
+    pending = deque()
+    with ProcessPoolExecutor(workers, initializer=_init_worker,
+                             initargs=(str(source_dir or definitions_dir),)) as pool:
+        while True:
+            chunk = list(islice(names, CHUNK_SIZE))
+            if chunk:
+                pending.append(pool.submit(judge_chunk, chunk))
+            if pending and (len(pending) >= 2 * workers or not chunk):
+                yield from pending.popleft().result()
+            elif not chunk:
+                return
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Write a fuzzed naming corpus with reference verdicts.")
+    parser.add_argument("--out", required=True, help="corpus CSV path ('-' for stdout)")
+    parser.add_argument("--fuzz", type=int, default=DEFAULT_FUZZ, help="fuzzed names after the enumeration")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--definitions", default=str(definitions_dir), help="catalog CSV directory")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    verdicts, rules = Counter(), Counter()
+    vocabulary = Vocabulary(args.definitions)
+    rng = random.Random(args.seed)
+    # Fuzz seeds: half from every enumerated name, half from the ones the reference
+    # allows, since most of the namespace is DENY and the edge cases sit next to ALLOWs.
+    seeds, allowed = Reservoir(rng), Reservoir(rng)
+    out = sys.stdout if args.out == "-" else open(args.out, "w", encoding="utf-8", newline="")
+    try:
+        writer = csv.writer(out, lineterminator="\n")
+        writer.writerow(["expected", "example_name", "violations"])
+
+        def write(result):
+            writer.writerow([result.verdict, result.name, "|".join(result.violations)])
+            verdicts[result.verdict] += 1
+            rules.update(result.violations)
+
+        for result in judged(unique(vocabulary.enumerate()), args.definitions, args.workers):
+            write(result)
+            seeds.offer(result.name)
+            if result.verdict == ALLOW:
+                allowed.offer(result.name)
+        enumerated = sum(verdicts.values())
+        for result in judged(vocabulary.fuzz(rng, seeds.items, allowed.items, args.fuzz), args.definitions,
+                             args.workers):
+            write(result)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    elapsed = time.perf_counter() - start
+    total = sum(verdicts.values())
+    print(f"Wrote {total:,} names ({enumerated:,} enumerated, {total - enumerated:,} fuzzed; "
+          f"{verdicts[ALLOW]:,} ALLOW, {verdicts[DENY]:,} DENY) to {args.out} in {elapsed:.1f}s", file=sys.stderr)
+    for rule_id, count in rules.most_common():
+        print(f"  {rule_id:22} {count:>10,}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
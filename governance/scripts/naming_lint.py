@@ -0,0 +1,358 @@
+"""Compiled naming-lint engine for the governance catalogs.
+
+The catalogs emitted by generate_ssot.py (LintRuleCatalog, RootPrefixFamilyMatrix,
+DescriptorFamilyRules, ArtifactTypeRules, DescriptorCatalog, ...) are compiled once
+into hash maps and pre-built verdicts for every name the catalogs can form. Checking
+a name is then a single dict lookup; names outside the precomputed set fall back to
+the rule evaluator (a handful of hash lookups) and are memoised up to a bound.
+
+Usage (from the repo root):
+    python3 governance/scripts/naming_lint.py                  # run NamingTestSuite.csv
+    python3 governance/scripts/naming_lint.py NAME [NAME ...]  # lint explicit names
+    python3 governance/scripts/naming_lint.py --bench 1000000  # throughput check
+"""
+import argparse
+import re
+import sys
+import time
+from collections import namedtuple
+from pathlib import Path
+
+from catalog import load_catalog
+from decision_matrix import parse_condition
+from pattern_automaton import ALLOW, DENY, PatternAutomaton
+
+# Paths
+definitions_dir = Path("governance/definitions")
+
+CONDITIONAL = "CONDITIONAL"
+
+# Word lists for the WARN-level rules (NO_AMBIGUOUS_TOKENS / NO_PROVIDER_NAMES)
+AMBIGUOUS_TOKENS = frozenset(["MISC", "TEMP", "NEW", "OLD", "FIX"])
+PROVIDER_TOKENS = frozenset([
+    "OPENAI", "ANTHROPIC", "GOOGLE", "AWS", "AZURE", "GCP", "CLOUDFLARE", "STRIPE", "TWILIO",
+])
+
+DEFAULT_CACHE_SIZE = 1 << 20
+
+LintResult = namedtuple("LintResult", ["name", "verdict", "violations"])
+PrefixRule = namedtuple("PrefixRule", ["family", "roots", "artifact_types", "descriptor_families"])
+
+_WORD_SPLIT = re.compile(r"[-_]")
+
+
+def split_list(value):
+    return [item for item in (value or "").split("|") if item]
+
+
+class NamingLinter:
+    """Evaluates artifact names against the compiled governance catalogs."""
+
+    def __init__(self, source_dir=None, cache_size=DEFAULT_CACHE_SIZE):
+        self.source_dir = Path(source_dir or definitions_dir)
+        self._compile()
+        self._verdicts = {}
+        for name in self._catalog_names():
+            self._verdicts[name] = self._evaluate(name)
+        self.precomputed = len(self._verdicts)
+        self._cache_limit = self.precomputed + cache_size
+
+    # --- Compilation ---
+
+    def _compile(self):
+        self.catalog = load_catalog(self.source_dir)
+        load = self.catalog.records
+
+        self.severity = {row['rule_id']: row['severity'] for row in load("LintRuleCatalog.csv")}
+        self.roots = frozenset(row['root'] for row in load("RootNamespaceMap.csv"))
+
+        self.prefixes = {}
+        for row in load("OfficialPrefixRegistry.csv") + load("ExtendedPrefixRegistry.csv"):
+            self.prefixes[row['prefix']] = PrefixRule(
+                family=row['prefix'].split("-")[0],
+                roots=frozenset(split_list(row['allowed_roots'])),
+                artifact_types=frozenset(split_list(row['allowed_artifact_types'])),
+                descriptor_families=PatternAutomaton(split_list(row['allowed_descriptor_families'])),
+            )
+
+        self.decisions = {}
+        self.allowlists = {}
+        for row in load("RootPrefixFamilyMatrix.csv"):
+            key = (row['root'], row['prefix_family'])
+            self.decisions[key] = row['decision']
+            if row['decision'] == CONDITIONAL:
+                self.allowlists[key] = frozenset(parse_condition(row['condition']))
+
+        # Artifact types: "<P>-<AREA>-..." patterns bind a telemetry prefix to its type,
+        # "<P>-*" patterns bind a rootless prefix (alerts).
+        self.artifact_types = {}
+        self.telemetry_types = {}
+        self.rootless_types = {}
+        artifact_rows = load("ArtifactTypeRules.csv")
+        for row in artifact_rows:
+            pattern = row['naming_pattern']
+            if "-<AREA>-" in pattern:
+                self.telemetry_types[pattern.split("-<AREA>-")[0]] = row['artifact_type']
+            elif pattern.endswith("-*"):
+                self.rootless_types[pattern[:-2]] = row['artifact_type']
+        for row in artifact_rows:
+            allowed_prefixes = frozenset(split_list(row['allowed_prefixes']))
+            self.artifact_types[row['artifact_type']] = (
+                self._expand_roots(row['allowed_roots'], allowed_prefixes),
+                allowed_prefixes,
+            )
+
+        self.descriptors = {}
+        typed_vocab = {"METRIC"}
+        for row in load("DescriptorCatalog.csv"):
+            types = frozenset(split_list(row['allowed_types']))
+            self.descriptors[(row['area'], row['descriptor'])] = types
+            typed_vocab.update(types)
+        self.typed_vocab = frozenset(typed_vocab)
+        self.descriptor_names = frozenset(descriptor for _, descriptor in self.descriptors)
+
+        # One allow/deny automaton per area; DENY_OVERRIDES decides ties.
+        deny_overrides = "DENY_OVERRIDES" in self.severity
+        self.area_rules = {
+            row['area']: PatternAutomaton(split_list(row['allow_patterns']),
+                                          split_list(row['deny_patterns']),
+                                          deny_overrides=deny_overrides)
+            for row in load("DescriptorFamilyRules.csv")
+        }
+
+        self.signals = {
+            row['signal']: (frozenset(split_list(row['allowed_areas'])),
+                            frozenset(split_list(row['allowed_threshold_tokens'])))
+            for row in load("SignalCatalog.csv")
+        }
+        thresholds = load("ThresholdTokenCatalog.csv")
+        self.threshold_tokens = frozenset(row['token'] for row in thresholds)
+        self.window_tokens = frozenset(row['token'] for row in thresholds if row['token_category'] == "WINDOW")
+
+        slo_names = [row['slo_name'] for row in load("SLOTemplateCatalog.csv")]
+        self.slo_prefixes = frozenset("-".join(name.split("-")[:2]) for name in slo_names)
+        self.known_names = frozenset(
+            slo_names
+            + [row['alert_name'] for row in load("AlertTemplateCatalog.csv")]
+            + [row['dashboard_doc_name'] for row in load("DashboardCatalog.csv")]
+        )
+
+    def _expand_roots(self, value, allowed_prefixes):
+        if value == "ALL":
+            return self.roots
+        if value == "ALL_RUNTIME":
+            # Runtime roots are the ones the type's own prefixes may emit under.
+            roots = set()
+            for prefix in allowed_prefixes:
+                rule = self.prefixes.get(prefix)
+                if rule is not None:
+                    roots |= rule.roots
+            return frozenset(roots)
+        return frozenset(split_list(value))
+
+    def _catalog_names(self):
+        vocabulary = sorted(self.descriptor_names | set(self.signals))
+        for prefix in sorted(self.telemetry_types):
+            for root in sorted(self.roots):
+                for descriptor in vocabulary:
+                    yield f"{prefix}-{root}-{descriptor}"
+        yield from sorted(self.known_names)
+
+    # --- Lookup ---
+
+    def check(self, name):
+        result = self._verdicts.get(name)
+        if result is None:
+            result = self._evaluate(name)
+            if len(self._verdicts) < self._cache_limit:
+                self._verdicts[name] = result
+        return result
+
+    def is_allowed(self, name):
+        return self.check(name).verdict == ALLOW
+
+    def lint_many(self, names):
+        check = self.check
+        for name in names:
+            yield check(name)
+
+    # --- Rule evaluation ---
+
+    def _evaluate(self, name):
+        violations = []
+        segments = name.split("-")
+        prefix = "-".join(segments[:2])
+        rule = self.prefixes.get(prefix)
+        if len(segments) < 2 or rule is None:
+            violations.append("PREFIX_REQUIRED")
+            return self._result(name, violations)
+
+        words = _WORD_SPLIT.split(name)
+        if any(word in PROVIDER_TOKENS for word in words):
+            violations.append("NO_PROVIDER_NAMES")
+        if any(word in AMBIGUOUS_TOKENS for word in words):
+            violations.append("NO_AMBIGUOUS_TOKENS")
+
+        tail = segments[2:]
+        if prefix in self.rootless_types:
+            self._check_alert(name, prefix, rule, tail, violations)
+        elif tail and tail[0] == "RUNBOOK":
+            self._check_runbook(prefix, rule, tail[1:], violations)
+        elif not tail or tail[0] not in self.roots:
+            violations.append("AREA_CONTROLLED")
+        elif prefix in self.slo_prefixes and (len(tail) < 2 or tail[1] != "DOC"):
+            self._check_slo(name, tail, violations)
+        else:
+            root, body = tail[0], tail[1:]
+            self._check_root(prefix, rule, root, violations)
+            if prefix in self.telemetry_types:
+                self._check_telemetry(name, prefix, rule, root, body, violations)
+            elif body and body[0] == "DOC":
+                self._check_document(name, prefix, rule, root, body, violations)
+            else:
+                violations.append("TYPE_BINDING")
+        return self._result(name, violations)
+
+    def _result(self, name, violations):
+        violations = tuple(dict.fromkeys(violations))
+        denied = any(self.severity.get(rule_id, "ERROR") == "ERROR" for rule_id in violations)
+        return LintResult(name, DENY if denied else ALLOW, violations)
+
+    def _check_root(self, prefix, rule, root, violations):
+        # DENY_OVERRIDES: a DENY cell wins even if the prefix lists the root.
+        decision = self.decisions.get((root, rule.family), DENY)
+        if decision == DENY or root not in rule.roots:
+            violations.append("ROOT_COMPATIBLE")
+        if decision == CONDITIONAL and prefix not in self.allowlists.get((root, rule.family), ()):
+            violations.append("SUBPREFIX_ALLOWED")
+
+    def _check_type(self, prefix, rule, artifact_type, root, violations):
+        binding = self.artifact_types.get(artifact_type)
+        if binding is None or artifact_type not in rule.artifact_types:
+            violations.append("TYPE_BINDING")
+            return
+        roots, allowed_prefixes = binding
+        if root is not None and root not in roots:
+            violations.append("TYPE_BINDING")
+        elif prefix not in allowed_prefixes and rule.family not in allowed_prefixes:
+            violations.append("TYPE_BINDING")
+
+    def _check_telemetry(self, name, prefix, rule, root, body, violations):
+        artifact_type = self.telemetry_types[prefix]
+        self._check_type(prefix, rule, artifact_type, root, violations)
+        descriptor = "-".join(body)
+        if not descriptor:
+            violations.append("DESCRIPTOR_REQUIRED")
+        elif not self._descriptor_allowed(name, root, artifact_type, descriptor, rule, require_both=True):
+            violations.append("DESCRIPTOR_VOCAB_ONLY")
+
+    def _check_document(self, name, prefix, rule, root, body, violations):
+        kind = body[1] if len(body) > 1 else ""
+        self._check_type(prefix, rule, f"DOC-{kind}", root, violations)
+        descriptor = "-".join(body[2:])
+        if descriptor and not self._descriptor_allowed(name, root, "DOC", descriptor, rule, require_both=False):
+            violations.append("DESCRIPTOR_VOCAB_ONLY")
+
+    def _check_alert(self, name, prefix, rule, tail, violations):
+        self._check_type(prefix, rule, self.rootless_types[prefix], None, violations)
+        if not tail:
+            violations.append("DESCRIPTOR_REQUIRED")
+            return
+        if name in self.known_names:
+            return
+        signal = self.signals.get(tail[0])
+        if signal is None or any(token not in signal[1] for token in tail[1:]):
+            violations.append("DESCRIPTOR_VOCAB_ONLY")
+
+    def _check_runbook(self, prefix, rule, body, violations):
+        self._check_type(prefix, rule, "DOC-RUNBOOK", None, violations)
+        descriptor = "-".join(body)
+        if not descriptor:
+            violations.append("DESCRIPTOR_REQUIRED")
+        elif not (descriptor in self.descriptor_names
+                  or descriptor in self.threshold_tokens
+                  or rule.descriptor_families.allows(descriptor)):
+            violations.append("DESCRIPTOR_VOCAB_ONLY")
+
+    def _check_slo(self, name, tail, violations):
+        if name in self.known_names:
+            return
+        area, body = tail[0], tail[1:]
+        signal = self.signals.get(body[0]) if body else None
+        if (len(body) != 3 or signal is None or area not in signal[0]
+                or not body[1].startswith("TARGET_") or body[2] not in self.window_tokens):
+            violations.append("DESCRIPTOR_VOCAB_ONLY")
+
+    def _descriptor_allowed(self, name, area, kind, descriptor, rule, require_both):
+        if name in self.known_names:
+            return True
+        area_rules = self.area_rules.get(area)
+        area_verdict = area_rules.match(descriptor) if area_rules is not None else None
+        if area_verdict == DENY:
+            return False
+        types = self.descriptors.get((area, descriptor))
+        if types is not None and kind in types:
+            return True
+        if kind == "METRIC" and area in self.signals.get(descriptor, ((),))[0]:
+            return True
+        in_family = rule.descriptor_families.allows(descriptor)
+        if kind not in self.typed_vocab:
+            # No catalog descriptor carries this type (e.g. TRACE operations):
+            # the prefix's own descriptor families are the vocabulary.
+            return in_family
+        in_area = area_verdict == ALLOW
+        return (in_area and in_family) if require_both else (in_area or in_family)
+
+
+# --- CLI ---
+
+def run_suite(linter):
+    cases = linter.catalog.records("NamingTestSuite.csv")
+    failures = 0
+    for case in cases:
+        result = linter.check(case['example_name'])
+        ok = result.verdict == case['expected']
+        failures += not ok
+        detail = ",".join(result.violations) or "-"
+        print(f"{'PASS' if ok else 'FAIL'} {case['expected']:5} {result.verdict:5} {result.name} [{detail}]")
+    print(f"{len(cases) - failures}/{len(cases)} naming cases passed")
+    return failures == 0
+
+
+def run_bench(linter, count):
+    sample = list(linter._verdicts)[:4096] + [row['example_name'] for row in linter.catalog.records("NamingTestSuite.csv")]
+    names = (sample * (count // len(sample) + 1))[:count]
+    check = linter.check
+    start = time.perf_counter()
+    for name in names:
+        check(name)
+    elapsed = time.perf_counter() - start
+    print(f"Checked {count} names in {elapsed:.3f}s ({count / elapsed:,.0f} names/s)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Lint artifact names against the governance catalogs.")
+    parser.add_argument("names", nargs="*", help="names to lint (default: run NamingTestSuite.csv)")
+    parser.add_argument("--definitions", default=str(definitions_dir), help="catalog CSV directory")
+    parser.add_argument("--bench", type=int, metavar="N", help="time N lookups and report throughput")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    linter = NamingLinter(args.definitions)
+    print(f"Compiled {linter.precomputed} names in {time.perf_counter() - start:.3f}s")
+
+    if args.bench:
+        run_bench(linter, args.bench)
+        return 0
+    if not args.names:
+        return 0 if run_suite(linter) else 1
+
+    denied = 0
+    for result in linter.lint_many(args.names):
+        denied += result.verdict == DENY
+        print(f"{result.verdict:5} {result.name} [{','.join(result.violations) or '-'}]")
+    return 1 if denied else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
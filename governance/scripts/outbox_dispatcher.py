@@ -0,0 +1,255 @@
+"""Transactional outbox with a batched, leased dispatcher.
+
+Producers call `enqueue(conn, ...)` inside their own transaction, so the side
+effect is recorded atomically with the state change that caused it (the
+(tenant_id, idempotency_key) unique index drops duplicates). `OutboxDispatcher`
+then drains the outbox_event table (schema from generate_ddl.py):
+
+  1. claim   one short write transaction moves up to `batch_size` due rows to
+             `processing` and stamps a lease (next_run_at = now + lease); expired
+             leases are claimable again, so a crashed worker's rows come back.
+  2. dispatch the batch runs on a bounded thread pool (`workers`).
+  3. ack     one transaction marks successes `done`, reschedules failures with
+             exponential backoff, and moves rows past `max_attempts` to `failed`
+             (the DLQ). Every ack is fenced on the lease it was claimed with, so
+             a worker whose lease expired cannot overwrite a newer claim.
+
+On PostgreSQL the claim is the same statement with SKIP LOCKED, so concurrent
+dispatchers never block on each other's rows:
+
+    UPDATE outbox_event SET status = 'processing', attempt = attempt + 1, next_run_at = %(lease)s
+    WHERE (outbox_id, tenant_id) IN (
+        SELECT outbox_id, tenant_id FROM outbox_event
+        WHERE status IN ('pending', 'processing') AND next_run_at <= %(now)s
+        ORDER BY next_run_at LIMIT %(batch)s FOR UPDATE SKIP LOCKED)
+    RETURNING ...
+
+SQLite serialises writers instead (BEGIN IMMEDIATE), and the lease keeps claimed
+rows invisible to other dispatchers until it expires.
+
+Telemetry goes to `emit(name, value, **attributes)` using catalog names:
+OTEL-METRIC-EVENT-{QUEUE_DEPTH,OUTBOX_DEPTH,DLQ_COUNT} gauges and
+OTEL-LOG-EVENT-{OUTBOX_DEQUEUED,OUTBOX_DISPATCH_OK,OUTBOX_DISPATCH_FAIL,
+OUTBOX_BACKLOG_HIGH,DLQ_ENQUEUED} counts per batch. `enqueue(..., emit=...)`
+reports OTEL-LOG-EVENT-OUTBOX_ENQUEUED for each row it inserts (duplicates are
+not counted; the caller's transaction may still roll it back).
+
+bench_outbox.py compares it with row-at-a-time polling.
+"""
+import json
+import os
+import random
+import sqlite3
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, wait
+from datetime import datetime, timezone
+
+from catalog import load_catalog
+from generate_ddl import load_specs, sqlite_ddl
+
+TABLE = "outbox_event"
+AREA = "EVENT"
+
+OutboxEvent = namedtuple("OutboxEvent", ["outbox_id", "tenant_id", "trace_id", "action_type", "payload",
+                                         "idempotency_key", "attempt", "lease"])
+
+_CROCKFORD = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+
+
+def metric(signal):
+    return f"OTEL-METRIC-{AREA}-{signal}"
+
+
+def log_event(descriptor):
+    return f"OTEL-LOG-{AREA}-{descriptor}"
+
+
+def timestamp(seconds):
+    """Fixed-width ISO-8601 UTC, so TEXT comparison in SQLite is chronological."""
+    return datetime.fromtimestamp(seconds, timezone.utc).isoformat(timespec="microseconds")
+
+
+def new_ulid(seconds=None):
+    """26-character ULID: 48-bit millisecond time + 80 random bits, Crockford base32."""
+    ms = int((time.time() if seconds is None else seconds) * 1000)
+    value = (ms << 80) | int.from_bytes(os.urandom(10), "big")
+    return "".join(_CROCKFORD[(value >> shift) & 31] for shift in range(125, -1, -5))
+
+
+def create_schema(conn):
+    """Create outbox_event (and its indexes) from the generated SQLite DDL."""
+    specs = [spec for spec in load_specs(load_catalog()) if spec.name == TABLE]
+    conn.executescript("\n".join(sqlite_ddl(specs)).replace("CREATE TABLE", "CREATE TABLE IF NOT EXISTS")
+                       .replace("CREATE INDEX", "CREATE INDEX IF NOT EXISTS")
+                       .replace("CREATE UNIQUE INDEX", "CREATE UNIQUE INDEX IF NOT EXISTS"))
+
+
+def connect(path, timeout=30.0):
+    """Connection tuned for a shared outbox: WAL, NORMAL sync, explicit transactions."""
+    conn = sqlite3.connect(path, timeout=timeout, isolation_level=None, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute("PRAGMA synchronous = NORMAL")
+    return conn
+
+
+def enqueue(conn, tenant_id, action_type, payload, idempotency_key, trace_id=None, delay=0.0, now=None, emit=None):
+    """Insert one event in the caller's transaction; returns False for a duplicate idempotency key."""
+    now = time.time() if now is None else now
+    cursor = conn.execute(
+        f"INSERT INTO {TABLE} (outbox_id, tenant_id, trace_id, action_type, payload, idempotency_key, "
+        "status, attempt, next_run_at, created_at, updated_at) "
+        "VALUES (?, ?, ?, ?, ?, ?, 'pending', 0, ?, ?, ?) "
+        "ON CONFLICT (tenant_id, idempotency_key) DO NOTHING",
+        (new_ulid(now), tenant_id, trace_id, action_type, json.dumps(payload, separators=(",", ":")),
+         idempotency_key, timestamp(now + delay), timestamp(now), timestamp(now)),
+    )
+    if cursor.rowcount != 1:
+        return False
+    if emit is not None:
+        emit(log_event("OUTBOX_ENQUEUED"), 1, action_type=action_type)
+    return True
+
+
+class OutboxDispatcher:
+    def __init__(self, conn, handler, batch_size=100, workers=8, lease_seconds=30.0, max_attempts=5,
+                 backoff_seconds=1.0, max_backoff_seconds=300.0, backlog_high=10_000,
+                 depth_interval=1.0, emit=None, clock=time.time):
+        if batch_size < 1 or workers < 1:
+            raise ValueError("batch_size and workers must be at least 1")
+        self.conn = conn
+        self.handler = handler
+        self.batch_size = batch_size
+        self.workers = workers
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.backoff_seconds = backoff_seconds
+        self.max_backoff_seconds = max_backoff_seconds
+        self.backlog_high = backlog_high
+        self.depth_interval = depth_interval
+        self.emit = emit or (lambda name, value, **attributes: None)
+        self.clock = clock
+        self._pool = ThreadPoolExecutor(workers, thread_name_prefix="outbox")
+        self._last_depth = float("-inf")
+        self._backlog_high = False
+        self.stats = {"dispatched": 0, "failed": 0, "dead_lettered": 0, "lost_leases": 0}
+
+    # --- claim / ack ---
+    def claim(self):
+        now = self.clock()
+        lease = timestamp(now + self.lease_seconds)
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            rows = self.conn.execute(
+                f"UPDATE {TABLE} SET status = 'processing', attempt = attempt + 1, "
+                "next_run_at = :lease, updated_at = :now "
+                # Expired leases first, then due rows: two ordered scans of the
+                # (status, next_run_at) index instead of sorting the whole backlog.
+                "WHERE rowid IN (SELECT rowid FROM ("
+                f"SELECT rowid FROM {TABLE} WHERE status = 'processing' AND next_run_at <= :now "
+                "ORDER BY next_run_at LIMIT :batch) UNION ALL SELECT rowid FROM ("
+                f"SELECT rowid FROM {TABLE} WHERE status = 'pending' AND next_run_at <= :now "
+                "ORDER BY next_run_at LIMIT :batch) LIMIT :batch) "
+                "RETURNING outbox_id, tenant_id, trace_id, action_type, payload, idempotency_key, attempt",
+                {"lease": lease, "now": timestamp(now), "batch": self.batch_size},
+            ).fetchall()
+            self.conn.execute("COMMIT")
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+        return [OutboxEvent(*row, lease) for row in rows]
+
+    def backoff(self, attempt):
+        delay = min(self.backoff_seconds * 2 ** (attempt - 1), self.max_backoff_seconds)
+        return delay * random.uniform(0.5, 1.0)
+
+    def ack(self, succeeded, failed):
+        """Record a batch outcome in one transaction; rows whose lease moved on are skipped."""
+        now = self.clock()
+        fence = "WHERE outbox_id = ? AND tenant_id = ? AND status = 'processing' AND next_run_at = ?"
+        retry, dead = [], []
+        for event in failed:
+            if event.attempt >= self.max_attempts:
+                dead.append((timestamp(now), event.outbox_id, event.tenant_id, event.lease))
+            else:
+                retry.append((timestamp(now + self.backoff(event.attempt)), timestamp(now),
+                              event.outbox_id, event.tenant_id, event.lease))
+        done = [(timestamp(now), event.outbox_id, event.tenant_id, event.lease) for event in succeeded]
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            acked = self.conn.executemany(f"UPDATE {TABLE} SET status = 'done', updated_at = ? {fence}", done).rowcount
+            acked += self.conn.executemany(
+                f"UPDATE {TABLE} SET status = 'pending', next_run_at = ?, updated_at = ? {fence}", retry).rowcount
+            dead_lettered = self.conn.executemany(
+                f"UPDATE {TABLE} SET status = 'failed', updated_at = ? {fence}", dead).rowcount
+            self.conn.execute("COMMIT")
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+        lost = len(done) + len(retry) + len(dead) - acked - dead_lettered
+        return dead_lettered, lost
+
+    # --- dispatch ---
+    def _dispatch(self, event):
+        self.handler(event)
+
+    def run_once(self):
+        """Claim, dispatch and ack one batch; returns the number of events claimed."""
+        batch = self.claim()
+        if batch:
+            futures = {self._pool.submit(self._dispatch, event): event for event in batch}
+            wait(futures)
+            succeeded = [event for future, event in futures.items() if future.exception() is None]
+            failed = [event for future, event in futures.items() if future.exception() is not None]
+            dead_lettered, lost = self.ack(succeeded, failed)
+
+            self.stats["dispatched"] += len(succeeded)
+            self.stats["failed"] += len(failed)
+            self.stats["dead_lettered"] += dead_lettered
+            self.stats["lost_leases"] += lost
+            self.emit(log_event("OUTBOX_DEQUEUED"), len(batch))
+            if succeeded:
+                self.emit(log_event("OUTBOX_DISPATCH_OK"), len(succeeded))
+            if failed:
+                self.emit(log_event("OUTBOX_DISPATCH_FAIL"), len(failed))
+            if dead_lettered:
+                self.emit(log_event("DLQ_ENQUEUED"), dead_lettered)
+        if self.clock() - self._last_depth >= self.depth_interval:
+            self.report_depth()
+        return len(batch)
+
+    def depth(self):
+        """(ready, backlog, dead): due now, not yet done, and dead-lettered rows."""
+        now = timestamp(self.clock())
+        ready = self.conn.execute(
+            f"SELECT COUNT(*) FROM {TABLE} WHERE status = 'pending' AND next_run_at <= ?", (now,)).fetchone()[0]
+        backlog = ready + self.conn.execute(
+            f"SELECT COUNT(*) FROM {TABLE} WHERE (status = 'pending' AND next_run_at > ?) OR status = 'processing'",
+            (now,)).fetchone()[0]
+        dead = self.conn.execute(f"SELECT COUNT(*) FROM {TABLE} WHERE status = 'failed'").fetchone()[0]
+        return ready, backlog, dead
+
+    def report_depth(self):
+        self._last_depth = self.clock()
+        ready, backlog, dead = self.depth()
+        self.emit(metric("QUEUE_DEPTH"), ready, table=TABLE)
+        self.emit(metric("OUTBOX_DEPTH"), backlog, table=TABLE)
+        self.emit(metric("DLQ_COUNT"), dead, table=TABLE)
+        high = backlog >= self.backlog_high
+        if high and not self._backlog_high:
+            self.emit(log_event("OUTBOX_BACKLOG_HIGH"), backlog, threshold=self.backlog_high)
+        self._backlog_high = high
+        return ready, backlog, dead
+
+    def run(self, stop=None, idle_sleep=0.05, until_empty=False):
+        """Dispatch until `stop` (a threading.Event) is set, or the outbox is drained with `until_empty`."""
+        stop = stop or threading.Event()
+        while not stop.is_set():
+            if self.run_once() == 0:
+                if until_empty and self.depth()[1] == 0:
+                    break
+                stop.wait(idle_sleep)
+
+    def close(self):
+        self._pool.shutdown(wait=True)
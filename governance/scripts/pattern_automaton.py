@@ -0,0 +1,96 @@
+"""Single-pass allow/deny automaton over `*` glob patterns.
+
+DescriptorFamilyRules stores each area's vocabulary as `|`-separated globs
+(`WEBHOOK_*|REQUEST_*|...`, `LATENCY_P*`, `*_OK`). Trying fnmatch per pattern
+costs O(patterns) per descriptor; here all allow and deny globs of an area are
+merged into one NFA and determinised by subset construction. DFA transitions
+are built on first use and memoised, so a lookup is one dict hit per character
+and the verdict is read off the final state.
+"""
+
+ALLOW = "ALLOW"
+DENY = "DENY"
+
+_DEAD = 0
+
+
+class PatternAutomaton:
+    """Answers ALLOW / DENY / None (no pattern matched) for a token in one pass."""
+
+    def __init__(self, allow_patterns=(), deny_patterns=(), deny_overrides=True):
+        self.patterns = [(p, ALLOW) for p in dict.fromkeys(allow_patterns) if p]
+        self.patterns += [(p, DENY) for p in dict.fromkeys(deny_patterns) if p]
+        self.deny_overrides = deny_overrides
+
+        self._states = {}
+        self._sets = []
+        self._delta = []
+        self._verdict = []
+        self._state_id(frozenset())  # dead state
+        self._start = self._state_id(self._closure((k, 0) for k in range(len(self.patterns))))
+
+    def __bool__(self):
+        return bool(self.patterns)
+
+    @property
+    def state_count(self):
+        return len(self._sets)
+
+    def match(self, value):
+        delta = self._delta
+        state = self._start
+        for ch in value:
+            nxt = delta[state].get(ch)
+            if nxt is None:
+                nxt = self._transition(state, ch)
+            if nxt == _DEAD:
+                return None
+            state = nxt
+        return self._verdict[state]
+
+    def allows(self, value):
+        return self.match(value) == ALLOW
+
+    # --- Subset construction ---
+
+    def _closure(self, positions):
+        closed = set()
+        stack = list(positions)
+        while stack:
+            k, i = stack.pop()
+            if (k, i) in closed:
+                continue
+            closed.add((k, i))
+            pattern = self.patterns[k][0]
+            if i < len(pattern) and pattern[i] == "*":
+                stack.append((k, i + 1))
+        return frozenset(closed)
+
+    def _state_id(self, positions):
+        state = self._states.get(positions)
+        if state is None:
+            state = len(self._sets)
+            self._states[positions] = state
+            self._sets.append(positions)
+            self._delta.append({})
+            self._verdict.append(self._decide(positions))
+        return state
+
+    def _decide(self, positions):
+        verdicts = {self.patterns[k][1] for k, i in positions if i == len(self.patterns[k][0])}
+        if DENY in verdicts and (self.deny_overrides or ALLOW not in verdicts):
+            return DENY
+        return ALLOW if ALLOW in verdicts else None
+
+    def _transition(self, state, ch):
+        moved = []
+        for k, i in self._sets[state]:
+            pattern = self.patterns[k][0]
+            if i < len(pattern):
+                if pattern[i] == "*":
+                    moved.append((k, i))
+                elif pattern[i] == ch:
+                    moved.append((k, i + 1))
+        nxt = self._state_id(self._closure(moved))
+        self._delta[state][ch] = nxt
+        return nxt
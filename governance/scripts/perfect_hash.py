@@ -0,0 +1,119 @@
+"""Minimal perfect hash (hash-and-displace) for the SDK lookup tables.
+
+Keys are `(kind, name)` pairs: the kind is one ASCII character that namespaces
+the name (descriptor, signal, prefix, scope), so one table covers every catalog.
+Keys are hashed into ~n/3 buckets; for each bucket, largest first, a 15-bit seed
+is searched that sends all of its keys to free slots, and single-key buckets
+store their slot directly (high bit set). Each slot holds two 32-bit words, a
+fingerprint of its key and the value, so a lookup of a non-member is rejected
+with probability 1 - 2**-32 instead of storing the key strings. Values are
+32-bit so a scope bitmask can carry up to 32 roots.
+
+The key is hashed once (FNV-1a over UTF-16 code units); the bucket, slot and
+fingerprint hashes are murmur3 finalisers of that value with different seeds, so
+a lookup walks the string a single time. `key_hash`/`mix` must stay
+bit-for-bit identical to `phfKeyHash`/`phfMix` in the generated
+src/lib/governance/core.ts.
+"""
+import base64
+import struct
+
+BUCKET_SEED = 0
+FINGERPRINT_SEED = 0xFFFF
+DIRECT = 0x8000  # seed-table flag: low 15 bits are the slot itself
+MAX_SEED = DIRECT - 1
+KEYS_PER_BUCKET = 3
+MAX_VALUE = 0xFFFFFFFF
+
+
+def key_hash(kind, name):
+    """32-bit FNV-1a of the key; every seeded hash is derived from it."""
+    h = 0x811C9DC5
+    for ch in kind + name:
+        h = ((h ^ ord(ch)) * 0x01000193) & 0xFFFFFFFF
+    return h
+
+
+def mix(h, seed):
+    """murmur3 finaliser of the key hash xor the scaled seed."""
+    h ^= (seed * 0x9E3779B9) & 0xFFFFFFFF
+    h ^= h >> 16
+    h = (h * 0x85EBCA6B) & 0xFFFFFFFF
+    h ^= h >> 13
+    h = (h * 0xC2B2AE35) & 0xFFFFFFFF
+    h ^= h >> 16
+    return h
+
+
+def hash32(kind, name, seed):
+    return mix(key_hash(kind, name), seed)
+
+
+def fingerprint(kind, name):
+    return hash32(kind, name, FINGERPRINT_SEED)
+
+
+class PerfectHash:
+    """Build once from `{(kind, name): value}`; `seeds`/`entries` are what the SDK embeds."""
+
+    def __init__(self, values):
+        for (kind, name), value in values.items():
+            if len(kind) != 1 or not (kind + name).isascii():
+                raise ValueError(f"Keys must be ASCII with a one-character kind: {kind!r}, {name!r}")
+            if not 0 <= value <= MAX_VALUE:
+                raise ValueError(f"{kind}:{name} value {value} does not fit in 32 bits")
+        self.size = max(1, len(values))
+        if self.size > MAX_SEED:
+            raise ValueError(f"{self.size} keys exceed the {MAX_SEED}-slot limit of the seed encoding")
+        self.bucket_count = max(1, -(-self.size // KEYS_PER_BUCKET))
+        self.seeds = [0] * self.bucket_count
+        self.entries = [0] * (2 * self.size)  # fingerprint, value per slot
+        self._place(values)
+
+    def _place(self, values):
+        bases = {key: key_hash(*key) for key in values}
+        if len(set(bases.values())) != len(bases):
+            raise ValueError("Two keys share a 32-bit key hash; rename one of them")
+        buckets = [[] for _ in range(self.bucket_count)]
+        for key, base in bases.items():
+            buckets[mix(base, BUCKET_SEED) % self.bucket_count].append(key)
+        order = sorted(range(self.bucket_count), key=lambda b: -len(buckets[b]))
+        taken = [False] * self.size
+        free = iter(range(self.size))
+
+        for b in order:
+            keys = buckets[b]
+            if len(keys) == 0:
+                break
+            if len(keys) == 1:
+                slot = next(s for s in free if not taken[s])
+                self.seeds[b] = DIRECT | slot
+                self._store(slot, keys[0], values, taken)
+                continue
+            for seed in range(1, MAX_SEED + 1):
+                slots = [mix(bases[key], seed) % self.size for key in keys]
+                if len(set(slots)) == len(slots) and not any(taken[s] for s in slots):
+                    break
+            else:
+                raise ValueError(f"No displacement seed found for a bucket of {len(keys)} keys")
+            self.seeds[b] = seed
+            for slot, key in zip(slots, keys):
+                self._store(slot, key, values, taken)
+
+    def _store(self, slot, key, values, taken):
+        taken[slot] = True
+        self.entries[2 * slot] = fingerprint(*key)
+        self.entries[2 * slot + 1] = values[key]
+
+    def lookup(self, kind, name):
+        """Value for a member, 0 for (almost every) non-member."""
+        base = key_hash(kind, name)
+        seed = self.seeds[mix(base, BUCKET_SEED) % self.bucket_count]
+        slot = seed & MAX_SEED if seed & DIRECT else mix(base, seed) % self.size
+        return self.entries[2 * slot + 1] if self.entries[2 * slot] == mix(base, FINGERPRINT_SEED) else 0
+
+    def encoded_seeds(self):
+        return base64.b64encode(struct.pack(f"<{len(self.seeds)}H", *self.seeds)).decode("ascii")
+
+    def encoded_entries(self):
+        return base64.b64encode(struct.pack(f"<{len(self.entries)}I", *self.entries)).decode("ascii")
@@ -0,0 +1,228 @@
+"""Streaming multi-window SLO burn-rate evaluator.
+
+Every SLO in SLOTemplateCatalog can have many instances (one per label set,
+e.g. per tenant). Each instance keeps one ring buffer per WINDOW token in
+ThresholdTokenCatalog (W1M ... W28D): `buckets` slots of bad/total counts plus
+running sums. A point is added to the current slot of each ring; moving a ring
+forward subtracts the slots that fall out of the window. Window totals, and so
+burn rates, are O(1) to read and no raw history is kept or rescanned. Windows
+are exact to one slot (window / buckets).
+
+    burn(window) = (bad / total over window) / (1 - objective)
+
+A burn-rate policy fires when both its long and its short window burn at least
+`factor` times the sustainable rate (the multi-window rule: the long window
+proves the budget is really being spent, the short one that it still is):
+
+    BURN_FAST   W1H and W5M  >= 14.4   (2% of a 28-day budget in an hour)
+    BURN_SLOW   W1D and W1H  >= 3      (~11% of a 28-day budget in a day)
+    EB_EXHAUSTED  the SLO's own window (W28D/W7D) burn >= 1
+
+BURN_FAST/BURN_SLOW report under the AlertTemplateCatalog alert that carries
+the token and the policy's short window (SRE-ALERT-BURN_FAST-CRITICAL-W5M,
+SRE-ALERT-BURN_SLOW-HIGH-W1H).
+
+Telemetry goes to `emit(name, value, **attributes)` using catalog names:
+OTEL-LOG-OBS-{ALERT_FIRED,ALERT_RESOLVED} on every transition and, with
+evaluate(now, gauges=True), OTEL-METRIC-OBS-{BURN_RATE_FAST,BURN_RATE_SLOW}
+per instance (the lower of the policy's two window burns).
+
+    evaluator = BurnRateEvaluator.from_catalog(load_catalog())
+    evaluator.observe("SRE-SLO-CORE-ERROR_RATE-TARGET_AVAILABILITY-W28D", ts, bad=3, total=1200, labels=("tenant-1",))
+    for change in evaluator.evaluate(now): ...   # BurnState(firing=True/False) transitions only
+"""
+import re
+from array import array
+from collections import namedtuple
+
+# Fraction of good events each target type promises unless overridden.
+OBJECTIVES = {
+    "TARGET_AVAILABILITY": 0.999,
+    "TARGET_DELIVERY": 0.999,
+    "TARGET_LATENCY": 0.99,
+    "TARGET_CORRECTNESS": 0.99,
+    "TARGET_GROUNDING": 0.95,
+}
+
+# token -> (long window, short window, burn factor); None windows mean "the SLO's own window".
+BURN_POLICIES = {
+    "BURN_FAST": ("W1H", "W5M", 14.4),
+    "BURN_SLOW": ("W1D", "W1H", 3.0),
+    "EB_EXHAUSTED": (None, None, 1.0),
+}
+
+# Policy token -> gauge signal reported by evaluate(gauges=True).
+BURN_GAUGES = {"BURN_FAST": "BURN_RATE_FAST", "BURN_SLOW": "BURN_RATE_SLOW"}
+
+AREA = "OBS"
+DEFAULT_BUCKETS = 60
+_UNITS = {"M": 60, "H": 3600, "D": 86400}
+
+SLO = namedtuple("SLO", ["name", "area", "signal", "objective", "window"])
+BurnState = namedtuple("BurnState", ["slo", "labels", "token", "alert", "firing", "burn_long", "burn_short", "at"])
+
+
+def metric(signal):
+    return f"OTEL-METRIC-{AREA}-{signal}"
+
+
+def log_event(descriptor):
+    return f"OTEL-LOG-{AREA}-{descriptor}"
+
+
+def window_seconds(token):
+    """`W5M` -> 300, `W28D` -> 2419200."""
+    match = re.fullmatch(r"W(\d+)([MHD])", token)
+    if not match:
+        raise ValueError(f"Not a window token: {token!r}")
+    return int(match.group(1)) * _UNITS[match.group(2)]
+
+
+class Ring:
+    """Sliding window of bad/total counts in `size` slots of `resolution` seconds."""
+
+    __slots__ = ("resolution", "size", "bad", "total", "bad_sum", "total_sum", "head")
+
+    def __init__(self, window, size):
+        self.resolution = window / size
+        self.size = size
+        self.bad = array("d", bytes(8 * size))
+        self.total = array("d", bytes(8 * size))
+        self.bad_sum = 0.0
+        self.total_sum = 0.0
+        self.head = None  # absolute slot number of the newest slot
+
+    def advance(self, ts):
+        slot = int(ts // self.resolution)
+        if self.head is None:
+            self.head = slot
+            return slot
+        if slot <= self.head:
+            return slot
+        if slot - self.head >= self.size:
+            for i in range(self.size):
+                self.bad[i] = self.total[i] = 0.0
+            self.bad_sum = self.total_sum = 0.0
+        else:
+            for s in range(self.head + 1, slot + 1):
+                i = s % self.size
+                self.bad_sum -= self.bad[i]
+                self.total_sum -= self.total[i]
+                self.bad[i] = self.total[i] = 0.0
+        self.head = slot
+        return slot
+
+    def add(self, ts, bad, total):
+        """Returns False for a point older than the window (dropped)."""
+        slot = self.advance(ts)
+        if slot <= self.head - self.size:
+            return False
+        i = slot % self.size
+        self.bad[i] += bad
+        self.total[i] += total
+        self.bad_sum += bad
+        self.total_sum += total
+        return True
+
+    def error_ratio(self):
+        return self.bad_sum / self.total_sum if self.total_sum > 0 else 0.0
+
+
+class Instance:
+    __slots__ = ("rings", "firing")
+
+    def __init__(self, windows, buckets):
+        self.rings = {token: Ring(seconds, buckets) for token, seconds in windows.items()}
+        self.firing = {}
+
+
+class BurnRateEvaluator:
+    def __init__(self, slos, windows, alerts=None, policies=None, buckets=DEFAULT_BUCKETS, emit=None):
+        self.slos = {slo.name: slo for slo in slos}
+        self.windows = dict(windows)
+        self.alerts = dict(alerts or {})
+        self.policies = dict(BURN_POLICIES if policies is None else policies)
+        self.buckets = buckets
+        self.instances = {}
+        self.late_points = 0
+        self.emit = emit or (lambda name, value, **attributes: None)
+        for token, (long, short, _) in self.policies.items():
+            for window in (long, short):
+                if window is not None and window not in self.windows:
+                    raise ValueError(f"{token} uses window {window}, which is not a WINDOW token")
+        for slo in self.slos.values():
+            if slo.window not in self.windows:
+                raise ValueError(f"{slo.name}: unknown SLO window {slo.window}")
+
+    @classmethod
+    def from_catalog(cls, catalog, objectives=None, **kwargs):
+        objectives = {**OBJECTIVES, **(objectives or {})}
+        windows = {row['token']: window_seconds(row['token'])
+                   for row in catalog.records("ThresholdTokenCatalog.csv") if row['token_category'] == "WINDOW"}
+        slos = []
+        for row in catalog.records("SLOTemplateCatalog.csv"):
+            if row['target_type'] not in objectives:
+                raise ValueError(f"{row['slo_name']}: no objective for {row['target_type']}")
+            slos.append(SLO(row['slo_name'], row['area'], row['sli_signal'], objectives[row['target_type']], row['window']))
+        policies = kwargs.pop("policies", None) or BURN_POLICIES
+        alerts = {}
+        for row in catalog.records("AlertTemplateCatalog.csv"):
+            tokens = row['required_tokens'].split("|")
+            for token, (_, short, _) in policies.items():
+                if token in tokens and short in tokens:
+                    alerts[token] = row['alert_name']
+        return cls(slos, windows, alerts, policies, **kwargs)
+
+    def instance(self, slo_name, labels=()):
+        key = (slo_name, tuple(labels))
+        instance = self.instances.get(key)
+        if instance is None:
+            if slo_name not in self.slos:
+                raise KeyError(f"Unknown SLO {slo_name}")
+            instance = self.instances[key] = Instance(self.windows, self.buckets)
+        return instance
+
+    def observe(self, slo_name, ts, bad, total, labels=()):
+        """Add `bad` failing out of `total` events at `ts` (seconds) to every window of the instance."""
+        instance = self.instance(slo_name, labels)
+        late = False
+        for ring in instance.rings.values():
+            late |= not ring.add(ts, bad, total)
+        self.late_points += late
+
+    def burn_rate(self, slo_name, window, labels=(), now=None):
+        slo = self.slos[slo_name]
+        ring = self.instance(slo_name, labels).rings[window]
+        if now is not None:
+            ring.advance(now)
+        return ring.error_ratio() / (1 - slo.objective)
+
+    def budget_remaining(self, slo_name, labels=(), now=None):
+        """Fraction of the error budget left over the SLO's own window (negative once overspent)."""
+        return 1 - self.burn_rate(slo_name, self.slos[slo_name].window, labels, now)
+
+    def evaluate(self, now, gauges=False):
+        """Advance every instance to `now` and return the policies that started or stopped firing."""
+        changes = []
+        for (slo_name, labels), instance in self.instances.items():
+            slo = self.slos[slo_name]
+            budget = 1 - slo.objective
+            for ring in instance.rings.values():
+                ring.advance(now)
+            for token, (long, short, factor) in self.policies.items():
+                burn_long = instance.rings[long or slo.window].error_ratio() / budget
+                burn_short = instance.rings[short or slo.window].error_ratio() / budget
+                firing = burn_long >= factor and burn_short >= factor
+                if gauges and token in BURN_GAUGES:
+                    self.emit(metric(BURN_GAUGES[token]), min(burn_long, burn_short), slo=slo_name, labels=labels)
+                if firing != instance.firing.get(token, False):
+                    instance.firing[token] = firing
+                    change = BurnState(slo_name, labels, token, self.alerts.get(token), firing, burn_long, burn_short, now)
+                    changes.append(change)
+                    self.emit(log_event("ALERT_FIRED" if firing else "ALERT_RESOLVED"), 1, slo=slo_name,
+                              labels=labels, token=token, alert=change.alert, burn_long=burn_long, burn_short=burn_short)
+        return changes
+
+    def firing(self):
+        return [(slo_name, labels, token) for (slo_name, labels), instance in self.instances.items()
+                for token, on in instance.firing.items() if on]
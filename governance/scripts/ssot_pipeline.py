@@ -0,0 +1,198 @@
+"""Declarative table registry for the SSOT catalogs.
+
+generate_ssot.py declares every input and output once:
+
+    pipeline.source("roots", ROOTS)                       # plain value
+    @pipeline.table("RootPrefixFamilyMatrix.csv", MATRIX_COLUMNS,
+                    depends=("roots", "families", "decision_map", "conditions"))
+    def root_prefix_family_matrix(roots, families, decision_map, conditions): ...
+
+Nodes run on a thread pool as soon as their dependencies are built, so
+independent tables are built and written in parallel. Outputs are digested
+(sha256 over columns + rows, or the artifact value) and only rewritten when the
+digest differs from `ssot_manifest.json` or the file is missing. Every write
+goes to a temp file in the target directory followed by os.replace, so readers
+never see a half-written table. run(instrument=...) times every node's build and
+write as instrument.py stages.
+"""
+import csv
+import hashlib
+import json
+import os
+import tempfile
+from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+
+from instrument import NULL
+
+# Bump when the CSV/artifact output format changes so every output is rewritten once.
+MANIFEST_VERSION = 1
+MANIFEST_FILE = "ssot_manifest.json"
+# mkstemp creates 0600 files; outputs get the usual umask-derived mode instead.
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+FILE_MODE = 0o666 & ~_UMASK
+
+Table = namedtuple("Table", ["columns", "rows"])
+Node = namedtuple("Node", ["name", "build", "depends", "write"])
+
+
+def atomic_write(path, write, mode="w"):
+    """Call `write(f)` on a temp file next to `path`, then rename it into place."""
+    path = Path(path)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        kwargs = {"encoding": "utf-8", "newline": ""} if "b" not in mode else {}
+        with os.fdopen(fd, mode, **kwargs) as f:
+            write(f)
+        os.chmod(tmp, FILE_MODE)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def write_csv(path, table):
+    # Same quoting and line endings as pandas' to_csv, which produced the original tables.
+    def write(f):
+        writer = csv.writer(f, lineterminator="\n")
+        writer.writerow(table.columns)
+        writer.writerows(table.rows)
+    atomic_write(path, write)
+
+
+def write_json(path, document, sort_keys=False):
+    def write(f):
+        json.dump(document, f, indent=2, sort_keys=sort_keys)
+        f.write("\n")
+    atomic_write(path, write)
+
+
+def source_digest(*parts):
+    payload = json.dumps([MANIFEST_VERSION, *parts], ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def output_digest(value):
+    if isinstance(value, Table):
+        return source_digest(list(value.columns), [list(row) for row in value.rows])
+    return source_digest(value)
+
+
+class Pipeline:
+    def __init__(self):
+        self.nodes = {}
+        self.values = {}
+
+    def _add(self, name, build, depends, write):
+        if name in self.nodes:
+            raise ValueError(f"{name} is declared twice")
+        self.nodes[name] = Node(name, build, tuple(depends), write)
+
+    def source(self, name, value=None, depends=()):
+        """Register a plain value, or decorate a function deriving one from `depends`."""
+        if value is not None:
+            self._add(name, lambda: value, (), None)
+            return value
+
+        def register(build):
+            self._add(name, build, depends, None)
+            return build
+        return register
+
+    def table(self, filename, columns, depends=()):
+        """Decorate a function returning the rows of a CSV output."""
+        def register(build):
+            self._add(filename, lambda *args: Table(list(columns), list(build(*args))), depends, write_csv)
+            return build
+        return register
+
+    def static_table(self, filename, columns, rows):
+        self._add(filename, lambda: Table(list(columns), list(rows)), (), write_csv)
+
+    def artifact(self, filename, depends=(), write=write_json):
+        """Decorate a function returning a non-CSV output (written with `write`)."""
+        def register(build):
+            self._add(filename, build, depends, write)
+            return build
+        return register
+
+    @property
+    def tables(self):
+        return [name for name, node in self.nodes.items() if node.write is write_csv]
+
+    @property
+    def outputs(self):
+        return [name for name, node in self.nodes.items() if node.write is not None]
+
+    def _check_graph(self):
+        for node in self.nodes.values():
+            missing = [dep for dep in node.depends if dep not in self.nodes]
+            if missing:
+                raise ValueError(f"{node.name} depends on undeclared {', '.join(missing)}")
+        visiting, done = set(), set()
+
+        def visit(name, path):
+            if name in done:
+                return
+            if name in visiting:
+                raise ValueError(f"Dependency cycle: {' -> '.join(path + [name])}")
+            visiting.add(name)
+            for dep in self.nodes[name].depends:
+                visit(dep, path + [name])
+            visiting.discard(name)
+            done.add(name)
+        for name in self.nodes:
+            visit(name, [])
+
+    def run(self, out_dir, force=False, workers=None, instrument=NULL):
+        """Build every node, rewrite changed outputs and return the written file names."""
+        self._check_graph()
+        out_dir = Path(out_dir)
+        out_dir.mkdir(parents=True, exist_ok=True)
+        manifest_path = out_dir / MANIFEST_FILE
+        previous = {}
+        if manifest_path.exists() and not force:
+            with open(manifest_path, "r", encoding="utf-8") as f:
+                previous = json.load(f).get("tables", {})
+
+        values, digests, written = {}, {}, []
+
+        def run_node(node):
+            with instrument.stage("build", node.name) as stage:
+                value = node.build(*(values[dep] for dep in node.depends))
+                if isinstance(value, Table):
+                    stage.rows = len(value.rows)
+            if node.write is not None:
+                digest = output_digest(value)
+                path = out_dir / node.name
+                if digest != previous.get(node.name) or not path.exists():
+                    with instrument.stage("write", node.name) as stage:
+                        node.write(path, value)
+                        stage.wrote(path)
+                    return value, digest, True
+                return value, digest, False
+            return value, None, False
+
+        remaining = dict(self.nodes)
+        running = {}
+        with ThreadPoolExecutor(workers) as pool:
+            while remaining or running:
+                for name, node in list(remaining.items()):
+                    if all(dep in values for dep in node.depends):
+                        running[pool.submit(run_node, node)] = name
+                        del remaining[name]
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    values[name], digest, changed = future.result()
+                    if digest is not None:
+                        digests[name] = digest
+                    if changed:
+                        written.append(name)
+
+        if digests != previous:
+            write_json(manifest_path, {"version": MANIFEST_VERSION, "tables": digests}, sort_keys=True)
+        self.values = values
+        return [name for name in self.outputs if name in written]
@@ -0,0 +1,18 @@
+"""Run the governance script tests from the repo root, with governance/scripts importable.
+
+The scripts import each other as top-level modules and resolve governance/definitions
+relative to the repo root, as they do when run from there.
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "governance" / "scripts"))
+
+
+@pytest.fixture(autouse=True)
+def repo_root(monkeypatch):
+    monkeypatch.chdir(ROOT)
+    return ROOT
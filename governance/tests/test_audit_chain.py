@@ -0,0 +1,74 @@
+import sqlite3
+
+import pytest
+
+from audit_chain import AuditChainError, AuditVerifier, AuditWriter, create_schema, read_entries
+
+ENTRIES = 20
+CHECKPOINT_EVERY = 8  # checkpoints cover seq 0..15; 16..19 are the open segment
+
+
+@pytest.fixture
+def conn():
+    conn = sqlite3.connect(":memory:", check_same_thread=False)
+    create_schema(conn)
+    writer = AuditWriter(conn, batch_size=6, checkpoint_every=CHECKPOINT_EVERY)
+    for i in range(ENTRIES):
+        writer.append(f"tenant-{i % 3}", "AGENT", "TOOL_CALL", "ALLOW", trace_id=f"trace-{i}")
+    writer.flush()
+    writer.close()
+    yield conn
+    conn.close()
+
+
+@pytest.fixture
+def failures():
+    return []
+
+
+@pytest.fixture
+def verifier(conn, failures):
+    return AuditVerifier(conn, emit=lambda name, value, **attributes: failures.append((name, attributes)))
+
+
+def test_intact_log_verifies(verifier):
+    assert verifier.verify_checkpoints() == 2
+    assert verifier.verify_range(0, ENTRIES - 1) == ENTRIES
+    assert verifier.verify_range(9, 9) == CHECKPOINT_EVERY  # the whole segment of seq 9
+    assert verifier.verify_range(17, 18) == 3  # the open segment from its start, 16..18
+
+
+@pytest.mark.parametrize("seq", [3, 18])
+def test_edited_entry_fails(conn, verifier, failures, seq):
+    conn.execute("UPDATE audit_log SET decision_outcome = 'DENY' WHERE seq = ?", (seq,))
+    with pytest.raises(AuditChainError):
+        verifier.verify_range(0, ENTRIES - 1)
+    assert failures and failures[0][0] == "OTEL-LOG-CORE-AUDIT_CHAIN_FAIL"
+
+
+@pytest.mark.parametrize("seq", [10, 17, ENTRIES - 1])
+def test_deleted_entry_fails(conn, verifier, seq):
+    conn.execute("DELETE FROM audit_log WHERE seq = ?", (seq,))
+    with pytest.raises(AuditChainError):
+        verifier.verify_range(0, ENTRIES - 1)
+
+
+@pytest.mark.parametrize("column", ["merkle_root", "chain_head"])
+def test_forged_checkpoint_fails(conn, verifier, column):
+    conn.execute(f"UPDATE audit_checkpoint SET {column} = ? WHERE checkpoint_seq = 0", ("ab" * 32,))
+    with pytest.raises(AuditChainError):
+        verifier.verify_checkpoints()
+    with pytest.raises(AuditChainError):
+        verifier.verify_range(0, CHECKPOINT_EVERY - 1)
+
+
+def test_inclusion_proofs_round_trip(conn, verifier):
+    entries = read_entries(conn, 0, ENTRIES - 1)
+    for entry in entries[:2 * CHECKPOINT_EVERY]:
+        proof = verifier.prove(entry["seq"])
+        assert AuditVerifier.verify_proof(entry, proof)
+        assert not AuditVerifier.verify_proof({**entry, "decision_outcome": "DENY"}, proof)
+    proof = verifier.prove(5)
+    assert not AuditVerifier.verify_proof(entries[6], proof)
+    with pytest.raises(AuditChainError):
+        verifier.prove(ENTRIES - 1)  # open segment: no checkpoint to prove against
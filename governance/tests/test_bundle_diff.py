@@ -0,0 +1,58 @@
+import csv
+import io
+import zipfile
+
+import pytest
+
+from bundle_diff import diff_bundles
+
+ROOTS = ["CORE", "OBS", "SEC"]
+
+
+def bundle(tables):
+    data = io.BytesIO()
+    with zipfile.ZipFile(data, "w") as z:
+        for name, rows in tables.items():
+            out = io.StringIO()
+            csv.writer(out, lineterminator="\n").writerows(rows)
+            z.writestr(name, out.getvalue())
+    data.seek(0)
+    return zipfile.ZipFile(data)
+
+
+def artifact_rules(allowed_roots, roots=ROOTS):
+    return bundle({
+        "RootNamespaceMap.csv": [["root"]] + [[root] for root in roots],
+        "OfficialPrefixRegistry.csv": [["prefix", "allowed_roots"], ["OTEL-LOG", "CORE|OBS"]],
+        "ArtifactTypeRules.csv": [["artifact_type", "allowed_roots", "allowed_prefixes"],
+                                  ["LOG", allowed_roots, "OTEL-LOG"]],
+    })
+
+
+def breaking(old, new):
+    return [reason for change in diff_bundles(old, new) for reason in change.breaking]
+
+
+@pytest.mark.parametrize("old, new", [
+    ("ALL", "SEC|CORE|OBS"),
+    ("CORE|OBS", "ALL"),
+    ("ALL_RUNTIME", "OBS|CORE"),
+    ("OBS|CORE", "ALL_RUNTIME"),
+])
+def test_expanded_roots_that_match_are_not_breaking(old, new):
+    assert breaking(artifact_rules(old), artifact_rules(new)) == []
+
+
+@pytest.mark.parametrize("old, new, lost", [
+    ("ALL", "CORE|OBS", "SEC"),
+    ("ALL", "ALL_RUNTIME", "SEC"),
+    ("ALL_RUNTIME", "CORE", "OBS"),
+])
+def test_lost_roots_are_named(old, new, lost):
+    assert breaking(artifact_rules(old), artifact_rules(new)) == [f"allowed_roots lost {lost}"]
+
+
+def test_roots_the_new_bundle_drops_are_left_to_the_root_map():
+    old = artifact_rules("ALL", ROOTS + ["CLIENT"])
+    new = artifact_rules("CORE|OBS|SEC")
+    assert breaking(old, new) == ["root CLIENT removed"]
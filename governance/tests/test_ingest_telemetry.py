@@ -0,0 +1,117 @@
+import asyncio
+import json
+import math
+
+import pytest
+
+from binary_catalog import BinaryCatalog, catalog_file, definitions_dir
+from ingest_telemetry import READ_LIMIT, SignalAggregator, TelemetryIngestor
+
+EVENT = {"prefix": "OTEL-LOG", "scope": "INGRESS", "descriptor": "WEBHOOK_RECEIVED"}
+
+
+def line(**fields):
+    return (json.dumps({**EVENT, **fields}) + "\n").encode()
+
+
+@pytest.fixture
+def catalog():
+    with BinaryCatalog(str(definitions_dir / catalog_file)) as catalog:
+        yield catalog
+
+
+async def settle(ingestor, lines, timeout=5):
+    """Wait until `lines` lines have been accepted or counted as malformed."""
+    stats = ingestor.aggregator.stats
+
+    async def counted():
+        while stats["accepted"] + stats["malformed"] < lines:
+            await asyncio.sleep(0.01)
+    await asyncio.wait_for(counted(), timeout)
+
+
+def test_hostile_lines_are_counted_not_fatal(catalog):
+    keys = [{"prefix": [EVENT["prefix"]]}, {"scope": {"area": EVENT["scope"]}}, {"descriptor": 7}]
+    latency = json.dumps({**EVENT, "unit": "ms"})[:-1]
+    lines = ([line(**fields) for fields in keys]
+             + [f'{latency}, "value": {value}}}\n'.encode() for value in ("1e400", "NaN", "-Infinity", "9" * 400)]
+             + [line(unit="ms", value=12.5)] * 2)
+
+    async def scenario():
+        ingestor = TelemetryIngestor(SignalAggregator.from_catalog(catalog), interval=3600, queue_size=2)
+        stop = asyncio.Event()
+
+        async def feed():
+            for item in lines:
+                await ingestor.submit(item)
+            stop.set()
+        points = await asyncio.wait_for(ingestor.run([feed()], stop), 5)
+        return ingestor.aggregator.stats, points
+
+    stats, points = asyncio.run(scenario())
+    assert (stats["malformed"], stats["accepted"]) == (3, 6)
+    assert points and all(math.isfinite(point.value) for point in points)
+
+
+def test_dead_consumer_raises_from_run(catalog):
+    class DeadAggregator(SignalAggregator):
+        def add_lines(self, lines):
+            raise RuntimeError("consumer died")
+
+    async def scenario():
+        ingestor = TelemetryIngestor(DeadAggregator.from_catalog(catalog), interval=3600, queue_size=2)
+
+        async def feed():
+            for _ in range(10):
+                await ingestor.submit(line())  # blocks for good once the consumer is gone
+        await asyncio.wait_for(ingestor.run([feed()], asyncio.Event()), 5)
+
+    with pytest.raises(RuntimeError, match="consumer died"):
+        asyncio.run(scenario())
+
+
+@pytest.mark.parametrize("size", [READ_LIMIT + 10, 3 * READ_LIMIT])
+def test_socket_drops_an_overlong_line_whole(catalog, tmp_path, size):
+    async def scenario():
+        ingestor = TelemetryIngestor(SignalAggregator.from_catalog(catalog), interval=3600)
+        path = str(tmp_path / "telemetry.sock")
+        await ingestor.serve_unix(path)
+        stop = asyncio.Event()
+
+        async def client():
+            _, writer = await asyncio.open_unix_connection(path)
+            for chunk in (line(), b"x" * size, b"\n", line()):
+                writer.write(chunk)
+                await writer.drain()
+            writer.close()
+            await writer.wait_closed()
+            await settle(ingestor, 3)
+            stop.set()
+        await asyncio.wait_for(ingestor.run([client()], stop), 10)
+        return ingestor
+
+    ingestor = asyncio.run(scenario())
+    stats = ingestor.aggregator.stats
+    assert (stats["malformed"], stats["accepted"]) == (1, 2)
+    assert ingestor.bytes_in == 2 * len(line())
+
+
+@pytest.mark.parametrize("size", [READ_LIMIT + 10, 5 * READ_LIMIT])
+def test_tail_drops_an_overlong_line_whole(catalog, tmp_path, size):
+    path = tmp_path / "app.jsonl"
+    path.write_bytes(line() + b"x" * size + b"\n" + line())
+
+    async def scenario():
+        ingestor = TelemetryIngestor(SignalAggregator.from_catalog(catalog), interval=3600)
+        stop = asyncio.Event()
+
+        async def wait():
+            await settle(ingestor, 3)
+            stop.set()
+        await asyncio.wait_for(ingestor.run([ingestor.tail(str(path), poll=0.01, from_start=True), wait()], stop), 10)
+        return ingestor
+
+    ingestor = asyncio.run(scenario())
+    stats = ingestor.aggregator.stats
+    assert (stats["malformed"], stats["accepted"]) == (1, 2)
+    assert ingestor.bytes_in == 2 * len(line())
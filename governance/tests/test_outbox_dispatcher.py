@@ -0,0 +1,17 @@
+import sqlite3
+
+from outbox_dispatcher import create_schema, enqueue
+
+
+def test_enqueue_reports_inserted_rows_only():
+    conn = sqlite3.connect(":memory:")
+    create_schema(conn)
+    emitted = []
+
+    def emit(name, value, **attributes):
+        emitted.append((name, value, attributes))
+
+    assert enqueue(conn, "tenant-001", "NOTIFY", {"n": 1}, "key-1", emit=emit)
+    assert not enqueue(conn, "tenant-001", "NOTIFY", {"n": 1}, "key-1", emit=emit)  # duplicate key
+    assert enqueue(conn, "tenant-002", "NOTIFY", {"n": 1}, "key-1", emit=emit)
+    assert emitted == [("OTEL-LOG-EVENT-OUTBOX_ENQUEUED", 1, {"action_type": "NOTIFY"})] * 2
@@ -0,0 +1,76 @@
+import { describe, it, expect } from 'vitest';
+import { readFileSync } from 'fs';
+import {
+    validateEvent,
+    validateEventAsync,
+    phfLookup,
+    decodeTable,
+    loadArea,
+    KIND_DESCRIPTOR,
+    KIND_SCOPE,
+    type TelemetryEvent,
+} from './lib/governance';
+import { table as CORE_AREA } from './lib/governance/areas/core';
+
+// NamingTestSuite names that are telemetry events: <OTEL prefix>-<scope>-<descriptor>
+const SUITE = readFileSync(new URL('../governance/definitions/NamingTestSuite.csv', import.meta.url), 'utf-8')
+    .trim()
+    .split('\n')
+    .slice(1)
+    .map((line) => line.split(','))
+    .filter(([, name]) => name.startsWith('OTEL-'))
+    .map(([expected, name]) => {
+        const [family, type, scope, ...descriptor] = name.split('-');
+        return {
+            expected: expected === 'ALLOW',
+            name,
+            event: { prefix: `${family}-${type}`, scope, descriptor: descriptor.join('-') } as TelemetryEvent,
+        };
+    });
+
+const event = (prefix: string, scope: string, descriptor: string) =>
+    ({ prefix, scope, descriptor }) as TelemetryEvent;
+
+describe('governance SDK', () => {
+    it('covers NamingTestSuite events', () => {
+        expect(SUITE.length).toBeGreaterThan(0);
+    });
+
+    it('fails closed for a lazy area until its table has loaded', async () => {
+        const billing = event('OTEL-LOG', 'BILLING', 'DUNNING_STARTED');
+        expect(validateEvent(billing)).toBe(false);
+        expect(await validateEventAsync(billing)).toBe(true);
+        expect(validateEvent(billing)).toBe(true);
+    });
+
+    it.each(SUITE)('validateEvent($name) matches the suite', async ({ expected, event }) => {
+        await loadArea(event.scope);
+        expect(validateEvent(event)).toBe(expected);
+    });
+
+    it('rejects prefixes outside their allowed_roots even where the matrix allows the family', () => {
+        // INGRESS x CSF is ALLOW, but CSF-GV is only allowed under CORE, SEC, TENANT and SUPPLY
+        expect(validateEvent(event('CSF-GV', 'INGRESS', 'WEBHOOK_RECEIVED'))).toBe(false);
+    });
+
+    it('rejects unknown prefixes, scopes and descriptors', () => {
+        expect(validateEvent(event('OTEL-BOGUS', 'INGRESS', 'WEBHOOK_RECEIVED'))).toBe(false);
+        expect(validateEvent(event('OTEL-LOG', 'NOWHERE', 'WEBHOOK_RECEIVED'))).toBe(false);
+        expect(validateEvent(event('OTEL-LOG', 'INGRESS', 'NOT_A_DESCRIPTOR'))).toBe(false);
+        expect(validateEvent(event('OTEL-LOG', 'INGRESS', 'WEBHOOK_RECEIVED_'))).toBe(false);
+        expect(validateEvent(event('OTEL-LOG', 'INGRESS', ''))).toBe(false);
+    });
+
+    it('phfLookup returns the stored value for members and 0 for non-members', () => {
+        const table = decodeTable(CORE_AREA);
+        expect(phfLookup(table, KIND_DESCRIPTOR, 'FSM_TRANSITION_DENIED')).toBe(1);
+        for (const descriptor of ['', 'FSM_TRANSITION', 'FSM_TRANSITION_DENIEDX', 'fsm_transition_denied', 'OIDC_LOGIN_OK']) {
+            expect(phfLookup(table, KIND_DESCRIPTOR, descriptor)).toBe(0);
+        }
+        for (let i = 0; i < 1000; i++) {
+            expect(phfLookup(table, KIND_DESCRIPTOR, `NOT_A_DESCRIPTOR_${i}`)).toBe(0);
+        }
+        // The kind namespaces the key
+        expect(phfLookup(table, KIND_SCOPE, 'FSM_TRANSITION_DENIED')).toBe(0);
+    });
+});
@@ -0,0 +1,19 @@
+// @generated by governance/scripts/generate_sdk.py
+// DO NOT EDIT MANUALLY. Run 'python3 governance/scripts/generate_sdk.py' to update.
+
+import type { AreaTable } from '../core';
+
+// Descriptors catalogued under API
+export type ApiAreaDescriptor =
+  | 'BC_FAIL'
+  | 'BC_OK'
+  | 'CDC_CONTRACT_FAIL'
+  | 'CDC_CONTRACT_OK'
+  | 'ERROR_MAPPED'
+  | 'ERROR_UNMAPPED'
+  | 'OAS_PUBLISHED'
+  | 'SCHEMA_BREAKING_CHANGE'
+  | 'SCHEMA_VALIDATED';
+
+// Perfect hash of every descriptor/signal valid in the API scope
+export const table: AreaTable = { size: 19, buckets: 7, seeds: 'B4AEABAAAgA+AAIAEYA=', entries: 'wyE/7AEAAABBXjEsAQAAAKdeJSwBAAAAQJw5AQEAAACUgD9RAQAAAI0l3jwBAAAARih/zAEAAAAQP2PfAQAAAM4VbxEBAAAASNX8iAEAAAAR9bUQAQAAALSB42cBAAAAYtfZWwEAAACP37CgAQAAAPJP6HUBAAAAkGVLDAEAAACWYt3PAQAAALAsLkgBAAAApYf7KQEAAAA=' };
@@ -0,0 +1,19 @@
+// @generated by governance/scripts/generate_sdk.py
+// DO NOT EDIT MANUALLY. Run 'python3 governance/scripts/generate_sdk.py' to update.
+
+import type { AreaTable } from '../core';
+
+// Descriptors catalogued under BILLING
+export type BillingAreaDescriptor =
+  | 'DUNNING_RESOLVED'
+  | 'DUNNING_STARTED'
+  | 'ENTITLEMENT_DENIED'
+  | 'ENTITLEMENT_GRANTED'
+  | 'INVOICE_ISSUED'
+  | 'METERING_RECORDED'
+  | 'PAYMENT_FAILED'
+  | 'PAYMENT_SUCCEEDED'
+  | 'PLAN_ASSIGNED';
+
+// Perfect hash of every descriptor/signal valid in the BILLING scope
+export const table: AreaTable = { size: 20, buckets: 7, seeds: 'BQADAAAABwAUABIA0gA=', entries: 'nUYuAAEAAABGKH/MAQAAALmZ6WMBAAAA/6S2+QEAAACXjC6PAQAAALAsLkgBAAAAKIMqCAEAAABM0oicAQAAAMZvUUABAAAAED9j3wEAAABBXjEsAQAAAEXqPjQBAAAA+IHd8QEAAACe+o6tAQAAAI0l3jwBAAAAlIA/UQEAAAANUf6GAQAAAJZi3c8BAAAAipKuQQEAAACnXiUsAQAAAA==' };
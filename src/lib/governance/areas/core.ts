@@ -0,0 +1,27 @@
+// @generated by governance/scripts/generate_sdk.py
+// DO NOT EDIT MANUALLY. Run 'python3 governance/scripts/generate_sdk.py' to update.
+
+import type { AreaTable } from '../core';
+
+// Descriptors catalogued under CORE
+export type CoreAreaDescriptor =
+  | 'AUDIT_CHAIN_ADVANCED'
+  | 'AUDIT_CHAIN_FAIL'
+  | 'AUDIT_WRITE_FAIL'
+  | 'AUDIT_WRITE_OK'
+  | 'FSM_RECONCILE_DONE'
+  | 'FSM_RECONCILE_STARTED'
+  | 'FSM_STATE_LOADED'
+  | 'FSM_TRANSITION_ALLOWED'
+  | 'FSM_TRANSITION_APPLIED'
+  | 'FSM_TRANSITION_DENIED'
+  | 'ROUTE_AGENT'
+  | 'ROUTE_FLOW'
+  | 'ROUTE_HUMAN'
+  | 'RULE_MATCHED'
+  | 'RULE_NO_MATCH'
+  | 'SSOT_READ_FAIL'
+  | 'SSOT_READ_OK';
+
+// Perfect hash of every descriptor/signal valid in the CORE scope
+export const table: AreaTable = { size: 31, buckets: 11, seeds: 'bgAtAAEAAQARAA+AFQACADkAAwAbgA==', entries: 'bLizHAEAAABBXjEsAQAAAEYof8wBAAAA4gzOcwEAAAClmd43AQAAAKN1VQYBAAAAlmLdzwEAAADhhcvYAQAAAJSAP1EBAAAAp14lLAEAAAA38RFmAQAAAMJiYrkBAAAAm9/TFQEAAABN7QUqAQAAAM1hXdgBAAAAcOw1qwEAAAAQP2PfAQAAAFSaQ6UBAAAAzgUokwEAAACwLC5IAQAAABjUPlwBAAAAOztTkAEAAAB79a5hAQAAABkgBfQBAAAAnUYuAAEAAACNJd48AQAAAD2UQB8BAAAAFPOnJAEAAAAM7bpCAQAAAORU4uQBAAAAQTSdWQEAAAA=' };
@@ -0,0 +1,24 @@
+// @generated by governance/scripts/generate_sdk.py
+// DO NOT EDIT MANUALLY. Run 'python3 governance/scripts/generate_sdk.py' to update.
+
+import type { AreaTable } from '../core';
+
+// Descriptors catalogued under EVENT
+export type EventAreaDescriptor =
+  | 'DLQ_ENQUEUED'
+  | 'DLQ_REPROCESS_FAIL'
+  | 'DLQ_REPROCESS_OK'
+  | 'DLQ_REPROCESS_STARTED'
+  | 'INBOX_DUPLICATE'
+  | 'INBOX_MARKED_PROCESSED'
+  | 'OUTBOX_BACKLOG_HIGH'
+  | 'OUTBOX_DEQUEUED'
+  | 'OUTBOX_DISPATCH_FAIL'
+  | 'OUTBOX_DISPATCH_OK'
+  | 'OUTBOX_ENQUEUED'
+  | 'POISON_MESSAGE_DETECTED'
+  | 'RETRY_EXHAUSTED'
+  | 'RETRY_SCHEDULED';
+
+// Perfect hash of every descriptor/signal valid in the EVENT scope
+export const table: AreaTable = { size: 35, buckets: 12, seeds: 'AgAKAAoABIAAAAMAIoAoAAYAVAAGADsA', entries: 'pUzn2gEAAAB79a5hAQAAAE+5HYwBAAAAp14lLAEAAAD/BwFoAQAAABTzpyQBAAAA8reBnQEAAAAzqx5qAQAAAGy4sxwBAAAAnqlfLQEAAACzATebAQAAAEFeMSwBAAAAlmLdzwEAAAAif3OQAQAAABWo0QUBAAAAoCfxzwEAAADNYV3YAQAAAI0l3jwBAAAAIMgHDQEAAAAC4bWFAQAAAJSAP1EBAAAAAvSoIAEAAACwLC5IAQAAAEYof8wBAAAAccr1kQEAAAC61KSDAQAAAHDsNasBAAAAnUYuAAEAAABB6obaAQAAABA/Y98BAAAAfgzHNAEAAABTEbqXAQAAAKUivvMBAAAAH2INjwEAAACAx7glAQAAAA==' };
@@ -0,0 +1,30 @@
+// @generated by governance/scripts/generate_sdk.py
+// DO NOT EDIT MANUALLY. Run 'python3 governance/scripts/generate_sdk.py' to update.
+
+import type { AreaTable } from '../core';
+
+// Descriptors catalogued under IAM
+export type IamAreaDescriptor =
+  | 'ABAC_POLICY_DENY'
+  | 'ABAC_POLICY_MATCHED'
+  | 'AUTHZ_ALLOW'
+  | 'AUTHZ_DENY'
+  | 'MFA_FAIL'
+  | 'MFA_OK'
+  | 'MFA_REQUIRED'
+  | 'OIDC_LOGIN_FAIL'
+  | 'OIDC_LOGIN_OK'
+  | 'OIDC_LOGIN_STARTED'
+  | 'RBAC_ROLE_ASSIGNED'
+  | 'RBAC_ROLE_REMOVED'
+  | 'SCIM_PROVISION_FAIL'
+  | 'SCIM_PROVISION_OK'
+  | 'SESSION_CREATED'
+  | 'SESSION_EXPIRED'
+  | 'TOKEN_INVALID'
+  | 'TOKEN_ISSUED'
+  | 'TOKEN_REFRESHED'
+  | 'TOKEN_REVOKED';
+
+// Perfect hash of every descriptor/signal valid in the IAM scope
+export const table: AreaTable = { size: 29, buckets: 10, seeds: 'AQAEABUAEgAEAAQAAQAiAI0AGYA=', entries: 'ORKv/gEAAACwLC5IAQAAAG92qVIBAAAAED9j3wEAAAC8HqFoAQAAACf2ussBAAAA4axUuAEAAADY+D+3AQAAAEFeMSwBAAAAVnhVSAEAAAC1boCgAQAAAEYof8wBAAAAfBsRlgEAAAB8//LhAQAAAKdeJSwBAAAA+At4BAEAAADHZQSJAQAAANWmJRsBAAAAlmLdzwEAAABcwCDbAQAAALM99FMBAAAAHBm3vQEAAAD7Qb5OAQAAAGMl1moBAAAADF+o6QEAAADIdfbjAQAAAI0l3jwBAAAAlIA/UQEAAADs9ZPsAQAAAA==' };
@@ -0,0 +1,31 @@
+// @generated by governance/scripts/generate_sdk.py
+// DO NOT EDIT MANUALLY. Run 'python3 governance/scripts/generate_sdk.py' to update.
+
+import type { AreaTable } from '../core';
+
+// Descriptors catalogued under INGRESS
+export type IngressAreaDescriptor =
+  | 'CANONICALIZE_APPLIED'
+  | 'DEDUPE_HIT'
+  | 'DEDUP_STORE_FAIL'
+  | 'IDEMP_HIT'
+  | 'IDEMP_KEY_CREATED'
+  | 'INPUT_VALIDATION_FAIL'
+  | 'INPUT_VALIDATION_OK'
+  | 'PII_DETECTED'
+  | 'RATE_LIMIT_APPLIED'
+  | 'RATE_LIMIT_BLOCKED'
+  | 'REDACTION_APPLIED'
+  | 'REQUEST_AUTHZ_DENY'
+  | 'REQUEST_AUTHZ_OK'
+  | 'REQUEST_AUTH_FAIL'
+  | 'REQUEST_AUTH_OK'
+  | 'UNICODE_NORMALIZED'
+  | 'WEBHOOK_PARSE_FAIL'
+  | 'WEBHOOK_PARSE_OK'
+  | 'WEBHOOK_RECEIVED'
+  | 'WEBHOOK_SIGNATURE_FAIL'
+  | 'WEBHOOK_SIGNATURE_OK';
+
+// Perfect hash of every descriptor/signal valid in the INGRESS scope
+export const table: AreaTable = { size: 34, buckets: 12, seeds: 'AgAFAAAAJAABADgAAQAIAAQAAgAbAA0A', entries: 'DQWCDwEAAAAK12qRAQAAACZ4paoBAAAAMiTlOAEAAADXLdMOAQAAAHBS+DgBAAAAeCV/nAEAAAC6o7Y1AQAAAEFeMSwBAAAABpwniQEAAABI1fyIAQAAAGwUI7IBAAAAwyE/7AEAAACUgD9RAQAAADPC99gBAAAAjSXePAEAAACokgnEAQAAAAlES44BAAAA4vduGQEAAAAQP2PfAQAAAM9aIqIBAAAAH4lnCAEAAACnXiUsAQAAAGy4sxwBAAAAsCwuSAEAAADu4Z+vAQAAAJQsuasBAAAAutSkgwEAAAAhrlxIAQAAAPUPFSgBAAAARih/zAEAAAAPai2SAQAAAJZi3c8BAAAA+OUzdwEAAAA=' };
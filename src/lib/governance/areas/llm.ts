@@ -0,0 +1,35 @@
+// @generated by governance/scripts/generate_sdk.py
+// DO NOT EDIT MANUALLY. Run 'python3 governance/scripts/generate_sdk.py' to update.
+
+import type { AreaTable } from '../core';
+
+// Descriptors catalogued under LLM
+export type LlmAreaDescriptor =
+  | 'ASSUMPTION_LISTED'
+  | 'COST_BUDGET_APPLIED'
+  | 'DATA_TREATED_AS_DATA'
+  | 'EVIDENCE_MISSING'
+  | 'EVIDENCE_REQUIRED'
+  | 'INJECTION_SIGNAL_DETECTED'
+  | 'LATENCY_BUDGET_APPLIED'
+  | 'MODEL_FALLBACK'
+  | 'MODEL_ROUTED'
+  | 'OUTPUT_VALIDATION_FAIL'
+  | 'OUTPUT_VALIDATION_OK'
+  | 'PLAN_GENERATED'
+  | 'PLAN_INVALID'
+  | 'PLAN_TRIMMED'
+  | 'POLICY_ALLOWED'
+  | 'POLICY_DENIED'
+  | 'POLICY_EVALUATED'
+  | 'TOKEN_BUDGET_APPLIED'
+  | 'TOOL_ALLOWED'
+  | 'TOOL_ERROR'
+  | 'TOOL_PROPOSED'
+  | 'TOOL_REJECTED'
+  | 'TOOL_SCHEMA_FAIL'
+  | 'TOOL_SCHEMA_OK'
+  | 'TOOL_TIMEOUT';
+
+// Perfect hash of every descriptor/signal valid in the LLM scope
+export const table: AreaTable = { size: 45, buckets: 15, seeds: 'DAAuAAMACIAHABYADgAsAAEASAA0ABaAhgIBAAoA', entries: 'p14lLAEAAAB+Izx8AQAAAEmkuEUBAAAAS68q9wEAAADzZq1NAQAAADJUl1QBAAAAReo+NAEAAAB5dCvsAQAAAHd78/wBAAAAhAWPYwEAAAAYrmvSAQAAAKOHBF4BAAAAe/WuYQEAAABUmcCVAQAAAJSAP1EBAAAAMfD/GAEAAACKv8EEAQAAAJvCla8BAAAAz1W5DwEAAAB+MjqwAQAAAC8ya7oBAAAA9/Vk4gEAAADNYV3YAQAAABA/Y98BAAAAsh+r/AEAAABGKH/MAQAAABJoiEABAAAAQV4xLAEAAAB9xTDZAQAAAB0rSkoBAAAATDNwagEAAAAU86ckAQAAAFPP+ZYBAAAA3HVRVgEAAAAogyoIAQAAAJZi3c8BAAAAcOw1qwEAAACqdnmaAQAAAJDSq80BAAAAjSXePAEAAAC9/vwsAQAAALAsLkgBAAAAxdF7LQEAAAA01OSlAQAAAJtLU/gBAAAA' };
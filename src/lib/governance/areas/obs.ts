@@ -0,0 +1,24 @@
+// @generated by governance/scripts/generate_sdk.py
+// DO NOT EDIT MANUALLY. Run 'python3 governance/scripts/generate_sdk.py' to update.
+
+import type { AreaTable } from '../core';
+
+// Descriptors catalogued under OBS
+export type ObsAreaDescriptor =
+  | 'ALERT_FIRED'
+  | 'ALERT_RESOLVED'
+  | 'BURN_RATE_FAST'
+  | 'BURN_RATE_SLOW'
+  | 'DASHBOARD_UPDATED'
+  | 'DLQ_COUNT'
+  | 'ERROR_RATE'
+  | 'LATENCY_P50'
+  | 'LATENCY_P95'
+  | 'LATENCY_P99'
+  | 'QUEUE_DEPTH'
+  | 'REQUEST_RATE'
+  | 'RETRY_RATE'
+  | 'SATURATION';
+
+// Perfect hash of every descriptor/signal valid in the OBS scope
+export const table: AreaTable = { size: 40, buckets: 14, seeds: 'AQAhgCOAGgADAAEAGABsAA0AAAAEAA0AiAAGAA==', entries: '+At4BAEAAAB+Izx8AQAAAFMRupcBAAAASNX8iAEAAAAzqx5qAQAAAFEb3hMBAAAAIMgHDQEAAAD/BwFoAQAAABTzpyQBAAAAfcUw2QEAAAAif3OQAQAAALAsLkgBAAAAJnilqgEAAACIrpUtAQAAABA/Y98BAAAAlmLdzwEAAABBXjEsAQAAAGy4sxwBAAAAReo+NAEAAAB5dCvsAQAAAHDsNasBAAAAdoqKhQEAAACAx7glAQAAAKdeJSwBAAAAW+fd2wEAAACNJd48AQAAAC8ya7oBAAAAp4YdhAEAAAC61KSDAQAAAD5DZIEBAAAARih/zAEAAACbS1P4AQAAAMMhP+wBAAAA9/Vk4gEAAAB79a5hAQAAAM1hXdgBAAAAlIA/UQEAAACdRi4AAQAAACiDKggBAAAAuvJ0OwEAAAA=' };
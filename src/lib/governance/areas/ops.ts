@@ -0,0 +1,19 @@
+// @generated by governance/scripts/generate_sdk.py
+// DO NOT EDIT MANUALLY. Run 'python3 governance/scripts/generate_sdk.py' to update.
+
+import type { AreaTable } from '../core';
+
+// Descriptors catalogued under OPS
+export type OpsAreaDescriptor =
+  | 'ACTION_ITEM_TRACKED'
+  | 'INCIDENT_DECLARED'
+  | 'INCIDENT_ESCALATED'
+  | 'MITIGATION_APPLIED'
+  | 'POSTMORTEM_CREATED'
+  | 'RESTORE_FAIL'
+  | 'RESTORE_OK'
+  | 'RESTORE_STARTED'
+  | 'ROLLBACK_EXECUTED';
+
+// Perfect hash of every descriptor/signal valid in the OPS scope
+export const table: AreaTable = { size: 9, buckets: 3, seeds: 'BwBNAAEA', entries: 'Y5k1hwEAAADYSTzOAQAAAIxaw/4BAAAAgLhvDwEAAABjUnJZAQAAAPsPsn4BAAAAtOLi9QEAAAAR6oVLAQAAAN22p6cBAAAA' };
@@ -0,0 +1,34 @@
+// @generated by governance/scripts/generate_sdk.py
+// DO NOT EDIT MANUALLY. Run 'python3 governance/scripts/generate_sdk.py' to update.
+
+import type { AreaTable } from '../core';
+
+// Descriptors catalogued under RAG
+export type RagAreaDescriptor =
+  | 'CHUNK_FAIL'
+  | 'CHUNK_OK'
+  | 'CITATION_ATTACHED'
+  | 'CITATION_MISSING'
+  | 'EMBED_FAIL'
+  | 'EMBED_OK'
+  | 'FRESHNESS_APPLIED'
+  | 'GROUNDING_FAIL'
+  | 'GROUNDING_OK'
+  | 'HYBRID_MERGED'
+  | 'INDEX_BUILT'
+  | 'INDEX_UPDATED'
+  | 'INGEST_FAIL'
+  | 'INGEST_OK'
+  | 'INGEST_STARTED'
+  | 'PARSE_FAIL'
+  | 'PARSE_OK'
+  | 'RERANK_FAIL'
+  | 'RERANK_OK'
+  | 'RETRIEVAL_EVAL_FAIL'
+  | 'RETRIEVAL_EVAL_OK'
+  | 'RETRIEVE_EMPTY'
+  | 'RETRIEVE_OK'
+  | 'RETRIEVE_STARTED';
+
+// Perfect hash of every descriptor/signal valid in the RAG scope
+export const table: AreaTable = { size: 40, buckets: 14, seeds: 'DwAEAAQADAApADMABwAAAAUAAwADABmAoQABAA==', entries: 'W+fd2wEAAACwLC5IAQAAAIWhXIkBAAAAdoqKhQEAAAD39WTiAQAAAMkHCGYBAAAA9Im6WwEAAACWYt3PAQAAAO+M3X0BAAAAivWZ5AEAAAAMPjvqAQAAABTzpyQBAAAABepxpgEAAABgUmMgAQAAAEYof8wBAAAAPfDGSgEAAAATmK/6AQAAAI7UilEBAAAAnfb5VwEAAABi+0BTAQAAAM1hXdgBAAAAo8627gEAAABw7DWrAQAAALmcjQUBAAAAp14lLAEAAACUgD9RAQAAAFx0kKYBAAAAxLj6dwEAAACWCq+FAQAAABA/Y98BAAAALzJrugEAAAC/Vna9AQAAAMci8+EBAAAAQV4xLAEAAACNY0sUAQAAAJFW6+8BAAAAxswUewEAAACOFqu3AQAAAI0l3jwBAAAAe/WuYQEAAAA=' };
@@ -0,0 +1,20 @@
+// @generated by governance/scripts/generate_sdk.py
+// DO NOT EDIT MANUALLY. Run 'python3 governance/scripts/generate_sdk.py' to update.
+
+import type { AreaTable } from '../core';
+
+// Descriptors catalogued under SEC
+export type SecAreaDescriptor =
+  | 'ABUSE_BLOCKED'
+  | 'ABUSE_DETECTED'
+  | 'EGRESS_FILTERING'
+  | 'ENCRYPTION_ENABLED'
+  | 'KEY_ROTATED'
+  | 'LEAST_PRIVILEGE'
+  | 'RETENTION_APPLIED'
+  | 'SECRETS_ROTATED'
+  | 'VULN_FIXED'
+  | 'VULN_FOUND';
+
+// Perfect hash of every descriptor/signal valid in the SEC scope
+export const table: AreaTable = { size: 10, buckets: 4, seeds: 'BAANABcAAAA=', entries: 'thNDKgEAAABc5dPJAQAAALJv0l0BAAAAcNOKygEAAACzuPwvAQAAAKEJRw4BAAAAkyiEvgEAAABP6SNVAQAAAHiq/sMBAAAAEDQ4RAEAAAA=' };
@@ -0,0 +1,19 @@
+// @generated by governance/scripts/generate_sdk.py
+// DO NOT EDIT MANUALLY. Run 'python3 governance/scripts/generate_sdk.py' to update.
+
+import type { AreaTable } from '../core';
+
+// Descriptors catalogued under SUPPLY
+export type SupplyAreaDescriptor =
+  | 'ARTIFACT_SIGNED'
+  | 'DEPENDENCY_PINNED'
+  | 'PROVENANCE_GENERATED'
+  | 'SBOM_GENERATED'
+  | 'SECRETS_SCAN_FAIL'
+  | 'SECRETS_SCAN_OK'
+  | 'SLSA_LEVEL_SET'
+  | 'VULN_SCAN_FAIL'
+  | 'VULN_SCAN_OK';
+
+// Perfect hash of every descriptor/signal valid in the SUPPLY scope
+export const table: AreaTable = { size: 13, buckets: 5, seeds: 'A4ABAAWAHQAGgA==', entries: 'zWFd2AEAAABw7DWrAQAAAADUg14BAAAAyniAFwEAAACl5D+EAQAAAHv1rmEBAAAAyDoKSAEAAACK5zljAQAAAIhP7xwBAAAA2fErfgEAAABO1ZyyAQAAANLSEuQBAAAAFPOnJAEAAAA=' };
@@ -0,0 +1,17 @@
+// @generated by governance/scripts/generate_sdk.py
+// DO NOT EDIT MANUALLY. Run 'python3 governance/scripts/generate_sdk.py' to update.
+
+import type { AreaTable } from '../core';
+
+// Descriptors catalogued under TENANT
+export type TenantAreaDescriptor =
+  | 'TENANT_CONFIG_UPDATED'
+  | 'TENANT_CREATED'
+  | 'TENANT_DELETED'
+  | 'TENANT_KEYS_ROTATED'
+  | 'TENANT_QUOTA_UPDATED'
+  | 'TENANT_REACTIVATED'
+  | 'TENANT_SUSPENDED';
+
+// Perfect hash of every descriptor/signal valid in the TENANT scope
+export const table: AreaTable = { size: 16, buckets: 6, seeds: 'FAAIAAEAA4A4AAAA', entries: 'p14lLAEAAABF6j40AQAAAAQ/Di4BAAAAsCwuSAEAAABKYTNuAQAAAKQ6+3wBAAAAED9j3wEAAABGKH/MAQAAAJSAP1EBAAAA+x2yggEAAACNJd48AQAAAJZi3c8BAAAAJau4FgEAAABqRzmYAQAAAEFeMSwBAAAASD352wEAAAA=' };
@@ -0,0 +1,282 @@
+// @generated by governance/scripts/generate_sdk.py
+// DO NOT EDIT MANUALLY. Run 'python3 governance/scripts/generate_sdk.py' to update.
+
+import type { IngressAreaDescriptor } from './areas/ingress';
+import type { CoreAreaDescriptor } from './areas/core';
+import type { IamAreaDescriptor } from './areas/iam';
+import type { ApiAreaDescriptor } from './areas/api';
+import type { EventAreaDescriptor } from './areas/event';
+import type { LlmAreaDescriptor } from './areas/llm';
+import type { RagAreaDescriptor } from './areas/rag';
+import type { ObsAreaDescriptor } from './areas/obs';
+import type { SecAreaDescriptor } from './areas/sec';
+import type { OpsAreaDescriptor } from './areas/ops';
+import type { SupplyAreaDescriptor } from './areas/supply';
+import type { BillingAreaDescriptor } from './areas/billing';
+import type { TenantAreaDescriptor } from './areas/tenant';
+
+// Top-level domains/areas
+export enum GovernanceScope {
+  INGRESS = 'INGRESS',
+  CORE = 'CORE',
+  IAM = 'IAM',
+  API = 'API',
+  EVENT = 'EVENT',
+  LLM = 'LLM',
+  RAG = 'RAG',
+  OBS = 'OBS',
+  SEC = 'SEC',
+  OPS = 'OPS',
+  SUPPLY = 'SUPPLY',
+  BILLING = 'BILLING',
+  TENANT = 'TENANT',
+}
+
+// Official Telemetry Prefixes
+export enum TelemetryPrefix {
+  'CSF-GV' = 'CSF-GV',
+  'CSF-ID' = 'CSF-ID',
+  'CSF-PR' = 'CSF-PR',
+  'CSF-DE' = 'CSF-DE',
+  'CSF-RS' = 'CSF-RS',
+  'CSF-RC' = 'CSF-RC',
+  '80053-AC' = '80053-AC',
+  '80053-IA' = '80053-IA',
+  '80053-AU' = '80053-AU',
+  '80053-SC' = '80053-SC',
+  '80053-SI' = '80053-SI',
+  '80053-IR' = '80053-IR',
+  'SRE-SLO' = 'SRE-SLO',
+  'SRE-GS' = 'SRE-GS',
+  'SRE-ALERT' = 'SRE-ALERT',
+  'SRE-INC' = 'SRE-INC',
+  'OTEL-TRACE' = 'OTEL-TRACE',
+  'OTEL-LOG' = 'OTEL-LOG',
+  'OTEL-METRIC' = 'OTEL-METRIC',
+  'LLM-TOOLGOV' = 'LLM-TOOLGOV',
+  'LLM-POLICYGATE' = 'LLM-POLICYGATE',
+  'LLM-OUTVAL' = 'LLM-OUTVAL',
+  'LLM-BUDGET' = 'LLM-BUDGET',
+  'RAG-HYBRID' = 'RAG-HYBRID',
+  'RAG-RERANK' = 'RAG-RERANK',
+  'RAG-CITE' = 'RAG-CITE',
+  'RAG-EVAL' = 'RAG-EVAL',
+  'EVENT-OUTBOX' = 'EVENT-OUTBOX',
+  'EVENT-IDEMP' = 'EVENT-IDEMP',
+  'EVENT-DLQ' = 'EVENT-DLQ',
+}
+
+// Standardized Metrics
+export type MetricType =
+  | 'AUTHZ_DENY_RATE'
+  | 'CITATION_COVERAGE'
+  | 'COST_PER_TENANT'
+  | 'CPU_UTILIZATION'
+  | 'DEDUPE_HIT_RATE'
+  | 'DLQ_COUNT'
+  | 'ERROR_RATE'
+  | 'GROUNDING_FAIL_RATE'
+  | 'IDEMP_HIT_RATE'
+  | 'LATENCY_P50'
+  | 'LATENCY_P95'
+  | 'LATENCY_P99'
+  | 'LLM_LATENCY_P99'
+  | 'MEMORY_UTILIZATION'
+  | 'MESSAGE_RATE'
+  | 'OUTBOX_DEPTH'
+  | 'POLICY_DENY_RATE'
+  | 'QUEUE_DEPTH'
+  | 'QUOTA_EXCEEDED_RATE'
+  | 'REQUEST_RATE'
+  | 'RETRIEVAL_EMPTY_RATE'
+  | 'RETRIEVAL_PRECISION'
+  | 'RETRY_RATE'
+  | 'SATURATION'
+  | 'TOKENS_PER_CONV'
+  | 'TOKENS_RATE';
+
+// Standardized Descriptors (Logs/Events): the union of every area's vocabulary
+export type EventDescriptor =
+  | IngressAreaDescriptor
+  | CoreAreaDescriptor
+  | IamAreaDescriptor
+  | ApiAreaDescriptor
+  | EventAreaDescriptor
+  | LlmAreaDescriptor
+  | RagAreaDescriptor
+  | ObsAreaDescriptor
+  | SecAreaDescriptor
+  | OpsAreaDescriptor
+  | SupplyAreaDescriptor
+  | BillingAreaDescriptor
+  | TenantAreaDescriptor;
+
+// Validation Constants
+export const VALID_SCOPES = Object.values(GovernanceScope);
+export const VALID_PREFIXES = Object.values(TelemetryPrefix);
+
+// Minimal perfect hash tables: two little-endian uint32 per slot, fingerprint then value (base64)
+export interface AreaTable {
+  size: number;
+  buckets: number;
+  seeds: string;
+  entries: string;
+}
+
+export interface DecodedTable {
+  size: number;
+  buckets: number;
+  seeds: Uint16Array;
+  entries: Uint32Array;
+}
+
+export const KIND_SCOPE = 0x53; // 'S'
+export const KIND_PREFIX = 0x50; // 'P'
+export const KIND_DESCRIPTOR = 0x44; // 'D'
+export const KIND_SIGNAL = 0x4d; // 'M'
+
+function decodeBase64(base64: string): ArrayBuffer {
+  const raw = atob(base64);
+  const bytes = new Uint8Array(raw.length);
+  for (let i = 0; i < raw.length; i++) bytes[i] = raw.charCodeAt(i);
+  return bytes.buffer;
+}
+
+export function decodeTable(table: AreaTable): DecodedTable {
+  return {
+    size: table.size,
+    buckets: table.buckets,
+    seeds: new Uint16Array(decodeBase64(table.seeds)),
+    entries: new Uint32Array(decodeBase64(table.entries)),
+  };
+}
+
+// FNV-1a over the kind byte and UTF-16 code units (mirrors perfect_hash.key_hash)
+function phfKeyHash(kind: number, key: string): number {
+  let h = Math.imul(0x811c9dc5 ^ kind, 0x01000193);
+  for (let i = 0; i < key.length; i++) h = Math.imul(h ^ key.charCodeAt(i), 0x01000193);
+  return h;
+}
+
+// murmur3 finaliser of the key hash xor the scaled seed (mirrors perfect_hash.mix)
+function phfMix(h: number, seed: number): number {
+  h ^= Math.imul(seed, 0x9e3779b9);
+  h ^= h >>> 16;
+  h = Math.imul(h, 0x85ebca6b);
+  h ^= h >>> 13;
+  h = Math.imul(h, 0xc2b2ae35);
+  return (h ^ (h >>> 16)) >>> 0;
+}
+
+// Value stored for a key, 0 if it is not in the table
+export function phfLookup(table: DecodedTable, kind: number, key: string): number {
+  const h = phfKeyHash(kind, key);
+  const seed = table.seeds[phfMix(h, 0) % table.buckets];
+  const slot = (seed & 0x8000 ? seed & 0x7fff : phfMix(h, seed) % table.size) << 1;
+  return table.entries[slot] === phfMix(h, 0xffff) ? table.entries[slot + 1] : 0;
+}
+
+// Scopes and prefixes, each mapped to a bitmask of scopes
+const CORE_TABLE = decodeTable({ size: 43, buckets: 15, seeds: 'AwAAAAMAAQAOAAQAPgABAAMARwAIADMAHIAEAQoA', entries: 'qsY0zQIAAAD6V7ZyAAMAAF2b4MSSAQAAxLHFRQAIAACUB5yeQREAALFw5Q0ABAAAt4VmYBADAACm0sn2EAAAAGK05CoIAAAAyn7aQf8bAABExSG8AAIAAKjNu+1AAAAAAYsUvQMBAAA4d/CeoQEAAJOPcVtgAAAAWk0yVkAAAAC2/WSqAAIAAK2lvTABAAAAcFqUTvMEAAADkQg6IAAAACh+zTQgAAAAUoKifwQRAADLtzvSBwEAANOtezUCFQAAztiMOgADAACMiCE/QAAAAN79ZIwSCAAAgTNjVoICAABSJruT8wYAAHDwvWoJAQAAIJSVDQABAAADtGUP/xsAAKlxLC9gAAAANuqTYyAAAACIR/fDEAIAAEwEQv//GwAAqTo0JQAQAACSFYwTQAIAAFzEOZcXCAAAlmGu4SAAAAC//7eDBAAAANLiATAGEQAAz12q6YAAAAA=' });
+
+// Per-area descriptor tables, registered by index.ts (eagerly or on first use)
+const AREA_TABLES = new Map<string, DecodedTable>();
+const AREA_LOADERS = new Map<string, () => Promise<{ table: AreaTable }>>();
+const AREA_LOADING = new Map<string, Promise<void>>();
+
+export function registerArea(scope: string, table: AreaTable): void {
+  AREA_TABLES.set(scope, decodeTable(table));
+}
+
+export function registerLazyArea(scope: string, load: () => Promise<{ table: AreaTable }>): void {
+  AREA_LOADERS.set(scope, load);
+}
+
+export function loadArea(scope: string): Promise<void> {
+  if (AREA_TABLES.has(scope)) return Promise.resolve();
+  const load = AREA_LOADERS.get(scope);
+  if (!load) return Promise.resolve();
+  let loading = AREA_LOADING.get(scope);
+  if (!loading) {
+    loading = load().then((module) => registerArea(scope, module.table));
+    AREA_LOADING.set(scope, loading);
+  }
+  return loading;
+}
+
+// A lazy area that is still loading cannot be checked yet: start the load and reject
+// (fail closed). validateEventAsync waits for the table instead.
+function inArea(scope: string, kind: number, key: string): boolean {
+  const table = AREA_TABLES.get(scope);
+  if (table) return phfLookup(table, kind, key) !== 0;
+  if (AREA_LOADERS.has(scope)) void loadArea(scope);
+  return false;
+}
+
+export function isDescriptorInScope(scope: string, descriptor: string): boolean {
+  return phfLookup(CORE_TABLE, KIND_SCOPE, scope) !== 0 && inArea(scope, KIND_DESCRIPTOR, descriptor);
+}
+
+export function isSignalInScope(scope: string, signal: string): boolean {
+  return phfLookup(CORE_TABLE, KIND_SCOPE, scope) !== 0 && inArea(scope, KIND_SIGNAL, signal);
+}
+
+// Root x Prefix Family decisions (see RootPrefixFamilyMatrix.packed.json)
+export const DECISION_DENY = 0;
+export const DECISION_ALLOW = 1;
+export const DECISION_CONDITIONAL = 2;
+const MATRIX_ROOT_IDS = new Map<string, number>([['INGRESS', 0], ['CORE', 1], ['IAM', 2], ['API', 3], ['EVENT', 4], ['LLM', 5], ['RAG', 6], ['OBS', 7], ['SEC', 8], ['OPS', 9], ['SUPPLY', 10], ['BILLING', 11], ['TENANT', 12]]);
+const MATRIX_FAMILY_IDS = new Map<string, number>([['CSF', 0], ['80053', 1], ['SRE', 2], ['OTEL', 3], ['IAM', 4], ['API', 5], ['EVENT', 6], ['SUPPLY', 7], ['LLM', 8], ['RAG', 9]]);
+const MATRIX_WIDTH = 10;
+const MATRIX_CELLS = new Uint8Array([85, 21, 80, 69, 1, 85, 21, 64, 85, 0, 85, 16, 80, 5, 144, 85, 0, 86, 5, 0, 85, 65, 82, 5, 69, 21, 68, 80, 69, 1, 85, 20, 0]);
+const MATRIX_ALLOWLISTS = new Map<number, ReadonlySet<string>>([
+  [59, new Set(['RAG-CTXASM', 'RAG-CITE'])], // LLM x RAG
+  [68, new Set(['LLM-OUTVAL'])], // RAG x LLM
+  [88, new Set(['LLM-INJDEF'])], // SEC x LLM
+]);
+
+function matrixCell(scope: string, family: string): number {
+  const r = MATRIX_ROOT_IDS.get(scope);
+  const f = MATRIX_FAMILY_IDS.get(family);
+  return r === undefined || f === undefined ? -1 : r * MATRIX_WIDTH + f;
+}
+
+export function rootDecision(scope: string, family: string): number {
+  const cell = matrixCell(scope, family);
+  return cell < 0 ? DECISION_DENY : (MATRIX_CELLS[cell >> 2] >> ((cell & 3) << 1)) & 3;
+}
+
+// ROOT_COMPATIBLE (+ SUBPREFIX_ALLOWED for CONDITIONAL cells)
+export function isRootCompatible(scope: string, prefix: string): boolean {
+  const cell = matrixCell(scope, prefix.split('-')[0]);
+  if (cell < 0) return false;
+  const decision = (MATRIX_CELLS[cell >> 2] >> ((cell & 3) << 1)) & 3;
+  if (decision === DECISION_CONDITIONAL) return MATRIX_ALLOWLISTS.get(cell)?.has(prefix) ?? false;
+  return decision === DECISION_ALLOW;
+}
+
+// Strict Telemetry Event Structure
+export interface TelemetryEvent {
+  prefix: TelemetryPrefix;
+  scope: GovernanceScope;
+  descriptor: EventDescriptor;
+  value?: number;
+  unit?: string;
+  context?: Record<string, unknown>;
+}
+
+// Runtime Validator: two core probes and an AND cover prefix, scope and root compatibility
+// (ROOT_COMPATIBLE/SUBPREFIX_ALLOWED); one probe of the scope's table covers the descriptor
+export function validateEvent(event: TelemetryEvent): boolean {
+  const scope = phfLookup(CORE_TABLE, KIND_SCOPE, event.scope);
+  return (
+    (phfLookup(CORE_TABLE, KIND_PREFIX, event.prefix) & scope) !== 0 &&
+    inArea(event.scope, KIND_DESCRIPTOR, event.descriptor)
+  );
+}
+
+// Same check, after loading the scope's table if it is a lazy area
+export async function validateEventAsync(event: TelemetryEvent): Promise<boolean> {
+  await loadArea(event.scope);
+  return validateEvent(event);
+}
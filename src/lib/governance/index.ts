@@ -0,0 +1,46 @@
+// @generated by governance/scripts/generate_sdk.py
+// DO NOT EDIT MANUALLY. Run 'python3 governance/scripts/generate_sdk.py' to update.
+
+// Core enums, types and validators plus every area's descriptor type. Eager areas are
+// bundled here; SUPPLY, BILLING load in their own chunk on first use.
+import { registerArea, registerLazyArea } from './core';
+import { table as INGRESS_AREA } from './areas/ingress';
+import { table as CORE_AREA } from './areas/core';
+import { table as IAM_AREA } from './areas/iam';
+import { table as API_AREA } from './areas/api';
+import { table as EVENT_AREA } from './areas/event';
+import { table as LLM_AREA } from './areas/llm';
+import { table as RAG_AREA } from './areas/rag';
+import { table as OBS_AREA } from './areas/obs';
+import { table as SEC_AREA } from './areas/sec';
+import { table as OPS_AREA } from './areas/ops';
+import { table as TENANT_AREA } from './areas/tenant';
+
+export * from './core';
+export type { IngressAreaDescriptor } from './areas/ingress';
+export type { CoreAreaDescriptor } from './areas/core';
+export type { IamAreaDescriptor } from './areas/iam';
+export type { ApiAreaDescriptor } from './areas/api';
+export type { EventAreaDescriptor } from './areas/event';
+export type { LlmAreaDescriptor } from './areas/llm';
+export type { RagAreaDescriptor } from './areas/rag';
+export type { ObsAreaDescriptor } from './areas/obs';
+export type { SecAreaDescriptor } from './areas/sec';
+export type { OpsAreaDescriptor } from './areas/ops';
+export type { SupplyAreaDescriptor } from './areas/supply';
+export type { BillingAreaDescriptor } from './areas/billing';
+export type { TenantAreaDescriptor } from './areas/tenant';
+
+registerArea('INGRESS', INGRESS_AREA);
+registerArea('CORE', CORE_AREA);
+registerArea('IAM', IAM_AREA);
+registerArea('API', API_AREA);
+registerArea('EVENT', EVENT_AREA);
+registerArea('LLM', LLM_AREA);
+registerArea('RAG', RAG_AREA);
+registerArea('OBS', OBS_AREA);
+registerArea('SEC', SEC_AREA);
+registerArea('OPS', OPS_AREA);
+registerLazyArea('SUPPLY', () => import('./areas/supply'));
+registerLazyArea('BILLING', () => import('./areas/billing'));
+registerArea('TENANT', TENANT_AREA);
@@ -0,0 +1,34 @@
+import { describe, it, expect, vi, afterEach } from 'vitest';
+import { logger } from './utils/logger';
+import { GovernanceScope, TelemetryPrefix, loadArea, type EventDescriptor } from './lib/governance';
+
+// The logger validates asynchronously: wait for the area table, then for the warning callback
+const settle = async (scope: string) => {
+    await loadArea(scope);
+    await new Promise((resolve) => setTimeout(resolve, 0));
+};
+
+const violations = (warn: { mock: { calls: unknown[][] } }) =>
+    warn.mock.calls.filter(([message]) => String(message).startsWith('[GOVERNANCE VIOLATION]'));
+
+describe('logger governance validation', () => {
+    afterEach(() => {
+        vi.restoreAllMocks();
+    });
+
+    it('does not flag the first event of a lazy area before its table has loaded', async () => {
+        vi.spyOn(console, 'log').mockImplementation(() => undefined);
+        const warn = vi.spyOn(console, 'warn').mockImplementation(() => undefined);
+        logger.track(TelemetryPrefix['OTEL-LOG'], GovernanceScope.BILLING, 'DUNNING_STARTED' as EventDescriptor);
+        await settle(GovernanceScope.BILLING);
+        expect(violations(warn)).toHaveLength(0);
+    });
+
+    it('flags events the catalog does not allow', async () => {
+        vi.spyOn(console, 'log').mockImplementation(() => undefined);
+        const warn = vi.spyOn(console, 'warn').mockImplementation(() => undefined);
+        logger.track(TelemetryPrefix['OTEL-LOG'], GovernanceScope.INGRESS, 'NOT_A_DESCRIPTOR' as EventDescriptor);
+        await settle(GovernanceScope.INGRESS);
+        expect(violations(warn)).toHaveLength(1);
+    });
+});
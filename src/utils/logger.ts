@@ -8,10 +8,9 @@
 import {
     GovernanceScope,
     TelemetryPrefix,
-    EventDescriptor,
-    TelemetryEvent,
-    validateEvent
+    validateEventAsync
 } from '@/lib/governance';
+import type { EventDescriptor, TelemetryEvent } from '@/lib/governance';
 
 export enum LogLevel {
     DEBUG = 0,
@@ -22,7 +21,8 @@ export enum LogLevel {
 }
 
 // Re-export SDK types for consumers
-export { GovernanceScope, TelemetryPrefix, EventDescriptor };
+export { GovernanceScope, TelemetryPrefix };
+export type { EventDescriptor };
 
 interface LogContext {
     userId?: string;
@@ -62,10 +62,15 @@ class Logger {
     private log(level: LogLevel, message: string, ctx: LogContext = {}, error?: Error, telemetry?: TelemetryEvent): void {
         if (level < this.minLevel) return;
 
-        // Governance Validation on Telemetry
-        if (telemetry && !validateEvent(telemetry)) {
-            console.warn(`[GOVERNANCE VIOLATION] Invalid telemetry event: ${JSON.stringify(telemetry)}`);
-            // We still log, but flag it locally
+        // Governance Validation on Telemetry: lazy areas (SUPPLY, BILLING) fail closed until
+        // their table has loaded, so wait for it rather than flag a valid first event
+        if (telemetry) {
+            validateEventAsync(telemetry).then((valid) => {
+                if (!valid) {
+                    console.warn(`[GOVERNANCE VIOLATION] Invalid telemetry event: ${JSON.stringify(telemetry)}`);
+                    // We still log, but flag it locally
+                }
+            }, (err) => console.warn('[GOVERNANCE] Could not load the area table to validate telemetry:', err));
         }
 
         const entry: LogEntry = {